@@ -1,26 +1,37 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, BackgroundTasks, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
+import asyncio
 import logging
+import time
+import threading
 import secrets
 import string
 import jwt
 import bcrypt
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, ValidationError
 from typing import List, Optional
 import uuid
 from datetime import datetime, timezone, timedelta
 import shutil
+from functools import lru_cache
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import httpx
 import json
+import heapq
+import re
 import base64
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email import policy as email_policy
+from email.message import EmailMessage
 
 # Anthropic (optional — enables AI-powered persona matching)
 try:
@@ -36,7 +47,9 @@ try:
     from google_auth_oauthlib.flow import Flow
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request as GoogleRequest
-    from googleapiclient.discovery import build as google_build
+    from googleapiclient.discovery import build_from_document
+    from googleapiclient.discovery_cache import get_static_doc
+    from googleapiclient.errors import HttpError
     GMAIL_AVAILABLE = True
 except ImportError:
     GMAIL_AVAILABLE = False
@@ -233,6 +246,10 @@ class InvestorIdentityBase(BaseModel):
 class InvestorIdentityCreate(InvestorIdentityBase):
     pass
 
+class InvestorIdentityBulkCreate(BaseModel):
+    # Rows are validated one by one so a single bad CSV row doesn't reject the whole import
+    items: List[dict]
+
 class InvestorIdentityUpdate(BaseModel):
     investor_name: Optional[str] = None
     title: Optional[str] = None
@@ -750,6 +767,42 @@ async def require_admin(user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=403, detail="Admin access required")
     return user
 
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat()
+
+# Process-local read caches for rarely-changing per-fund data: key -> (expires_at, value)
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 1024
+_PERSONA_CACHE: dict = {}
+_EMAIL_TEMPLATE_CACHE: dict = {}
+_INVESTOR_EMAIL_MAP_CACHE: dict = {}
+_GMAIL_APP_CREDS_CACHE: dict = {}
+_DASHBOARD_CACHE: dict = {}
+
+def cache_get(cache: dict, key):
+    """Return a cached value, or None if missing or expired"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        cache.pop(key, None)
+        return None
+    return entry[1]
+
+def cache_set(cache: dict, key, value):
+    """Store a value for CACHE_TTL_SECONDS"""
+    if len(cache) >= CACHE_MAX_ENTRIES:
+        cache.clear()
+    cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+
+# ============== SYSTEM ROUTES ==============
+
+@api_router.get("/health")
+async def health_check():
+    """Liveness probe; doesn't touch the database."""
+    return {"status": "ok"}
+
 # ============== AUTH ROUTES ==============
 
 @api_router.post("/auth/login", response_model=LoginResponse)
@@ -1170,6 +1223,9 @@ async def get_duplicate_investors(admin: dict = Depends(require_admin)):
         "duplicates": duplicates
     }
 
+# Collections holding per-investor data, removed together with the investor
+INVESTOR_RELATED_COLLECTIONS = ("evidence_entries", "investor_notes", "investor_pipeline", "call_logs", "user_tasks")
+
 class MergeInvestorsRequest(BaseModel):
     keep_investor_id: str
     delete_investor_ids: List[str]
@@ -1186,10 +1242,12 @@ async def merge_investors(merge_data: MergeInvestorsRequest, admin: dict = Depen
         raise HTTPException(status_code=404, detail="Investor to keep not found")
     
     # Verify all delete investors exist
+    affected_fund_ids = {keep_investor.get("fund_id")}
     for del_id in delete_ids:
         del_investor = await db.investor_profiles.find_one({"id": del_id}, {"_id": 0})
         if not del_investor:
             raise HTTPException(status_code=404, detail=f"Investor to delete ({del_id}) not found")
+        affected_fund_ids.add(del_investor.get("fund_id"))
     
     # Reassign related data from deleted investors to kept investor
     reassigned = {
@@ -1236,6 +1294,9 @@ async def merge_investors(merge_data: MergeInvestorsRequest, admin: dict = Depen
         # Delete the duplicate investor profile
         await db.investor_profiles.delete_one({"id": del_id})
     
+    for fund_id in affected_fund_ids:
+        _INVESTOR_EMAIL_MAP_CACHE.pop(fund_id, None)
+    
     return {
         "message": f"Successfully merged {len(delete_ids)} duplicate investors into '{keep_investor.get('investor_name')}'",
         "kept_investor_id": keep_id,
@@ -1251,38 +1312,49 @@ async def admin_delete_investor(investor_id: str, admin: dict = Depends(require_
     if not investor:
         raise HTTPException(status_code=404, detail="Investor not found")
     
-    deleted = {
-        "evidence_entries": 0,
-        "investor_notes": 0,
-        "investor_pipeline": 0,
-        "call_logs": 0,
-        "user_tasks": 0
-    }
-    
     # Delete related data
-    result = await db.evidence_entries.delete_many({"investor_id": investor_id})
-    deleted["evidence_entries"] = result.deleted_count
-    
-    result = await db.investor_notes.delete_many({"investor_id": investor_id})
-    deleted["investor_notes"] = result.deleted_count
-    
-    result = await db.investor_pipeline.delete_many({"investor_id": investor_id})
-    deleted["investor_pipeline"] = result.deleted_count
-    
-    result = await db.call_logs.delete_many({"investor_id": investor_id})
-    deleted["call_logs"] = result.deleted_count
-    
-    result = await db.user_tasks.delete_many({"investor_id": investor_id})
-    deleted["user_tasks"] = result.deleted_count
+    deleted = {}
+    for name in INVESTOR_RELATED_COLLECTIONS:
+        result = await db[name].delete_many({"investor_id": investor_id})
+        deleted[name] = result.deleted_count
     
     # Delete the investor
     await db.investor_profiles.delete_one({"id": investor_id})
+    _INVESTOR_EMAIL_MAP_CACHE.pop(investor.get("fund_id"), None)
     
     return {
         "message": f"Successfully deleted investor '{investor.get('investor_name')}' and all related data",
         "deleted_data": deleted
     }
 
+class AdminBulkDeleteInvestorsRequest(BaseModel):
+    ids: List[str]
+
+@api_router.post("/admin/investors/bulk-delete")
+async def admin_bulk_delete_investors(delete_data: AdminBulkDeleteInvestorsRequest, admin: dict = Depends(require_admin)):
+    """Delete several investors and all related data in one request (admin only).
+    Ids that don't match an investor are reported back as skipped."""
+    profiles = await db.investor_profiles.find(
+        {"id": {"$in": delete_data.ids}}, {"_id": 0, "id": 1, "fund_id": 1}
+    ).to_list(None)
+    found_ids = [p["id"] for p in profiles]
+    
+    deleted = {name: 0 for name in INVESTOR_RELATED_COLLECTIONS}
+    if found_ids:
+        for name in INVESTOR_RELATED_COLLECTIONS:
+            result = await db[name].delete_many({"investor_id": {"$in": found_ids}})
+            deleted[name] = result.deleted_count
+        await db.investor_profiles.delete_many({"id": {"$in": found_ids}})
+        for fund_id in {p.get("fund_id") for p in profiles}:
+            _INVESTOR_EMAIL_MAP_CACHE.pop(fund_id, None)
+    
+    found_set = set(found_ids)
+    return {
+        "deleted": len(found_ids),
+        "deleted_data": deleted,
+        "skipped": [i for i in delete_data.ids if i not in found_set]
+    }
+
 # ============== INVESTOR FUND ASSIGNMENT ROUTES (ADMIN ONLY) ==============
 
 @api_router.get("/investors/{investor_id}/assignments")
@@ -2062,7 +2134,11 @@ async def get_investor_profile(profile_id: str, user: dict = Depends(get_current
     return InvestorIdentity(**profile)
 
 @api_router.post("/investor-profiles", response_model=InvestorIdentity)
-async def create_investor_profile(profile_data: InvestorIdentityCreate, user: dict = Depends(get_current_user)):
+async def create_investor_profile(
+    profile_data: InvestorIdentityCreate,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user),
+):
     """Create a new investor profile (Fund Manager can create for assigned funds)"""
     # Check if user has access to this fund
     if user.get("role") != "ADMIN":
@@ -2086,10 +2162,103 @@ async def create_investor_profile(profile_data: InvestorIdentityCreate, user: di
         created_by=user.get("id")
     )
     await db.investor_profiles.insert_one(profile.model_dump())
+    _INVESTOR_EMAIL_MAP_CACHE.pop(profile.fund_id, None)
+    background_tasks.add_task(_refresh_persona_matches, profile.fund_id, [profile.id])
     return profile
 
+INVESTOR_BULK_MAX = 1000
+
+@api_router.post("/investor-profiles/bulk")
+async def bulk_create_investor_profiles(
+    data: InvestorIdentityBulkCreate,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user),
+):
+    """Create many investor profiles in one request (CSV import).
+    Rows failing validation, fund access or the duplicate-name check are skipped and reported."""
+    if len(data.items) > INVESTOR_BULK_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {INVESTOR_BULK_MAX} investors per request")
+    
+    skipped = []
+    rows = []
+    for index, item in enumerate(data.items):
+        try:
+            rows.append((index, InvestorIdentityCreate.model_validate(item)))
+        except ValidationError as e:
+            skipped.append({"index": index, "investor_name": item.get("investor_name"), "detail": e.errors()[0]["msg"]})
+    
+    if user.get("role") != "ADMIN":
+        assigned = set(user.get("assigned_funds", []))
+        for index, row in rows:
+            if row.fund_id not in assigned:
+                skipped.append({"index": index, "investor_name": row.investor_name, "detail": "You don't have access to this fund"})
+        rows = [(index, row) for index, row in rows if row.fund_id in assigned]
+    
+    # One query for every name already taken in the target funds (same case-insensitive match as single create)
+    taken = set()
+    if rows:
+        existing = await db.investor_profiles.find({
+            "fund_id": {"$in": list({row.fund_id for _, row in rows})},
+            "investor_name": {"$in": [re.compile(f"^{re.escape(row.investor_name)}$", re.IGNORECASE) for _, row in rows]},
+        }, {"_id": 0, "fund_id": 1, "investor_name": 1}).to_list(None)
+        taken = {(e["fund_id"], e["investor_name"].lower()) for e in existing}
+    
+    profiles = []
+    for index, row in rows:
+        key = (row.fund_id, row.investor_name.lower())
+        if key in taken:
+            skipped.append({
+                "index": index,
+                "investor_name": row.investor_name,
+                "detail": f"An investor named '{row.investor_name}' already exists in this fund.",
+            })
+            continue
+        taken.add(key)  # also rejects repeats within the same upload
+        profiles.append(InvestorIdentity(**row.model_dump(), created_by=user.get("id")))
+    
+    if profiles:
+        await db.investor_profiles.insert_many([p.model_dump() for p in profiles])
+        ids_by_fund = defaultdict(list)
+        for p in profiles:
+            ids_by_fund[p.fund_id].append(p.id)
+        for fund_id, investor_ids in ids_by_fund.items():
+            _INVESTOR_EMAIL_MAP_CACHE.pop(fund_id, None)
+            background_tasks.add_task(_refresh_persona_matches, fund_id, investor_ids)
+    
+    skipped.sort(key=lambda s: s["index"])
+    return {"created": len(profiles), "investors": profiles, "skipped": skipped}
+
+@api_router.delete("/investor-profiles/bulk")
+async def bulk_delete_investor_profiles(ids: str, user: dict = Depends(get_current_user)):
+    """Delete several investor profiles in one request; ids is a comma-separated list.
+    Profiles that don't exist or belong to funds the user can't access are skipped."""
+    requested = [i for i in ids.split(",") if i]
+    profiles = await db.investor_profiles.find(
+        {"id": {"$in": requested}}, {"_id": 0, "id": 1, "fund_id": 1}
+    ).to_list(None)
+    
+    if user.get("role") != "ADMIN":
+        assigned = set(user.get("assigned_funds", []))
+        profiles = [p for p in profiles if p.get("fund_id") in assigned]
+    
+    deleted_ids = [p["id"] for p in profiles]
+    deleted = 0
+    if deleted_ids:
+        result = await db.investor_profiles.delete_many({"id": {"$in": deleted_ids}})
+        deleted = result.deleted_count
+        for fund_id in {p.get("fund_id") for p in profiles}:
+            _INVESTOR_EMAIL_MAP_CACHE.pop(fund_id, None)
+    
+    deleted_set = set(deleted_ids)
+    return {"deleted": deleted, "skipped": [i for i in requested if i not in deleted_set]}
+
 @api_router.put("/investor-profiles/{profile_id}", response_model=InvestorIdentity)
-async def update_investor_profile(profile_id: str, profile_data: InvestorIdentityUpdate, user: dict = Depends(get_current_user)):
+async def update_investor_profile(
+    profile_id: str,
+    profile_data: InvestorIdentityUpdate,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user),
+):
     """Update an investor profile (Fund Manager can update for assigned funds)"""
     profile = await db.investor_profiles.find_one({"id": profile_id}, {"_id": 0})
     if not profile:
@@ -2103,7 +2272,14 @@ async def update_investor_profile(profile_id: str, profile_data: InvestorIdentit
     update_dict = {k: v for k, v in profile_data.model_dump().items() if v is not None}
     update_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
     
-    await db.investor_profiles.update_one({"id": profile_id}, {"$set": update_dict})
+    await db.investor_profiles.update_one(
+        {"id": profile_id}, {"$set": update_dict, "$unset": PERSONA_MATCH_UNSET}
+    )
+    _INVESTOR_EMAIL_MAP_CACHE.pop(profile.get("fund_id"), None)
+    _INVESTOR_EMAIL_MAP_CACHE.pop(update_dict.get("fund_id"), None)
+    background_tasks.add_task(
+        _refresh_persona_matches, update_dict.get("fund_id") or profile.get("fund_id"), [profile_id]
+    )
     
     updated = await db.investor_profiles.find_one({"id": profile_id}, {"_id": 0})
     return InvestorIdentity(**updated)
@@ -2121,6 +2297,7 @@ async def delete_investor_profile(profile_id: str, user: dict = Depends(get_curr
             raise HTTPException(status_code=403, detail="You don't have access to this investor")
     
     await db.investor_profiles.delete_one({"id": profile_id})
+    _INVESTOR_EMAIL_MAP_CACHE.pop(profile.get("fund_id"), None)
     return {"message": "Investor profile deleted successfully"}
 
 @api_router.get("/my-funds")
@@ -2264,9 +2441,52 @@ async def create_office(office_data: OfficeBase, admin: dict = Depends(require_a
 
 # ============== DASHBOARD STATS ==============
 
+async def _cached_dashboard_section(key: str, compute, response: Response):
+    """Serve a dashboard aggregate from _DASHBOARD_CACHE, recomputing at most once per CACHE_TTL_SECONDS.
+    The X-Cache header tells clients (and the tests) whether the cached copy was used."""
+    data = cache_get(_DASHBOARD_CACHE, key)
+    response.headers["X-Cache"] = "MISS" if data is None else "HIT"
+    if data is None:
+        data = await compute()
+        cache_set(_DASHBOARD_CACHE, key, data)
+    return data
+
 @api_router.get("/dashboard/stats")
-async def get_dashboard_stats(user: dict = Depends(get_current_user)):
+async def get_dashboard_stats(response: Response, user: dict = Depends(get_current_user)):
     """Get dashboard statistics including capital metrics aggregated from all funds"""
+    return await _cached_dashboard_section("stats", _compute_dashboard_stats, response)
+
+async def _load_fund_pipelines():
+    """Load every fund with its investor profiles, pipeline entries and stages in four queries
+    (instead of three per fund). Profiles are keyed by id; only the fields the dashboards use are read."""
+    all_funds = await db.funds.find({}, {"_id": 0}).to_list(100)
+    fund_ids = [f["id"] for f in all_funds if f.get("id")]
+    profiles, pipeline_entries, stages = await asyncio.gather(
+        db.investor_profiles.find(
+            {"fund_id": {"$in": fund_ids}},
+            {"_id": 0, "id": 1, "fund_id": 1, "investment_size": 1, "expected_ticket_amount": 1}
+        ).to_list(None),
+        db.investor_pipeline.find(
+            {"fund_id": {"$in": fund_ids}},
+            {"_id": 0, "fund_id": 1, "investor_id": 1, "stage_id": 1, "stage_entered_at": 1}
+        ).to_list(None),
+        db.pipeline_stages.find({"fund_id": {"$in": fund_ids}}, {"_id": 0, "id": 1, "fund_id": 1, "name": 1}).to_list(None),
+    )
+    
+    profiles_by_fund = defaultdict(dict)
+    for p in profiles:
+        profiles_by_fund[p["fund_id"]][p["id"]] = p
+    entries_by_fund = defaultdict(list)
+    for entry in pipeline_entries:
+        entries_by_fund[entry["fund_id"]].append(entry)
+    stages_by_fund = defaultdict(list)
+    for stage in stages:
+        stages_by_fund[stage["fund_id"]].append(stage)
+    return all_funds, profiles_by_fund, entries_by_fund, stages_by_fund
+
+async def _compute_dashboard_stats(fund_pipelines=None):
+    """Count users, funds and investors and aggregate capital metrics across all funds.
+    fund_pipelines is a preloaded _load_fund_pipelines() result, when the caller already has one."""
     
     # Basic counts
     users_count = await db.users.count_documents({})
@@ -2286,8 +2506,7 @@ async def get_dashboard_stats(user: dict = Depends(get_current_user)):
     total_potential_capital = 0.0
     capital_in_final_stages = 0.0
     
-    # Get all funds
-    all_funds = await db.funds.find({}, {"_id": 0}).to_list(100)
+    all_funds, profiles_by_fund, entries_by_fund, stages_by_fund = fund_pipelines or await _load_fund_pipelines()
     
     # Stage name classifications
     deployed_stage_names = ["Money Transfer", "Transfer Date"]
@@ -2299,16 +2518,9 @@ async def get_dashboard_stats(user: dict = Depends(get_current_user)):
         if not fund_id:
             continue
         
-        # Get all investor profiles for this fund
-        profiles = await db.investor_profiles.find({"fund_id": fund_id}, {"_id": 0}).to_list(1000)
-        profiles_map = {p["id"]: p for p in profiles}
-        
-        # Get pipeline entries for this fund (this is the correct collection!)
-        pipeline_entries = await db.investor_pipeline.find({"fund_id": fund_id}, {"_id": 0}).to_list(1000)
-        
-        # Get pipeline stages for this fund
-        stages = await db.pipeline_stages.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
-        stages_map = {s["id"]: s for s in stages}
+        profiles_map = profiles_by_fund[fund_id]
+        pipeline_entries = entries_by_fund[fund_id]  # investor_pipeline is the correct collection!
+        stages = stages_by_fund[fund_id]
         
         # Categorize stage IDs by type
         deployed_stage_ids = set()
@@ -2385,11 +2597,32 @@ async def get_dashboard_stats(user: dict = Depends(get_current_user)):
 
 
 @api_router.get("/dashboard/fund-performance")
-async def get_fund_performance(user: dict = Depends(get_current_user)):
-    """Get detailed fund performance snapshot for the admin dashboard"""
+async def get_fund_performance(
+    response: Response,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    user: dict = Depends(get_current_user),
+):
+    """Get detailed fund performance snapshot for the admin dashboard.
+    Pass limit (and offset) to page through the funds; next_offset is None on the last page."""
+    data = await _cached_dashboard_section("fund-performance", _compute_fund_performance, response)
+    if limit is None:
+        return data
+    limit = max(1, min(limit, 200))
+    offset = max(0, offset)
+    funds = data["funds"]
+    end = offset + limit
+    return {
+        **data,
+        "funds": funds[offset:end],
+        "total": len(funds),
+        "next_offset": end if end < len(funds) else None,
+    }
+
+async def _compute_fund_performance(fund_pipelines=None):
+    """Build the per-fund performance snapshot (fund_pipelines as for _compute_dashboard_stats)"""
     
-    # Get all funds
-    all_funds = await db.funds.find({}, {"_id": 0}).to_list(100)
+    all_funds, profiles_by_fund, entries_by_fund, stages_by_fund = fund_pipelines or await _load_fund_pipelines()
     
     # Stage name classifications
     deployed_stage_names = ["Money Transfer", "Transfer Date"]
@@ -2406,16 +2639,9 @@ async def get_fund_performance(user: dict = Depends(get_current_user)):
         fund_name = fund.get("name", "Unknown Fund")
         target_capital = fund.get("target_raise") or 0
         
-        # Get all investor profiles for this fund
-        profiles = await db.investor_profiles.find({"fund_id": fund_id}, {"_id": 0}).to_list(1000)
-        profiles_map = {p["id"]: p for p in profiles}
-        
-        # Get pipeline entries for this fund
-        pipeline_entries = await db.investor_pipeline.find({"fund_id": fund_id}, {"_id": 0}).to_list(1000)
-        
-        # Get pipeline stages for this fund
-        stages = await db.pipeline_stages.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
-        stages_map = {s["id"]: s for s in stages}
+        profiles_map = profiles_by_fund[fund_id]
+        pipeline_entries = entries_by_fund[fund_id]
+        stages = stages_by_fund[fund_id]
         
         # Categorize stage IDs by type
         deployed_stage_ids = set()
@@ -2563,6 +2789,23 @@ async def get_fund_performance(user: dict = Depends(get_current_user)):
     }
 
 
+@api_router.get("/dashboard/overview")
+async def get_dashboard_overview(response: Response, user: dict = Depends(get_current_user)):
+    """Dashboard stats and fund performance in one request; both are built from a single fund scan"""
+    stats = cache_get(_DASHBOARD_CACHE, "stats")
+    fund_performance = cache_get(_DASHBOARD_CACHE, "fund-performance")
+    response.headers["X-Cache"] = "HIT" if stats is not None and fund_performance is not None else "MISS"
+    if stats is None or fund_performance is None:
+        fund_pipelines = await _load_fund_pipelines()
+        if stats is None:
+            stats = await _compute_dashboard_stats(fund_pipelines)
+            cache_set(_DASHBOARD_CACHE, "stats", stats)
+        if fund_performance is None:
+            fund_performance = await _compute_fund_performance(fund_pipelines)
+            cache_set(_DASHBOARD_CACHE, "fund-performance", fund_performance)
+    return {"stats": stats, "fund_performance": fund_performance}
+
+
 @api_router.get("/dashboard/investor-intelligence")
 async def get_investor_intelligence(user: dict = Depends(get_current_user)):
     """Get aggregated investor intelligence insights for admin dashboard"""
@@ -4489,7 +4732,10 @@ async def create_research_capture(data: ResearchCaptureCreate, user: dict = Depe
         captured_by_name=f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
     )
     
-    await db.research_captures.insert_one(capture.model_dump())
+    try:
+        await db.research_captures.insert_one(capture.model_dump())
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="You have already captured this LinkedIn profile for this fund")
     
     return {**capture.model_dump(), "fund_name": fund.get("name")}
 
@@ -4573,7 +4819,10 @@ async def update_research_capture(capture_id: str, data: ResearchCaptureUpdate,
     update_data = {k: v for k, v in data.model_dump().items() if v is not None}
     update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
     
-    await db.research_captures.update_one({"id": capture_id}, {"$set": update_data})
+    try:
+        await db.research_captures.update_one({"id": capture_id}, {"$set": update_data})
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Another capture in this fund already has that LinkedIn URL")
     
     updated = await db.research_captures.find_one({"id": capture_id}, {"_id": 0})
     return updated
@@ -4582,6 +4831,7 @@ async def update_research_capture(capture_id: str, data: ResearchCaptureUpdate,
 async def accept_research_capture(
     capture_id: str, 
     fund_id: str,  # Fund to create the investor in
+    background_tasks: BackgroundTasks,
     user: dict = Depends(get_current_user)
 ):
     """
@@ -4658,6 +4908,8 @@ async def accept_research_capture(
     }
     
     await db.investor_profiles.insert_one(investor_profile)
+    _INVESTOR_EMAIL_MAP_CACHE.pop(fund_id, None)
+    background_tasks.add_task(_refresh_persona_matches, fund_id, [investor_id])
     
     # Create fund assignment for the selected fund
     assignment = {
@@ -4922,7 +5174,15 @@ async def import_external_capture(
                 captured_by_name=ec.get("captured_by") or "Chrome Extension"
             )
             
-            await db.research_captures.insert_one(capture.model_dump())
+            try:
+                await db.research_captures.insert_one(capture.model_dump())
+            except DuplicateKeyError:
+                # Same person already captured by this user for this fund under another id
+                existing = await db.research_captures.find_one(
+                    {"captured_by_user_id": user["id"], "fund_id": fund_id, "linkedin_url": capture.linkedin_url},
+                    {"_id": 0}
+                )
+                return {"message": "Already imported", "capture": existing}
             
             return {
                 "message": "Capture imported successfully",
@@ -5013,7 +5273,12 @@ async def sync_external_captures(
                             status="pending"  # Mark as pending for review
                         )
                         
-                        await db.research_captures.insert_one(capture.model_dump())
+                        try:
+                            await db.research_captures.insert_one(capture.model_dump())
+                        except DuplicateKeyError:
+                            # Same person already captured for this fund under another external id
+                            skipped_count += 1
+                            continue
                         imported_count += 1
             except Exception as e:
                 errors.append(f"Captures sync error: {str(e)}")
@@ -5061,7 +5326,12 @@ async def sync_external_captures(
                             status="pending"  # Mark as pending for review (even verified entries need local approval)
                         )
                         
-                        await db.research_captures.insert_one(capture.model_dump())
+                        try:
+                            await db.research_captures.insert_one(capture.model_dump())
+                        except DuplicateKeyError:
+                            # Same person already captured for this fund under another external id
+                            skipped_count += 1
+                            continue
                         imported_count += 1
             except Exception as e:
                 errors.append(f"Investors sync error: {str(e)}")
@@ -5174,8 +5444,27 @@ async def extension_capture_person(
         captured_by_name=full_name,
         status="pending"
     )
-    await db.research_captures.insert_one(capture.model_dump())
-    return {"success": True, "id": capture.id, "action": "created"}
+    doc = capture.model_dump()
+    if not capture.linkedin_url:
+        await db.research_captures.insert_one(doc)
+        return {"success": True, "id": capture.id, "action": "created"}
+
+    # Re-uploads of the same profile by the same user refresh the existing
+    # capture instead of piling up duplicates.
+    last_seen = {
+        "source_url": doc.pop("source_url"),
+        "source_page_title": doc.pop("source_page_title"),
+        "updated_at": doc.pop("updated_at"),
+    }
+    saved = await db.research_captures.find_one_and_update(
+        {"captured_by_user_id": user["id"], "fund_id": None, "linkedin_url": capture.linkedin_url},
+        {"$setOnInsert": doc, "$set": last_seen},
+        projection={"_id": 0, "id": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    action = "created" if saved["id"] == capture.id else "updated"
+    return {"success": True, "id": saved["id"], "action": action}
 
 
 @api_router.get("/v1/people/{person_id}/recommendations")
@@ -5196,56 +5485,97 @@ async def get_person_next_steps(person_id: str, user: dict = Depends(get_current
 
 # ============== INVESTOR PERSONA HELPERS ==============
 
-def _score_rule_based(investor: dict, persona: dict) -> dict:
-    """Score investor vs persona using weighted field matching. Returns {score, matched_fields, unmatched_fields}."""
-    total_w = 0
+GCC_NATIONALITIES = frozenset({"saudi arabia", "uae", "united arab emirates", "qatar", "bahrain", "oman", "kuwait"})
+
+
+# Investor fields read by rule-based scoring, plus the extra context sent to Claude.
+PERSONA_SCORING_PROJECTION = {
+    "_id": 0, "id": 1, "fund_id": 1, "investor_name": 1,
+    "investor_type": 1, "nationality": 1, "sector": 1, "gender": 1, "age": 1,
+}
+PERSONA_AI_PROJECTION = {
+    **PERSONA_SCORING_PROJECTION,
+    "country": 1, "wealth": 1, "job_title": 1, "description": 1, "typical_ticket_size": 1,
+}
+
+
+def _persona_rule_targets(persona: dict) -> dict:
+    """Lower-case a persona's targets once so scoring many investors against it is plain comparisons."""
+    nationalities = {n.lower() for n in persona.get("target_nationalities") or []}
+    if "gcc" in nationalities:
+        nationalities |= GCC_NATIONALITIES
+    gender = (persona.get("target_gender") or "").lower()
+    targets = {
+        "investor_type": (persona.get("target_investor_type") or "").lower(),
+        "nationalities": nationalities,
+        "sectors": [s.lower() for s in persona.get("target_sectors") or []],
+        "gender": "" if gender == "diverse" else gender,
+        "age_min": persona.get("target_age_min"),
+    }
+    targets["total_w"] = (
+        (35 if targets["investor_type"] else 0)
+        + (25 if targets["nationalities"] else 0)
+        + (20 if targets["sectors"] else 0)
+        + (10 if targets["gender"] else 0)
+        + (10 if targets["age_min"] is not None else 0)
+    )
+    return targets
+
+
+def _score_rule_targets(investor: dict, targets: dict, threshold: int = 0) -> dict:
+    """Score investor against targets prepared by _persona_rule_targets.
+    With a threshold, scoring stops as soon as the score can no longer reach it and 0 is returned."""
+    total_w = targets["total_w"]
+    remaining_w = total_w
     earned_w = 0
     matched = []
     unmatched = []
 
-    GCC = {"saudi arabia", "uae", "united arab emirates", "qatar", "bahrain", "oman", "kuwait"}
+    def out_of_reach():
+        return threshold > 0 and round((earned_w + remaining_w) / total_w * 100) < threshold
 
-    if persona.get("target_investor_type"):
-        total_w += 35
-        if (investor.get("investor_type") or "").lower() == persona["target_investor_type"].lower():
+    if targets["investor_type"]:
+        remaining_w -= 35
+        if (investor.get("investor_type") or "").lower() == targets["investor_type"]:
             earned_w += 35
             matched.append("Investor type")
         else:
             unmatched.append("Investor type")
+            if out_of_reach():
+                return {"score": 0, "matched_fields": matched, "unmatched_fields": unmatched}
 
-    if persona.get("target_nationalities"):
-        total_w += 25
-        inv_nat = (investor.get("nationality") or "").lower()
-        targets = [n.lower() for n in persona["target_nationalities"]]
-        hit = inv_nat in targets or ("gcc" in targets and inv_nat in GCC)
-        if hit:
+    if targets["nationalities"]:
+        remaining_w -= 25
+        if (investor.get("nationality") or "").lower() in targets["nationalities"]:
             earned_w += 25
             matched.append("Nationality")
         else:
             unmatched.append("Nationality")
+            if out_of_reach():
+                return {"score": 0, "matched_fields": matched, "unmatched_fields": unmatched}
 
-    if persona.get("target_sectors"):
-        total_w += 20
+    if targets["sectors"]:
+        remaining_w -= 20
         inv_s = (investor.get("sector") or "").lower()
-        targets = [s.lower() for s in persona["target_sectors"]]
-        if any(t and (t in inv_s or inv_s in t) for t in targets):
+        if any(t and (t in inv_s or inv_s in t) for t in targets["sectors"]):
             earned_w += 20
             matched.append("Sector")
         else:
             unmatched.append("Sector")
+            if out_of_reach():
+                return {"score": 0, "matched_fields": matched, "unmatched_fields": unmatched}
 
-    if persona.get("target_gender") and persona["target_gender"].lower() != "diverse":
-        total_w += 10
-        if (investor.get("gender") or "").lower() == persona["target_gender"].lower():
+    if targets["gender"]:
+        remaining_w -= 10
+        if (investor.get("gender") or "").lower() == targets["gender"]:
             earned_w += 10
             matched.append("Gender")
         else:
             unmatched.append("Gender")
 
-    if persona.get("target_age_min") is not None:
-        total_w += 10
+    if targets["age_min"] is not None:
         inv_age = investor.get("age")
-        if inv_age is not None and inv_age >= persona["target_age_min"]:
+        if inv_age is not None and inv_age >= targets["age_min"]:
             earned_w += 10
             matched.append("Age group")
         else:
@@ -5255,6 +5585,68 @@ def _score_rule_based(investor: dict, persona: dict) -> dict:
     return {"score": score, "matched_fields": matched, "unmatched_fields": unmatched}
 
 
+def _score_rule_based(investor: dict, persona: dict) -> dict:
+    """Score investor vs persona using weighted field matching. Returns {score, matched_fields, unmatched_fields}."""
+    return _score_rule_targets(investor, _persona_rule_targets(persona))
+
+
+# Stored on investor_profiles so analytics can aggregate instead of re-scoring.
+# Writes unset them and schedule _refresh_persona_matches; a missing score means that run is pending.
+PERSONA_MATCH_UNSET = {"persona_match_id": "", "persona_match_score": ""}
+
+
+def _top_persona_match(investor: dict, persona_targets: list, threshold: int = 0) -> tuple:
+    """Best (persona_id, score) for an investor given [(persona_id, targets)]; (None, 0) if no personas.
+    Scores below threshold are reported as 0."""
+    if not persona_targets:
+        return None, 0
+    return max(
+        ((pid, _score_rule_targets(investor, t, threshold)["score"]) for pid, t in persona_targets),
+        key=lambda x: x[1],
+    )
+
+
+# One re-score at a time per fund, so the run scheduled by the latest write finishes last
+_PERSONA_MATCH_LOCKS: dict = defaultdict(asyncio.Lock)
+
+
+async def _refresh_persona_matches(fund_id: str, investor_ids: Optional[list] = None):
+    """Score a fund's investors (or just investor_ids) against its current personas and store the top match.
+    Scheduled as a BackgroundTask by the writes that change personas or profiles, so analytics only aggregates."""
+    async with _PERSONA_MATCH_LOCKS[fund_id]:
+        # Read the personas fresh rather than through _PERSONA_CACHE; this run exists because they changed
+        personas = await db.investor_personas.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
+        targets = [(p["id"], _persona_rule_targets(p)) for p in personas]
+        query = {"fund_id": fund_id}
+        if investor_ids is not None:
+            query["id"] = {"$in": investor_ids}
+        ops = []
+        cursor = db.investor_profiles.find(query, PERSONA_SCORING_PROJECTION).batch_size(500)
+        async for inv in cursor:
+            # Analytics only distinguishes matches at 50+, so weaker scores needn't be exact
+            pid, score = _top_persona_match(inv, targets, threshold=50)
+            ops.append(UpdateOne(
+                {"id": inv["id"]},
+                {"$set": {"persona_match_id": pid, "persona_match_score": score}},
+            ))
+            if len(ops) >= 500:
+                await db.investor_profiles.bulk_write(ops, ordered=False)
+                ops = []
+        if ops:
+            await db.investor_profiles.bulk_write(ops, ordered=False)
+
+
+async def _backfill_persona_matches():
+    """Startup task: score funds holding investors without a stored match (stored before matches
+    were precomputed, or whose re-score was cut off by a restart)."""
+    try:
+        fund_ids = await db.investor_profiles.distinct("fund_id", {"persona_match_score": {"$exists": False}})
+        for fund_id in fund_ids:
+            await _refresh_persona_matches(fund_id)
+    except Exception as e:
+        logger.error(f"Persona match backfill failed: {e}")
+
+
 async def _score_with_ai(investor: dict, personas: list) -> list:
     """Score investor against all personas using Claude AI. Returns list of match results."""
     if not ANTHROPIC_AVAILABLE or not ANTHROPIC_API_KEY:
@@ -5304,7 +5696,8 @@ async def _score_with_ai(investor: dict, personas: list) -> list:
         f"Return ONLY a valid JSON array, no markdown:\n"
         f'[{{"persona_id":"...","score":85,"reasoning":"...","matched_attributes":[...],"gap_attributes":[...]}}]'
     )
-    msg = client.messages.create(
+    msg = await asyncio.to_thread(
+        client.messages.create,
         model="claude-haiku-4-5-20251001",
         max_tokens=1024,
         messages=[{"role": "user", "content": prompt}],
@@ -5316,17 +5709,62 @@ async def _score_with_ai(investor: dict, personas: list) -> list:
     return json.loads(text)
 
 
+PERSONA_MATCH_JOB_TTL_SECONDS = 3600
+
+
+async def _run_persona_match_job(job_id: str, investor: dict, personas: list):
+    """Background task: score with Claude and store the result on the persona_match_jobs doc."""
+    update = {"completed_at": datetime.now(timezone.utc).isoformat()}
+    try:
+        ai_results = await _score_with_ai(investor, personas)
+        persona_map = {p["id"]: p["name"] for p in personas}
+        matches = [
+            {
+                "persona_id": r["persona_id"],
+                "persona_name": persona_map.get(r["persona_id"], "Unknown"),
+                "score": r.get("score", 0),
+                "reasoning": r.get("reasoning", ""),
+                "matched_fields": r.get("matched_attributes", []),
+                "unmatched_fields": r.get("gap_attributes", []),
+            }
+            for r in ai_results
+        ]
+        update.update({
+            "status": "completed",
+            "method": "ai",
+            "matches": sorted(matches, key=lambda x: x["score"], reverse=True),
+        })
+    except Exception as e:
+        logger.warning(f"AI persona scoring failed for job {job_id}: {e}")
+        update["status"] = "failed"
+    await db.persona_match_jobs.update_one({"id": job_id}, {"$set": update})
+
+
+async def _get_fund_personas(fund_id: str) -> list:
+    """All personas for a fund, served from _PERSONA_CACHE when fresh."""
+    personas = cache_get(_PERSONA_CACHE, fund_id)
+    if personas is None:
+        personas = await db.investor_personas.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
+        cache_set(_PERSONA_CACHE, fund_id, personas)
+    return personas
+
+
 # ============== INVESTOR PERSONA ENDPOINTS ==============
 
-@api_router.get("/funds/{fund_id}/personas")
+@api_router.get("/funds/{fund_id}/personas", response_class=ORJSONResponse)
 async def list_personas(fund_id: str, user: dict = Depends(get_current_user)):
     """List all personas for a fund."""
-    personas = await db.investor_personas.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
+    personas = await _get_fund_personas(fund_id)
     return {"personas": personas}
 
 
 @api_router.post("/funds/{fund_id}/personas")
-async def create_persona(fund_id: str, body: InvestorPersonaCreate, user: dict = Depends(get_current_user)):
+async def create_persona(
+    fund_id: str,
+    body: InvestorPersonaCreate,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user),
+):
     """Create a new investor persona for a fund."""
     persona = InvestorPersona(
         **body.model_dump(),
@@ -5334,6 +5772,9 @@ async def create_persona(fund_id: str, body: InvestorPersonaCreate, user: dict =
         created_by=user["id"],
     )
     await db.investor_personas.insert_one(persona.model_dump())
+    _PERSONA_CACHE.pop(fund_id, None)
+    await db.investor_profiles.update_many({"fund_id": fund_id}, {"$unset": PERSONA_MATCH_UNSET})
+    background_tasks.add_task(_refresh_persona_matches, fund_id)
     return {"success": True, "persona": persona.model_dump()}
 
 
@@ -5342,6 +5783,7 @@ async def update_persona(
     fund_id: str,
     persona_id: str,
     body: InvestorPersonaUpdate,
+    background_tasks: BackgroundTasks,
     user: dict = Depends(get_current_user),
 ):
     """Update an existing persona."""
@@ -5353,55 +5795,48 @@ async def update_persona(
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Persona not found")
+    _PERSONA_CACHE.pop(fund_id, None)
+    await db.investor_profiles.update_many({"fund_id": fund_id}, {"$unset": PERSONA_MATCH_UNSET})
+    background_tasks.add_task(_refresh_persona_matches, fund_id)
     updated = await db.investor_personas.find_one({"id": persona_id}, {"_id": 0})
     return {"success": True, "persona": updated}
 
 
 @api_router.delete("/funds/{fund_id}/personas/{persona_id}")
-async def delete_persona(fund_id: str, persona_id: str, user: dict = Depends(get_current_user)):
+async def delete_persona(
+    fund_id: str,
+    persona_id: str,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user),
+):
     """Delete a persona."""
     result = await db.investor_personas.delete_one({"id": persona_id, "fund_id": fund_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Persona not found")
+    _PERSONA_CACHE.pop(fund_id, None)
+    await db.investor_profiles.update_many({"fund_id": fund_id}, {"$unset": PERSONA_MATCH_UNSET})
+    background_tasks.add_task(_refresh_persona_matches, fund_id)
     return {"success": True}
 
 
-@api_router.post("/funds/{fund_id}/personas/match")
+@api_router.post("/funds/{fund_id}/personas/match", response_class=ORJSONResponse)
 async def match_investor_to_personas(
     fund_id: str,
     body: PersonaMatchRequest,
+    background_tasks: BackgroundTasks,
     user: dict = Depends(get_current_user),
 ):
-    """Score an investor against all fund personas. Uses Claude AI if API key is set, else rule-based."""
-    investor = await db.investor_profiles.find_one({"id": body.investor_id}, {"_id": 0})
+    """Score an investor against all fund personas.
+    Returns rule-based scores immediately. If Claude is configured, AI scoring runs in the
+    background and the response carries a job_id to poll for the AI result."""
+    investor = await db.investor_profiles.find_one({"id": body.investor_id}, PERSONA_AI_PROJECTION)
     if not investor:
         raise HTTPException(status_code=404, detail="Investor not found")
 
-    personas = await db.investor_personas.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
+    personas = await _get_fund_personas(fund_id)
     if not personas:
         return {"matches": [], "method": "none"}
 
-    # Try AI scoring first
-    if ANTHROPIC_AVAILABLE and ANTHROPIC_API_KEY:
-        try:
-            ai_results = await _score_with_ai(investor, personas)
-            persona_map = {p["id"]: p["name"] for p in personas}
-            matches = [
-                {
-                    "persona_id": r["persona_id"],
-                    "persona_name": persona_map.get(r["persona_id"], "Unknown"),
-                    "score": r.get("score", 0),
-                    "reasoning": r.get("reasoning", ""),
-                    "matched_fields": r.get("matched_attributes", []),
-                    "unmatched_fields": r.get("gap_attributes", []),
-                }
-                for r in ai_results
-            ]
-            return {"matches": sorted(matches, key=lambda x: x["score"], reverse=True), "method": "ai"}
-        except Exception:
-            pass  # Fall through to rule-based
-
-    # Rule-based fallback
     matches = []
     for persona in personas:
         result = _score_rule_based(investor, persona)
@@ -5413,25 +5848,50 @@ async def match_investor_to_personas(
             "matched_fields": result["matched_fields"],
             "unmatched_fields": result["unmatched_fields"],
         })
-    return {"matches": sorted(matches, key=lambda x: x["score"], reverse=True), "method": "rule_based"}
+    response = {"matches": sorted(matches, key=lambda x: x["score"], reverse=True), "method": "rule_based"}
+
+    if ANTHROPIC_AVAILABLE and ANTHROPIC_API_KEY:
+        job_id = str(uuid.uuid4())
+        await db.persona_match_jobs.insert_one({
+            "id": job_id,
+            "fund_id": fund_id,
+            "investor_id": body.investor_id,
+            "user_id": user["id"],
+            "status": "pending",
+            # A BSON date, not an ISO string: the TTL index on it ignores strings
+            "created_at": datetime.now(timezone.utc),
+        })
+        background_tasks.add_task(_run_persona_match_job, job_id, investor, personas)
+        response["job_id"] = job_id
+    return response
 
 
-@api_router.post("/funds/{fund_id}/personas/suggest")
+@api_router.get("/funds/{fund_id}/personas/match/{job_id}", response_class=ORJSONResponse)
+async def get_persona_match_job(fund_id: str, job_id: str, user: dict = Depends(get_current_user)):
+    """Poll a background AI persona match. status is pending, completed or failed."""
+    job = await db.persona_match_jobs.find_one({"id": job_id, "fund_id": fund_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Match job not found")
+    return job
+
+
+@api_router.post("/funds/{fund_id}/personas/suggest", response_class=ORJSONResponse)
 async def suggest_personas(fund_id: str, user: dict = Depends(get_current_user)):
     """Suggest new personas based on investors not well matched to existing personas."""
-    personas = await db.investor_personas.find({"fund_id": fund_id}, {"_id": 0}).to_list(100)
-    investors = await db.investor_profiles.find({"fund_id": fund_id}, {"_id": 0}).to_list(500)
+    personas = await _get_fund_personas(fund_id)
+    investors = await db.investor_profiles.find({"fund_id": fund_id}, PERSONA_AI_PROJECTION).to_list(500)
 
     if not investors:
         return {"suggestions": []}
 
     # Find investors with low match to any existing persona
+    persona_targets = [_persona_rule_targets(p) for p in personas]
     unmatched_investors = []
     for investor in investors:
         if not personas:
             unmatched_investors.append(investor)
             continue
-        scores = [_score_rule_based(investor, p)["score"] for p in personas]
+        scores = [_score_rule_targets(investor, t, threshold=50)["score"] for t in persona_targets]
         if max(scores) < 50:
             unmatched_investors.append(investor)
 
@@ -5480,7 +5940,6 @@ async def suggest_personas(fund_id: str, user: dict = Depends(get_current_user))
             pass
 
     # Rule-based fallback: cluster by (investor_type, nationality)
-    from collections import Counter
     cluster_key = lambda i: (i.get("investor_type", ""), i.get("nationality", ""), i.get("sector", ""))
     counts = Counter(cluster_key(i) for i in unmatched_investors)
     suggestions = []
@@ -5506,7 +5965,7 @@ async def suggest_personas(fund_id: str, user: dict = Depends(get_current_user))
 
 # ============== ADMIN PERSONA ANALYTICS ENDPOINTS ==============
 
-@api_router.get("/admin/personas/all")
+@api_router.get("/admin/personas/all", response_class=ORJSONResponse)
 async def admin_get_all_personas(user: dict = Depends(get_current_user)):
     """Admin: all personas across all funds."""
     if user.get("role") != "ADMIN":
@@ -5515,106 +5974,112 @@ async def admin_get_all_personas(user: dict = Depends(get_current_user)):
     return {"personas": personas}
 
 
-@api_router.get("/admin/personas/analytics")
+@api_router.get("/admin/personas/analytics", response_class=ORJSONResponse)
 async def admin_persona_analytics(user: dict = Depends(get_current_user)):
     """Admin: platform-wide persona health analytics."""
     if user.get("role") != "ADMIN":
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    funds = await db.funds.find({}, {"_id": 0}).to_list(200)
+    funds = await db.funds.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(200)
     all_personas = await db.investor_personas.find({}, {"_id": 0}).to_list(1000)
-    all_investors = await db.investor_profiles.find({}, {"_id": 0}).to_list(5000)
 
     fund_id_to_name = {f["id"]: f["name"] for f in funds}
-    persona_by_fund = {}
-    for p in all_personas:
-        persona_by_fund.setdefault(p["fund_id"], []).append(p)
-    investor_by_fund = {}
-    for inv in all_investors:
-        investor_by_fund.setdefault(inv["fund_id"], []).append(inv)
+    persona_names = {p["id"]: p["name"] for p in all_personas}
+    persona_counts = Counter(p["fund_id"] for p in all_personas)
+
+    # persona_match_id/score are kept current by background re-scores on every persona
+    # and profile write, so this only aggregates
+    # Matched means the stored top persona score is at least 50
+    is_matched = {"$gte": [{"$ifNull": ["$persona_match_score", 0]}, 50]}
+    facets = await db.investor_profiles.aggregate([
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "by_fund": [{"$group": {
+                "_id": "$fund_id",
+                "investor_count": {"$sum": 1},
+                "matched_count": {"$sum": {"$cond": [is_matched, 1, 0]}},
+                "score_sum": {"$sum": {"$cond": [is_matched, "$persona_match_score", 0]}},
+            }}],
+            "by_persona": [
+                {"$match": {"persona_match_score": {"$gte": 50}}},
+                {"$group": {
+                    "_id": {"persona_id": "$persona_match_id", "fund_id": "$fund_id"},
+                    "investor_count": {"$sum": 1},
+                    "total_score": {"$sum": "$persona_match_score"},
+                }},
+            ],
+            "unmatched_types": [
+                {"$match": {"$expr": {"$not": [is_matched]}}},
+                {"$group": {"_id": {"$ifNull": ["$investor_type", "Unknown"]}, "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": 10},
+            ],
+        }},
+    ]).to_list(1)
+    facets = facets[0] if facets else {}
+    total_investors = facets["total"][0]["n"] if facets.get("total") else 0
+
+    fund_stats = {
+        f["id"]: {"investor_count": 0, "matched_count": 0, "unmatched_count": 0, "score_sum": 0}
+        for f in funds
+    }
+    for row in facets.get("by_fund", []):
+        stats = fund_stats.get(row["_id"])
+        if stats is None:
+            continue
+        stats["investor_count"] = row["investor_count"]
+        stats["matched_count"] = row["matched_count"]
+        stats["unmatched_count"] = row["investor_count"] - row["matched_count"]
+        stats["score_sum"] = row["score_sum"]
+
+    top_persona_counts = {}  # persona_id -> {name, fund_name, count, total_score}
+    for row in facets.get("by_persona", []):
+        pid, fid = row["_id"].get("persona_id"), row["_id"].get("fund_id")
+        if fid not in fund_stats:
+            continue
+        top_persona_counts[pid] = {
+            "persona_id": pid,
+            "persona_name": persona_names.get(pid, "Unknown"),
+            "fund_name": fund_id_to_name.get(fid, ""),
+            "investor_count": row["investor_count"],
+            "total_score": row["total_score"],
+        }
 
     total_matched = 0
     total_unmatched = 0
     per_fund = []
-    top_persona_counts = {}  # persona_id -> {name, fund_name, count, total_score}
-
-    for fund in funds:
-        fid = fund["id"]
-        personas = persona_by_fund.get(fid, [])
-        investors = investor_by_fund.get(fid, [])
-        matched_count = 0
-        unmatched_count = 0
-        score_sum = 0
-
-        for inv in investors:
-            if not personas:
-                unmatched_count += 1
-                continue
-            scores = []
-            for p in personas:
-                r = _score_rule_based(inv, p)
-                scores.append((p["id"], r["score"]))
-                top_pid, top_score = max(scores, key=lambda x: x[1])
-            if top_score >= 50:
-                matched_count += 1
-                score_sum += top_score
-                # Track persona counts
-                if top_pid not in top_persona_counts:
-                    pname = next((p["name"] for p in personas if p["id"] == top_pid), "Unknown")
-                    top_persona_counts[top_pid] = {
-                        "persona_id": top_pid,
-                        "persona_name": pname,
-                        "fund_name": fund_id_to_name.get(fid, ""),
-                        "investor_count": 0,
-                        "total_score": 0,
-                    }
-                top_persona_counts[top_pid]["investor_count"] += 1
-                top_persona_counts[top_pid]["total_score"] += top_score
-            else:
-                unmatched_count += 1
-
+    for fid, stats in fund_stats.items():
+        matched_count = stats["matched_count"]
         total_matched += matched_count
-        total_unmatched += unmatched_count
-        avg_score = round(score_sum / matched_count) if matched_count > 0 else 0
+        total_unmatched += stats["unmatched_count"]
         per_fund.append({
             "fund_id": fid,
             "fund_name": fund_id_to_name.get(fid, ""),
-            "persona_count": len(personas),
-            "investor_count": len(investors),
+            "persona_count": persona_counts[fid],
+            "investor_count": stats["investor_count"],
             "matched_count": matched_count,
-            "unmatched_count": unmatched_count,
-            "avg_match_score": avg_score,
+            "unmatched_count": stats["unmatched_count"],
+            "avg_match_score": round(stats["score_sum"] / matched_count) if matched_count > 0 else 0,
         })
 
     # Top personas sorted by investor_count
-    top_personas = sorted(top_persona_counts.values(), key=lambda x: x["investor_count"], reverse=True)[:10]
+    top_personas = heapq.nlargest(10, top_persona_counts.values(), key=lambda x: x["investor_count"])
     for tp in top_personas:
         tp["avg_score"] = round(tp["total_score"] / tp["investor_count"]) if tp["investor_count"] > 0 else 0
         del tp["total_score"]
 
     # Unmatched breakdown by investor_type
-    from collections import Counter
-    unmatched_investors = [
-        inv for inv in all_investors
-        if not investor_by_fund.get(inv["fund_id"])
-        or not persona_by_fund.get(inv["fund_id"])
-        or max(
-            (_score_rule_based(inv, p)["score"] for p in persona_by_fund.get(inv["fund_id"], [])),
-            default=0
-        ) < 50
-    ]
-    type_counts = Counter(i.get("investor_type", "Unknown") for i in unmatched_investors)
     unmatched_breakdown = [
-        {"investor_type": itype, "count": count}
-        for itype, count in type_counts.most_common(10)
+        {"investor_type": row["_id"], "count": row["count"]}
+        for row in facets.get("unmatched_types", [])
     ]
 
     return {
         "platform": {
             "total_personas": len(all_personas),
-            "funds_with_personas": len([f for f in funds if persona_by_fund.get(f["id"])]),
+            "funds_with_personas": len([f for f in funds if persona_counts[f["id"]]]),
             "total_funds": len(funds),
-            "total_investors": len(all_investors),
+            "total_investors": total_investors,
             "matched_investors": total_matched,
             "unmatched_investors": total_unmatched,
         },
@@ -5628,9 +6093,12 @@ async def admin_persona_analytics(user: dict = Depends(get_current_user)):
 
 @api_router.get("/funds/{fund_id}/email-templates")
 async def list_email_templates(fund_id: str, user: dict = Depends(get_current_user)):
-    templates = await db.email_templates.find(
-        {"fund_id": fund_id}, {"_id": 0}
-    ).sort("created_at", -1).to_list(200)
+    templates = cache_get(_EMAIL_TEMPLATE_CACHE, fund_id)
+    if templates is None:
+        templates = await db.email_templates.find(
+            {"fund_id": fund_id}, {"_id": 0}
+        ).sort("created_at", -1).to_list(200)
+        cache_set(_EMAIL_TEMPLATE_CACHE, fund_id, templates)
     return {"templates": templates}
 
 @api_router.post("/funds/{fund_id}/email-templates")
@@ -5645,6 +6113,7 @@ async def create_email_template(fund_id: str, data: EmailTemplateCreate, user: d
         created_by_name=f"{user.get('first_name', '')} {user.get('last_name', '')}".strip(),
     )
     await db.email_templates.insert_one(template.model_dump())
+    _EMAIL_TEMPLATE_CACHE.pop(fund_id, None)
     return template.model_dump()
 
 @api_router.put("/email-templates/{template_id}")
@@ -5655,12 +6124,15 @@ async def update_email_template(template_id: str, data: EmailTemplateUpdate, use
     update_dict = {k: v for k, v in data.model_dump().items() if v is not None}
     update_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
     await db.email_templates.update_one({"id": template_id}, {"$set": update_dict})
+    _EMAIL_TEMPLATE_CACHE.pop(existing.get("fund_id"), None)
     updated = await db.email_templates.find_one({"id": template_id}, {"_id": 0})
     return updated
 
 @api_router.delete("/email-templates/{template_id}")
 async def delete_email_template(template_id: str, user: dict = Depends(get_current_user)):
-    await db.email_templates.delete_one({"id": template_id})
+    deleted = await db.email_templates.find_one_and_delete({"id": template_id}, {"_id": 0, "fund_id": 1})
+    if deleted:
+        _EMAIL_TEMPLATE_CACHE.pop(deleted.get("fund_id"), None)
     return {"success": True}
 
 # ============== GMAIL HELPERS ==============
@@ -5680,26 +6152,265 @@ def _build_gmail_flow(client_id: str, client_secret: str, redirect_uri: str):
     flow.redirect_uri = redirect_uri
     return flow
 
-def _build_gmail_service(connection: dict, client_id: str, client_secret: str):
-    """Build an authenticated Gmail service from stored tokens + credentials."""
+@lru_cache(maxsize=None)
+def _discovery_doc(api: str, version: str) -> dict:
+    """Parsed discovery document for a Google API, read once from the copy bundled
+    with google-api-python-client instead of on every service build."""
+    return json.loads(get_static_doc(api, version))
+
+async def _load_gmail_oauth_credentials(connection: dict, client_id: str, client_secret: str):
+    """Google credentials from stored tokens. The access token is only refreshed when it
+    is within a minute of expiry, and the refreshed token is written back so later
+    requests reuse it."""
+    expiry = None
+    if connection.get("token_expiry"):
+        # google-auth compares expiry against naive UTC datetimes
+        expiry = datetime.fromisoformat(connection["token_expiry"]).replace(tzinfo=None)
     credentials = Credentials(
         token=connection["access_token"],
         refresh_token=connection.get("refresh_token"),
         token_uri="https://oauth2.googleapis.com/token",
         client_id=client_id,
         client_secret=client_secret,
+        expiry=expiry,
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if credentials.refresh_token and expiry and expiry - timedelta(seconds=60) <= now:
+        await asyncio.to_thread(credentials.refresh, GoogleRequest())
+        await db.gmail_connections.update_one(
+            {"user_id": connection["user_id"]},
+            {"$set": {
+                "access_token": credentials.token,
+                "token_expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+            }},
+        )
+    return credentials
+
+def _gmail_service(credentials):
+    return build_from_document(_discovery_doc("gmail", "v1"), credentials=credentials)
+
+# user_id -> (credentials, cached_until). Credentials rather than services are cached:
+# a service's httplib2 connection must not be shared between concurrent requests.
+_GMAIL_CREDENTIALS_CACHE: OrderedDict = OrderedDict()
+GMAIL_CREDENTIALS_CACHE_SIZE = 256
+GMAIL_CREDENTIALS_CACHE_TTL = 300
+
+async def _gmail_credentials_for_user(user_id: str):
+    """OAuth credentials for a user's Gmail connection, reused from the in-process cache
+    until the token is a minute from expiry. Raises 400 if Gmail is not connected."""
+    entry = _GMAIL_CREDENTIALS_CACHE.get(user_id)
+    if entry:
+        credentials, cached_until = entry
+        expires_soon = credentials.expiry and credentials.expiry - timedelta(seconds=60) <= datetime.now(timezone.utc).replace(tzinfo=None)
+        if cached_until > time.monotonic() and not expires_soon:
+            _GMAIL_CREDENTIALS_CACHE.move_to_end(user_id)
+            return credentials
+        _GMAIL_CREDENTIALS_CACHE.pop(user_id, None)
+
+    connection = await db.gmail_connections.find_one(
+        {"user_id": user_id},
+        {"_id": 0, "user_id": 1, "access_token": 1, "refresh_token": 1, "token_expiry": 1},
+    )
+    if not connection:
+        raise HTTPException(400, "Gmail not connected")
+    client_id, client_secret, _, _ = await _load_user_gmail_creds(user_id)
+    credentials = await _load_gmail_oauth_credentials(connection, client_id, client_secret)
+    _GMAIL_CREDENTIALS_CACHE[user_id] = (credentials, time.monotonic() + GMAIL_CREDENTIALS_CACHE_TTL)
+    if len(_GMAIL_CREDENTIALS_CACHE) > GMAIL_CREDENTIALS_CACHE_SIZE:
+        _GMAIL_CREDENTIALS_CACHE.popitem(last=False)
+    return credentials
+
+def _evict_gmail_credentials_on_auth_error(user_id: str, error: Exception):
+    """Drop cached credentials when Google rejects them so the next call reloads from DB."""
+    if isinstance(error, HttpError) and error.resp.status == 401:
+        _GMAIL_CREDENTIALS_CACHE.pop(user_id, None)
+        _GMAIL_APP_CREDS_CACHE.pop(user_id, None)
+
+GMAIL_METADATA_HEADERS = ["Subject", "From", "To", "Date"]
+_GMAIL_METADATA_HEADER_SET = frozenset(GMAIL_METADATA_HEADERS)
+GMAIL_BATCH_LIMIT = 100  # Gmail caps batch requests at 100 calls
+EMAIL_ADDRESS_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+def _gmail_metadata_request(messages_api, message_id: str):
+    """messages.get for one message; messages_api is service.users().messages(), built once
+    per service because constructing that resource costs far more than the request itself."""
+    return messages_api.get(
+        userId="me",
+        id=message_id,
+        format="metadata",
+        metadataHeaders=GMAIL_METADATA_HEADERS,
+        fields="id,threadId,snippet,labelIds,payload/headers",
     )
-    if credentials.expired and credentials.refresh_token:
-        credentials.refresh(GoogleRequest())
-    return google_build("gmail", "v1", credentials=credentials)
+
+def _extract_gmail_headers(msg: dict) -> dict:
+    """Pick the GMAIL_METADATA_HEADERS values out of a message in one pass, stopping once all are found."""
+    headers = {}
+    for h in msg.get("payload", {}).get("headers", []):
+        name = h["name"]
+        if name in _GMAIL_METADATA_HEADER_SET and name not in headers:
+            headers[name] = h["value"]
+            if len(headers) == len(_GMAIL_METADATA_HEADER_SET):
+                break
+    return headers
+
+def _batch_get_gmail_messages(service, message_ids: list) -> dict:
+    """Fetch message metadata through Gmail batch requests. Returns {message_id: message};
+    messages whose part of the batch failed are left out for the caller to retry."""
+    fetched = {}
+
+    def on_response(request_id, response, exception):
+        if exception is None:
+            fetched[request_id] = response
+
+    messages_api = service.users().messages()
+    for i in range(0, len(message_ids), GMAIL_BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_response)
+        for message_id in message_ids[i:i + GMAIL_BATCH_LIMIT]:
+            batch.add(_gmail_metadata_request(messages_api, message_id), request_id=message_id)
+        batch.execute()
+    return fetched
+
+async def _parallel_get_gmail_messages(credentials, message_ids: list) -> dict:
+    """Fetch message metadata one call per message, spread over a small thread pool.
+    httplib2 connections are not thread-safe, so each worker thread builds its own service.
+    The pool lives inside one to_thread call: if a fetch fails, waiting for the others to
+    finish happens off the event loop instead of stalling every other request."""
+    local = threading.local()
+
+    def fetch_one(message_id):
+        if not hasattr(local, "messages_api"):
+            local.messages_api = _gmail_service(credentials).users().messages()
+        return _gmail_metadata_request(local.messages_api, message_id).execute()
+
+    def fetch_all():
+        with ThreadPoolExecutor(max_workers=min(len(message_ids), 16)) as pool:
+            return dict(zip(message_ids, pool.map(fetch_one, message_ids)))
+
+    return await asyncio.to_thread(fetch_all)
+
+# sent_emails records queued by send_gmail and written in batches by _sent_email_writer
+_SENT_EMAIL_QUEUE: asyncio.Queue = asyncio.Queue()
+_SENT_EMAIL_STOP = None  # queued on shutdown; the writer exits once it has written everything ahead of it
+SENT_EMAIL_BATCH_SIZE = 200
+SENT_EMAIL_WRITE_ATTEMPTS = 3
+
+def _take_sent_email_batch(batch: list) -> list:
+    """Top up batch with whatever is already queued, up to SENT_EMAIL_BATCH_SIZE."""
+    while len(batch) < SENT_EMAIL_BATCH_SIZE and batch[-1:] != [_SENT_EMAIL_STOP]:
+        try:
+            batch.append(_SENT_EMAIL_QUEUE.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+async def _write_sent_email_batch(batch: list):
+    """insert_many with retries, so a transient failure doesn't drop the batch."""
+    for attempt in range(1, SENT_EMAIL_WRITE_ATTEMPTS + 1):
+        try:
+            await db.sent_emails.insert_many(batch, ordered=False)
+            return
+        except BulkWriteError as e:
+            # Unordered, so the rest of the batch was written; records a previous attempt
+            # already stored come back as duplicate _ids and count as written
+            if not e.details.get("writeConcernErrors") and all(
+                err.get("code") == 11000 for err in e.details.get("writeErrors", [])
+            ):
+                return
+            error = e
+        except Exception as e:
+            error = e
+        if attempt < SENT_EMAIL_WRITE_ATTEMPTS:
+            await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+    logger.error(f"Failed to record {len(batch)} sent email(s) after {SENT_EMAIL_WRITE_ATTEMPTS} attempts: {error}")
+
+async def _sent_email_writer():
+    """Background task: write queued sent_emails records until it takes _SENT_EMAIL_STOP."""
+    while True:
+        batch = _take_sent_email_batch([await _SENT_EMAIL_QUEUE.get()])
+        stopping = batch[-1] is _SENT_EMAIL_STOP
+        if stopping:
+            batch.pop()
+        if batch:
+            await _write_sent_email_batch(batch)
+        if stopping:
+            return
+
+async def _flush_sent_emails():
+    """Write anything queued after the writer stopped; used on shutdown."""
+    while not _SENT_EMAIL_QUEUE.empty():
+        batch = [r for r in _take_sent_email_batch([]) if r is not _SENT_EMAIL_STOP]
+        if batch:
+            await _write_sent_email_batch(batch)
+
+def _encode_gmail_message(data: GmailSendRequest) -> str:
+    """Plain-text message serialised in one pass and base64url-encoded for messages.send."""
+    message = EmailMessage(policy=email_policy.SMTP)
+    message["To"] = data.to
+    message["Subject"] = data.subject
+    if data.cc:
+        message["Cc"] = data.cc
+    message.set_content(data.body)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+async def _fund_investor_email_map(fund_id: str) -> dict:
+    """{lower-cased contact email: {id, name}} for a fund's investors, cached per fund."""
+    email_map = cache_get(_INVESTOR_EMAIL_MAP_CACHE, fund_id)
+    if email_map is None:
+        fund_investors = await db.investor_profiles.aggregate([
+            {"$match": {"fund_id": fund_id, "contact_email": {"$nin": [None, ""]}}},
+            {"$project": {
+                "_id": 0, "id": 1, "investor_name": 1,
+                "email_lower": {"$toLower": "$contact_email"},
+            }},
+        ]).to_list(None)
+        email_map = {
+            inv["email_lower"]: {"id": inv["id"], "name": inv["investor_name"]}
+            for inv in fund_investors
+        }
+        cache_set(_INVESTOR_EMAIL_MAP_CACHE, fund_id, email_map)
+    return email_map
+
+async def _sent_email_investor_links(user_id: str, fund_id: str, message_ids: list) -> dict:
+    """{message_id: {id, name}} for messages sent from the portal to an investor in this fund,
+    joined against investor_profiles in Mongo so the current investor name is returned."""
+    if not message_ids:
+        return {}
+    links = await db.sent_emails.aggregate([
+        {"$match": {"user_id": user_id, "message_id": {"$in": message_ids}, "investor_id": {"$ne": None}}},
+        {"$lookup": {
+            "from": "investor_profiles",
+            "let": {"iid": "$investor_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$id", "$$iid"]},
+                    {"$eq": ["$fund_id", fund_id]},
+                ]}}},
+                {"$project": {"_id": 0, "id": 1, "investor_name": 1}},
+            ],
+            "as": "investor",
+        }},
+        {"$unwind": "$investor"},
+        {"$project": {"_id": 0, "message_id": 1, "investor": 1}},
+    ]).to_list(None)
+    return {
+        link["message_id"]: {"id": link["investor"]["id"], "name": link["investor"]["investor_name"]}
+        for link in links
+    }
 
 async def _load_user_gmail_creds(user_id: str):
     """Load per-user stored Gmail credentials from DB, fall back to env."""
-    stored = await db.gmail_credentials.find_one({"user_id": user_id}, {"_id": 0})
+    cached = cache_get(_GMAIL_APP_CREDS_CACHE, user_id)
+    if cached is not None:
+        return cached
+    stored = await db.gmail_credentials.find_one(
+        {"user_id": user_id}, {"_id": 0, "client_id": 1, "client_secret": 1, "redirect_uri": 1}
+    )
     client_id = (stored or {}).get("client_id") or GOOGLE_CLIENT_ID
     client_secret = (stored or {}).get("client_secret") or GOOGLE_CLIENT_SECRET
     redirect_uri = (stored or {}).get("redirect_uri") or GOOGLE_REDIRECT_URI
-    return client_id, client_secret, redirect_uri, bool(stored)
+    creds = (client_id, client_secret, redirect_uri, bool(stored))
+    cache_set(_GMAIL_APP_CREDS_CACHE, user_id, creds)
+    return creds
 
 # ============== GMAIL ROUTES ==============
 
@@ -5713,10 +6424,12 @@ async def save_gmail_credentials(data: GmailCredentialsSave, user: dict = Depend
             "client_id": data.client_id,
             "client_secret": data.client_secret,
             "redirect_uri": data.redirect_uri,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": utc_now_iso(),
         }},
         upsert=True,
     )
+    _GMAIL_CREDENTIALS_CACHE.pop(user["id"], None)
+    _GMAIL_APP_CREDS_CACHE.pop(user["id"], None)
     return {"success": True}
 
 @api_router.get("/gmail/status")
@@ -5760,10 +6473,10 @@ async def gmail_oauth_callback(code: str = None, state: str = None, error: str =
         if not client_id or not client_secret:
             return RedirectResponse(f"{frontend_url}?gmail_error=no_credentials")
         flow = _build_gmail_flow(client_id, client_secret, redirect_uri)
-        flow.fetch_token(code=code)
+        await asyncio.to_thread(flow.fetch_token, code=code)
         credentials = flow.credentials
-        userinfo_service = google_build("oauth2", "v2", credentials=credentials)
-        userinfo = userinfo_service.userinfo().get().execute()
+        userinfo_service = build_from_document(_discovery_doc("oauth2", "v2"), credentials=credentials)
+        userinfo = await asyncio.to_thread(userinfo_service.userinfo().get().execute)
         gmail_email = userinfo.get("email", "")
         await db.gmail_connections.update_one(
             {"user_id": state},
@@ -5773,10 +6486,11 @@ async def gmail_oauth_callback(code: str = None, state: str = None, error: str =
                 "refresh_token": credentials.refresh_token,
                 "token_expiry": credentials.expiry.isoformat() if credentials.expiry else None,
                 "gmail_email": gmail_email,
-                "connected_at": datetime.now(timezone.utc).isoformat(),
+                "connected_at": utc_now_iso(),
             }},
             upsert=True,
         )
+        _GMAIL_CREDENTIALS_CACHE.pop(state, None)
         return RedirectResponse(f"{frontend_url}?gmail_connected=true")
     except Exception as e:
         logger.error(f"Gmail OAuth callback error: {e}")
@@ -5785,9 +6499,10 @@ async def gmail_oauth_callback(code: str = None, state: str = None, error: str =
 @api_router.delete("/gmail/disconnect")
 async def disconnect_gmail(user: dict = Depends(get_current_user)):
     await db.gmail_connections.delete_one({"user_id": user["id"]})
+    _GMAIL_CREDENTIALS_CACHE.pop(user["id"], None)
     return {"success": True}
 
-@api_router.get("/gmail/messages")
+@api_router.get("/gmail/messages", response_class=ORJSONResponse)
 async def get_gmail_messages(
     fund_id: str = None,
     investor_id: str = None,
@@ -5796,50 +6511,54 @@ async def get_gmail_messages(
 ):
     if not GMAIL_AVAILABLE:
         raise HTTPException(400, "Google API libraries not installed")
-    connection = await db.gmail_connections.find_one({"user_id": user["id"]}, {"_id": 0})
-    if not connection:
-        raise HTTPException(400, "Gmail not connected")
-    client_id, client_secret, _, _ = await _load_user_gmail_creds(user["id"])
     try:
-        service = _build_gmail_service(connection, client_id, client_secret)
+        credentials = await _gmail_credentials_for_user(user["id"])
+        service = _gmail_service(credentials)
         query = ""
         if investor_id:
-            investor = await db.investor_profiles.find_one({"id": investor_id}, {"_id": 0})
+            investor = await db.investor_profiles.find_one({"id": investor_id}, {"_id": 0, "contact_email": 1})
             if investor and investor.get("contact_email"):
                 e = investor["contact_email"]
                 query = f"from:{e} OR to:{e}"
-        results = service.users().messages().list(userId="me", maxResults=limit, q=query).execute()
-
-        investor_email_map = {}
-        if fund_id:
-            fund_investors = await db.investor_profiles.find(
-                {"fund_id": fund_id, "contact_email": {"$exists": True, "$ne": ""}},
-                {"_id": 0, "id": 1, "investor_name": 1, "contact_email": 1},
-            ).to_list(500)
-            for inv in fund_investors:
-                if inv.get("contact_email"):
-                    investor_email_map[inv["contact_email"].lower()] = {
-                        "id": inv["id"], "name": inv["investor_name"]
-                    }
+        list_request = service.users().messages().list(
+            userId="me", maxResults=limit, q=query, fields="messages(id)"
+        )
+        # Gmail client is blocking; run it off the event loop while Mongo builds the email map
+        results, investor_email_map = await asyncio.gather(
+            asyncio.to_thread(list_request.execute),
+            _fund_investor_email_map(fund_id) if fund_id else asyncio.sleep(0, result={}),
+        )
+
+        message_ids = [m["id"] for m in results.get("messages", [])]
+        try:
+            fetched = await asyncio.to_thread(_batch_get_gmail_messages, service, message_ids)
+        except HttpError as e:
+            logger.warning(f"Gmail batch fetch failed, fetching messages individually: {e}")
+            fetched = {}
+        missing = [message_id for message_id in message_ids if message_id not in fetched]
+        if missing:
+            fetched.update(await _parallel_get_gmail_messages(credentials, missing))
+
+        sent_links = await _sent_email_investor_links(user["id"], fund_id, message_ids) if fund_id else {}
 
         messages = []
-        for msg_ref in results.get("messages", []):
-            msg = service.users().messages().get(
-                userId="me",
-                id=msg_ref["id"],
-                format="metadata",
-                metadataHeaders=["Subject", "From", "To", "Date"],
-            ).execute()
-            headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+        for message_id in message_ids:
+            msg = fetched[message_id]
+            headers = _extract_gmail_headers(msg)
             from_raw = headers.get("From", "")
             to_raw = headers.get("To", "")
-            linked_investor = None
-            for email_addr, inv_info in investor_email_map.items():
-                if email_addr in from_raw.lower() or email_addr in to_raw.lower():
-                    linked_investor = inv_info
-                    break
+            linked_investor = sent_links.get(message_id)
+            if linked_investor is None and investor_email_map:
+                linked_investor = next(
+                    (
+                        investor_email_map[addr.lower()]
+                        for addr in EMAIL_ADDRESS_RE.findall(f"{from_raw} {to_raw}")
+                        if addr.lower() in investor_email_map
+                    ),
+                    None,
+                )
             messages.append({
-                "id": msg_ref["id"],
+                "id": message_id,
                 "thread_id": msg.get("threadId"),
                 "subject": headers.get("Subject", "(No Subject)"),
                 "from": from_raw,
@@ -5850,29 +6569,23 @@ async def get_gmail_messages(
                 "linked_investor": linked_investor,
             })
         return {"messages": messages, "total": len(messages)}
+    except HTTPException:
+        raise
     except Exception as e:
+        _evict_gmail_credentials_on_auth_error(user["id"], e)
         logger.error(f"Gmail fetch error: {e}")
         raise HTTPException(500, f"Failed to fetch emails: {str(e)}")
 
-@api_router.post("/gmail/send")
+@api_router.post("/gmail/send", response_class=ORJSONResponse)
 async def send_gmail(data: GmailSendRequest, user: dict = Depends(get_current_user)):
     if not GMAIL_AVAILABLE:
         raise HTTPException(400, "Google API libraries not installed")
-    connection = await db.gmail_connections.find_one({"user_id": user["id"]}, {"_id": 0})
-    if not connection:
-        raise HTTPException(400, "Gmail not connected")
-    client_id, client_secret, _, _ = await _load_user_gmail_creds(user["id"])
     try:
-        service = _build_gmail_service(connection, client_id, client_secret)
-        message = MIMEMultipart("alternative")
-        message["to"] = data.to
-        message["subject"] = data.subject
-        if data.cc:
-            message["cc"] = data.cc
-        message.attach(MIMEText(data.body, "plain"))
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        result = service.users().messages().send(userId="me", body={"raw": raw}).execute()
-        await db.sent_emails.insert_one({
+        service = _gmail_service(await _gmail_credentials_for_user(user["id"]))
+        raw = _encode_gmail_message(data)
+        result = await asyncio.to_thread(service.users().messages().send(userId="me", body={"raw": raw}).execute)
+        # Recorded by the background writer so the response doesn't wait on Mongo
+        _SENT_EMAIL_QUEUE.put_nowait({
             "id": str(uuid.uuid4()),
             "message_id": result["id"],
             "user_id": user["id"],
@@ -5881,24 +6594,32 @@ async def send_gmail(data: GmailSendRequest, user: dict = Depends(get_current_us
             "to": data.to,
             "subject": data.subject,
             "body": data.body,
-            "sent_at": datetime.now(timezone.utc).isoformat(),
+            "sent_at": utc_now_iso(),
         })
         return {"success": True, "message_id": result["id"]}
+    except HTTPException:
+        raise
     except Exception as e:
+        _evict_gmail_credentials_on_auth_error(user["id"], e)
         logger.error(f"Gmail send error: {e}")
         raise HTTPException(500, f"Failed to send email: {str(e)}")
 
-# Include the router
-app.include_router(api_router)
+# Strip whitespace from env entries so "a.com, b.com" matches; any "*" means allow all
+CORS_ORIGINS = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()]
+if not CORS_ORIGINS or '*' in CORS_ORIGINS:
+    CORS_ORIGINS = ['*']
 
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# List endpoints return large, repetitive JSON; compress it for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -5911,27 +6632,67 @@ logger = logging.getLogger(__name__)
 async def migrate_add_prospects_stage():
     """Add 'Prospects' stage as position 0 to any existing fund that doesn't have it.
     Shifts all existing stages up by 1 to make room."""
-    funds = await db.funds.find({}, {"_id": 0, "id": 1}).to_list(1000)
-    for fund in funds:
-        existing = await db.pipeline_stages.find_one(
-            {"fund_id": fund["id"], "name": "Prospects"}
+    missing = await db.funds.aggregate([
+        {"$lookup": {
+            "from": "pipeline_stages",
+            "let": {"fid": "$id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$fund_id", "$$fid"]},
+                    {"$eq": ["$name", "Prospects"]},
+                ]}}},
+                {"$limit": 1},
+            ],
+            "as": "prospects",
+        }},
+        {"$match": {"prospects": {"$size": 0}}},
+        {"$project": {"_id": 0, "id": 1}},
+    ]).to_list(None)
+    if not missing:
+        return
+    fund_ids = [f["id"] for f in missing]
+    # Shift all existing stages up by 1, then insert Prospects at position 0
+    await db.pipeline_stages.update_many({"fund_id": {"$in": fund_ids}}, {"$inc": {"position": 1}})
+    await db.pipeline_stages.insert_many([
+        PipelineStage(fund_id=fid, name="Prospects", position=0, is_default=False).model_dump()
+        for fid in fund_ids
+    ])
+    logger.info(f"Added Prospects stage to {len(fund_ids)} fund(s)")
+
+async def ensure_indexes():
+    """Create the indexes the request paths rely on. Safe to run on every startup."""
+    try:
+        # The old key wasn't scoped per fund; a leftover copy would still reject a
+        # second fund's capture of the same person.
+        if "captured_by_user_id_1_linkedin_url_1" in await db.research_captures.index_information():
+            await db.research_captures.drop_index("captured_by_user_id_1_linkedin_url_1")
+        # One capture per person per fund for each user (fund_id is null for extension
+        # uploads until they're accepted); captures without a LinkedIn URL aren't constrained.
+        await db.research_captures.create_index(
+            [("captured_by_user_id", 1), ("fund_id", 1), ("linkedin_url", 1)],
+            unique=True,
+            partialFilterExpression={"linkedin_url": {"$type": "string", "$gt": ""}},
         )
-        if not existing:
-            # Shift all existing stages up by 1
-            existing_stages = await db.pipeline_stages.find(
-                {"fund_id": fund["id"]}, {"_id": 0}
-            ).to_list(100)
-            for s in existing_stages:
-                await db.pipeline_stages.update_one(
-                    {"id": s["id"]},
-                    {"$set": {"position": s["position"] + 1}}
-                )
-            # Insert Prospects at position 0
-            stage = PipelineStage(
-                fund_id=fund["id"], name="Prospects", position=0, is_default=False
-            )
-            await db.pipeline_stages.insert_one(stage.model_dump())
-            logger.info(f"Added Prospects stage to fund {fund['id']}")
+    except Exception as e:
+        # Pre-existing duplicate captures block the unique index; uploads still
+        # de-dupe through the upsert, so just log and carry on.
+        logger.warning(f"Could not create research_captures index: {e}")
+    await asyncio.gather(
+        db.investor_profiles.create_index([("fund_id", 1), ("persona_match_score", 1)]),
+        db.investor_profiles.create_index([("fund_id", 1), ("contact_email", 1)]),
+        db.investor_profiles.create_index("id"),
+        db.investor_pipeline.create_index("fund_id"),
+        db.pipeline_stages.create_index("fund_id"),
+        db.gmail_connections.create_index("user_id", unique=True),
+        db.gmail_credentials.create_index("user_id", unique=True),
+        db.user_feedback.create_index([("submitted_at", -1), ("id", -1)]),
+        db.sent_emails.create_index([("user_id", 1), ("message_id", 1)]),
+        db.persona_match_jobs.create_index("id", unique=True),
+        # Match jobs are only polled for ~30s after the click; expire them after an hour
+        db.persona_match_jobs.create_index("created_at", expireAfterSeconds=PERSONA_MATCH_JOB_TTL_SECONDS),
+        # Jobs from before created_at was a date would never expire; they're long finished
+        db.persona_match_jobs.delete_many({"created_at": {"$type": "string"}}),
+    )
 
 # ============== FEEDBACK ENDPOINTS ==============
 
@@ -5948,11 +6709,66 @@ async def submit_feedback(data: UserFeedbackCreate, user: dict = Depends(get_cur
     return {"success": True, "id": feedback.id}
 
 @api_router.get("/admin/feedback")
-async def get_all_feedback(user: dict = Depends(get_current_user)):
+async def get_all_feedback(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+):
+    """Newest-first feedback, one page at a time. Pass next_cursor back as cursor for the next page.
+    The cursor is "<submitted_at>|<id>" so responses sharing a timestamp aren't skipped at a page boundary."""
+    if user.get("role") != "ADMIN":
+        raise HTTPException(status_code=403, detail="Admin only")
+    limit = max(1, min(limit, 200))
+    query = {}
+    if cursor:
+        submitted_at, _, last_id = cursor.partition("|")
+        query = {"$or": [
+            {"submitted_at": {"$lt": submitted_at}},
+            {"submitted_at": submitted_at, "id": {"$lt": last_id}},
+        ]}
+    docs = await db.user_feedback.find(query, {"_id": 0}).sort(
+        [("submitted_at", -1), ("id", -1)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(docs) > limit:
+        last = docs[limit - 1]
+        next_cursor = f"{last['submitted_at']}|{last['id']}"
+    return {
+        "responses": docs[:limit],
+        "total": await db.user_feedback.estimated_document_count(),
+        "next_cursor": next_cursor,
+    }
+
+@api_router.get("/admin/feedback/stats")
+async def get_feedback_stats(user: dict = Depends(get_current_user)):
+    """Summary figures for the feedback page, computed over every response rather than the loaded page"""
     if user.get("role") != "ADMIN":
         raise HTTPException(status_code=403, detail="Admin only")
-    responses = await db.user_feedback.find({}, {"_id": 0}).sort("submitted_at", -1).to_list(1000)
-    return {"responses": responses, "total": len(responses)}
+    result = await db.user_feedback.aggregate([{"$facet": {
+        "total": [{"$count": "n"}],
+        "score": [
+            {"$match": {"s2_intuitiveness": {"$gt": 0}}},
+            {"$group": {"_id": None, "avg": {"$avg": "$s2_intuitiveness"}}},
+        ],
+        "roles": [
+            {"$match": {"s1_role": {"$nin": [None, ""]}}},
+            {"$group": {"_id": "$s1_role", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+        ],
+        "want_ai": [{"$match": {"s9_ai_features.0": {"$exists": True}}}, {"$count": "n"}],
+    }}]).to_list(1)
+    facets = result[0] if result else {}
+    avg = facets.get("score") and facets["score"][0]["avg"]
+    return {
+        "total": facets["total"][0]["n"] if facets.get("total") else 0,
+        "avg_intuitiveness": round(avg, 1) if avg else None,
+        "roles": [{"role": r["_id"], "count": r["count"]} for r in facets.get("roles", [])],
+        "want_ai": facets["want_ai"][0]["n"] if facets.get("want_ai") else 0,
+    }
+
+# Include the router last: include_router copies the routes registered so far,
+# so anything declared after this line would never be served
+app.include_router(api_router)
 
 @app.on_event("startup")
 async def startup_event():
@@ -5976,9 +6792,24 @@ async def startup_event():
     else:
         logger.info(f"Admin user already exists: {admin_email}")
 
-    # Run migrations
-    await migrate_add_prospects_stage()
+    # Run migrations; they touch different collections so overlap the round trips
+    results = await asyncio.gather(migrate_add_prospects_stage(), ensure_indexes(), return_exceptions=True)
+    for task_name, result in zip(("migrate_add_prospects_stage", "ensure_indexes"), results):
+        if isinstance(result, Exception):
+            logger.error(f"Startup task {task_name} failed: {result}")
+
+    app.state.sent_email_writer = asyncio.create_task(_sent_email_writer())
+    app.state.persona_match_backfill = asyncio.create_task(_backfill_persona_matches())
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    backfill = getattr(app.state, "persona_match_backfill", None)
+    if backfill:
+        backfill.cancel()
+    writer = getattr(app.state, "sent_email_writer", None)
+    if writer:
+        # Let the writer finish the batch it holds and everything queued ahead of the sentinel
+        _SENT_EMAIL_QUEUE.put_nowait(_SENT_EMAIL_STOP)
+        await writer
+    await _flush_sent_emails()
     client.close()
@@ -0,0 +1,193 @@
+"""
+Shared fixtures for the backend API tests
+
+Session-scoped so a whole pytest run (or each xdist worker) opens one pooled
+connection and logs in as admin and as fund manager once, whichever modules are
+selected. The admin token is also kept in the pytest cache for a few minutes,
+so back-to-back runs skip the login entirely.
+
+Against a test backend whose JWT secret you control, set TEST_JWT_SECRET and
+TEST_ADMIN_USER_ID and the admin token is signed locally instead, with no login
+(and no server-side bcrypt check) at all.
+"""
+import pytest
+import requests
+import os
+import time
+import jwt
+from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+LOGIN_URL = f"{BASE_URL}/api/auth/login"
+HEALTH_URL = f"{BASE_URL}/api/health"
+REQUEST_TIMEOUT = 5  # seconds; a hung server shouldn't stall a worker for minutes
+TOKEN_CACHE_TTL = 600  # seconds; far inside the server's 24h JWT lifetime
+JWT_EXPIRATION_HOURS = 24  # matches server.JWT_EXPIRATION_HOURS, so a minted token outlives any run
+
+# Test-only token minting; both must match the backend (its JWT_SECRET and the admin's users.id)
+TEST_JWT_SECRET = os.environ.get("TEST_JWT_SECRET")
+TEST_ADMIN_USER_ID = os.environ.get("TEST_ADMIN_USER_ID")
+
+# Admin credentials
+ADMIN_EMAIL = "khaled@alknzventures.com"
+ADMIN_PASSWORD = "Admin123!"
+FUND_MANAGER_EMAIL = "mariam@alknzventures.com"
+FUND_MANAGER_PASSWORD = "Mariam123!"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Performance probes are for nightly runs: skip them unless RUN_PERF=1, whatever -m says"""
+    if os.environ.get("RUN_PERF") == "1":
+        return
+    skip_perf = pytest.mark.skip(reason="performance probe; set RUN_PERF=1 to run it")
+    for item in items:
+        if "performance" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that applies REQUEST_TIMEOUT when a call doesn't pass its own"""
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout or REQUEST_TIMEOUT, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive session with a connection pool, shared by every test; skips them all if the
+    backend is down"""
+    session = requests.Session()
+    adapter = _TimeoutAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Never POST: a create that landed before the 5xx would be replayed into an untracked duplicate
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS"],
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json"
+    _check_backend_up(session)
+    yield session
+    session.close()
+
+
+def _check_backend_up(session):
+    """Probe the backend once so a dead server skips the suite instead of timing out per test"""
+    try:
+        response = session.get(HEALTH_URL, timeout=2)
+    except requests.RequestException as e:
+        session.close()
+        pytest.skip(f"Backend unreachable: {e}")
+    if response.status_code >= 500:
+        session.close()
+        pytest.skip(f"Backend unhealthy: {response.status_code}")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _require_backend(request):
+    """Modules marked network get the probed http session before any of their own fixtures run"""
+    if request.node.get_closest_marker("network"):
+        request.getfixturevalue("http")
+
+
+def _login(http):
+    response = http.post(LOGIN_URL, json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+    assert response.status_code == 200, f"Login failed: {response.text}"
+    return response.json()["token"]
+
+
+def _mint_admin_token():
+    """Sign an admin token the way server.create_token does, without calling the backend"""
+    payload = {
+        "user_id": TEST_ADMIN_USER_ID,
+        "email": ADMIN_EMAIL,
+        "role": "ADMIN",
+        "exp": datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
+    }
+    return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture(scope="session")
+def auth_token(request, http):
+    """Get authentication token for admin user: minted locally when configured, else reused
+    from a recent run's cache, else a fresh login"""
+    if TEST_JWT_SECRET and TEST_ADMIN_USER_ID:
+        return _mint_admin_token()
+    cache = getattr(request.config, "cache", None)  # absent under -p no:cacheprovider
+    key = f"alknz/admin_token/{BASE_URL or 'default'}"
+    entry = cache.get(key, None) if cache else None
+    if entry and time.time() < entry["exp"]:
+        return entry["token"]
+    token = _login(http)
+    if cache:
+        cache.set(key, {"token": token, "exp": time.time() + TOKEN_CACHE_TTL})
+    return token
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Get authorization headers"""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def admin_token(auth_token):
+    """Admin token shared by the whole session"""
+    return auth_token
+
+
+@pytest.fixture(scope="session")
+def fund_manager_token(http):
+    """Get fund manager authentication token once per session"""
+    response = http.post(LOGIN_URL, json={"email": FUND_MANAGER_EMAIL, "password": FUND_MANAGER_PASSWORD})
+    if response.status_code == 200:
+        return response.json().get("token")
+    pytest.skip("Fund Manager authentication failed")
+
+
+@pytest.fixture(scope="session")
+def fund_manager_headers(fund_manager_token):
+    """Authorization headers for the fund manager"""
+    return {"Authorization": f"Bearer {fund_manager_token}"}
+
+
+@pytest.fixture(scope="session")
+def fund_manager_user(http, fund_manager_headers):
+    """Get fund manager user details"""
+    response = http.get(f"{BASE_URL}/api/auth/me", headers=fund_manager_headers)
+    if response.status_code == 200:
+        return response.json()
+    pytest.skip("Could not get fund manager user details")
+
+
+@pytest.fixture(scope="session")
+def all_funds_admin(http, auth_headers):
+    """Every fund as the admin sees it (GET /api/funds), fetched once per session"""
+    response = http.get(f"{BASE_URL}/api/funds", headers=auth_headers)
+    assert response.status_code == 200, f"Failed to list funds: {response.text}"
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def fund_id(all_funds_admin):
+    """Get a valid fund ID for testing"""
+    if not all_funds_admin:
+        pytest.skip("No funds available for testing")
+    return all_funds_admin[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def cleanup_ids(http, auth_headers):
+    """Ids of investors created by tests; append to it and they are all deleted in one request at session end"""
+    ids = []
+    yield ids
+    if ids:
+        response = http.post(f"{BASE_URL}/api/admin/investors/bulk-delete", json={"ids": ids}, headers=auth_headers)
+        assert response.status_code == 200, f"Bulk cleanup failed: {response.text}"
@@ -6,35 +6,9 @@ import pytest
 import requests
 import os
 
-BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
-
-# Test credentials
-ADMIN_EMAIL = "khaled@alknzventures.com"
-ADMIN_PASSWORD = "Admin123!"
-FM_EMAIL = "mariam@alknzventures.com"
-FM_PASSWORD = "Mariam123!"
-
+pytestmark = pytest.mark.network  # every test here talks to the live backend
 
-@pytest.fixture(scope="module")
-def admin_token():
-    """Get admin authentication token"""
-    response = requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
-    )
-    assert response.status_code == 200, f"Admin login failed: {response.text}"
-    return response.json()["token"]
-
-
-@pytest.fixture(scope="module")
-def fm_token():
-    """Get fund manager authentication token"""
-    response = requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"email": FM_EMAIL, "password": FM_PASSWORD}
-    )
-    assert response.status_code == 200, f"FM login failed: {response.text}"
-    return response.json()["token"]
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 
 class TestAllInvestorsAccessControl:
@@ -52,11 +26,11 @@ class TestAllInvestorsAccessControl:
         assert "investors" in data
         assert "filter_options" in data
     
-    def test_non_admin_gets_403(self, fm_token):
+    def test_non_admin_gets_403(self, fund_manager_token):
         """Non-admin (Fund Manager) should get 403 Forbidden"""
         response = requests.get(
             f"{BASE_URL}/api/admin/all-investors",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 403
         assert "Admin access required" in response.json().get("detail", "")
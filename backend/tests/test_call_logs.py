@@ -2,40 +2,77 @@
 Test suite for Call Logs feature in Communication Center
 Tests: GET /api/call-outcomes, GET/POST /api/funds/{fund_id}/call-logs, 
        GET/PUT/DELETE /api/call-logs/{call_log_id}
+
+Tests are independent (each cleans up what it creates), so they can run in
+parallel: pytest -n auto tests/test_call_logs.py
+
+Read-after-write checks are marked `integration`; a quick run can skip them
+with -m "not integration".
+
+Read-only tests with stable requests are marked for pytest-recording: the first
+run records their responses to tests/cassettes/ (gitignored) and later runs replay
+them instead of calling those endpoints. Login and the fixtures still talk to the
+backend. Use --record-mode=rewrite to refresh the cassettes; tests that write, or
+whose URL changes from run to run, stay live.
 """
 import pytest
-import requests
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# Progress messages are logged lazily; show them with --log-cli-level=INFO
+log = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.network  # every test here talks to the live backend
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
-# Test credentials
-FUND_MANAGER_EMAIL = "mariam@alknzventures.com"
-FUND_MANAGER_PASSWORD = "Mariam123!"
 FUND_ID = "eea15889-0c70-4c6b-b02f-1b4d32596d27"
 
+OUTCOMES = ("no_answer", "connected", "interested", "not_interested", "follow_up_needed")
+INVESTOR_URL = f"/api/investor-profiles/fund/{FUND_ID}"
+CALL_LOGS_URL = f"/api/funds/{FUND_ID}/call-logs"
+
+# Concurrent requests stay under the shared session's pool, so every one reuses a keep-alive socket
+MAX_WORKERS = 16
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """Worker threads for concurrent requests, sized to the session's connection pool"""
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(scope="session")
+def investors(http, fund_manager_headers):
+    """Investors on the test fund, fetched once per worker and read-only for the whole run.
+    An empty fund skips here once; pytest reuses that skip for every dependent test."""
+    response = http.get(f"{BASE_URL}{INVESTOR_URL}", headers=fund_manager_headers)
+    assert response.status_code == 200
+    data = response.json()
+    if not data:
+        pytest.skip("No investors found for fund")
+    return data
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """pytest-recording settings: keep tokens out of cassettes, record once and then only replay"""
+    return {"filter_headers": ["Authorization"], "record_mode": "once"}
+
 
 class TestCallLogsAPI:
     """Call Logs API endpoint tests"""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, http, fund_manager_headers, executor):
         """Setup test fixtures"""
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
-        
-        # Login and get token
-        login_response = self.session.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        
-        if login_response.status_code != 200:
-            pytest.skip(f"Login failed: {login_response.text}")
-        
-        self.token = login_response.json().get("token")
-        self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+        self.session = http
+        self.headers = fund_manager_headers
+        self.executor = executor
         
         # Store created call log IDs for cleanup
         self.created_call_logs = []
@@ -43,25 +80,47 @@ class TestCallLogsAPI:
         
         yield
         
-        # Cleanup: Delete test call logs
-        for call_log_id in self.created_call_logs:
-            try:
-                self.session.delete(f"{BASE_URL}/api/call-logs/{call_log_id}")
-            except:
-                pass
-        
-        # Cleanup: Delete test tasks
-        for task_id in self.created_tasks:
-            try:
-                self.session.delete(f"{BASE_URL}/api/user-tasks/{task_id}")
-            except:
-                pass
+        # Cleanup: Delete test call logs and tasks in parallel
+        urls = [f"{BASE_URL}/api/call-logs/{call_log_id}" for call_log_id in self.created_call_logs]
+        urls += [f"{BASE_URL}/api/user-tasks/{task_id}" for task_id in self.created_tasks]
+        list(self.executor.map(self._safe_delete, urls))
+    
+    def _safe_delete(self, url):
+        try:
+            self.session.delete(url, headers=self.headers)
+        except:
+            pass
+    
+    def _make_call_log(self, investor_id, **overrides):
+        """Create a call log on the test fund and track it (and any task) for cleanup"""
+        call_data = {
+            "investor_id": investor_id,
+            "call_datetime": datetime.now().isoformat(),
+            "outcome": "connected",
+            "create_task": False,
+            **overrides
+        }
+        response = self.session.post(f"{BASE_URL}{CALL_LOGS_URL}", json=call_data, headers=self.headers)
+        assert response.status_code == 200
+        call_log = response.json()
+        self.created_call_logs.append(call_log["id"])
+        if call_log.get("task_id"):
+            self.created_tasks.append(call_log["task_id"])
+        return call_log
+    
+    @pytest.fixture
+    def seed_call_log(self, investors):
+        """An existing call log for tests that read, update or delete one"""
+        return self._make_call_log(
+            investors[0]["id"], outcome="interested", notes="TEST_call_log - Seeded log"
+        )
     
     # ============== GET /api/call-outcomes Tests ==============
     
+    @pytest.mark.vcr
     def test_get_call_outcomes_returns_valid_options(self):
         """GET /api/call-outcomes returns valid outcome options"""
-        response = self.session.get(f"{BASE_URL}/api/call-outcomes")
+        response = self.session.get(f"{BASE_URL}/api/call-outcomes", headers=self.headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -71,21 +130,21 @@ class TestCallLogsAPI:
         assert "labels" in data
         
         # Verify expected outcomes
-        expected_outcomes = ["no_answer", "connected", "interested", "not_interested", "follow_up_needed"]
-        assert data["outcomes"] == expected_outcomes
+        assert tuple(data["outcomes"]) == OUTCOMES
         
         # Verify labels exist for all outcomes
-        for outcome in expected_outcomes:
+        for outcome in OUTCOMES:
             assert outcome in data["labels"]
             assert isinstance(data["labels"][outcome], str)
         
-        print(f"✓ GET /api/call-outcomes returns {len(data['outcomes'])} valid outcomes")
+        log.info("✓ GET /api/call-outcomes returns %d valid outcomes", len(data['outcomes']))
     
     # ============== GET /api/funds/{fund_id}/call-logs Tests ==============
     
+    @pytest.mark.vcr
     def test_get_call_logs_for_fund(self):
         """GET /api/funds/{fund_id}/call-logs returns call logs for the fund"""
-        response = self.session.get(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs")
+        response = self.session.get(f"{BASE_URL}{CALL_LOGS_URL}", headers=self.headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -97,79 +156,58 @@ class TestCallLogsAPI:
         assert data["fund_id"] == FUND_ID
         assert isinstance(data["call_logs"], list)
         
-        print(f"✓ GET /api/funds/{FUND_ID}/call-logs returns {data['total']} call logs")
+        log.info("✓ GET /api/funds/%s/call-logs returns %d call logs", FUND_ID, data['total'])
     
-    def test_get_call_logs_with_investor_filter(self):
+    def test_get_call_logs_with_investor_filter(self, investors):
         """GET /api/funds/{fund_id}/call-logs with investor_id filter works"""
-        # First get investors for the fund
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        assert investors_response.status_code == 200
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor_id = investors[0]["id"]
         
         # Get call logs filtered by investor
-        response = self.session.get(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs?investor_id={investor_id}")
+        response = self.session.get(f"{BASE_URL}{CALL_LOGS_URL}?investor_id={investor_id}", headers=self.headers)
         
         assert response.status_code == 200
         data = response.json()
         
         # Verify all returned logs are for the specified investor
-        for log in data["call_logs"]:
-            assert log["investor_id"] == investor_id
+        for call_log in data["call_logs"]:
+            assert call_log["investor_id"] == investor_id
         
-        print(f"✓ GET /api/funds/{FUND_ID}/call-logs?investor_id={investor_id} returns {data['total']} filtered logs")
+        log.info("✓ GET /api/funds/%s/call-logs?investor_id=%s returns %d filtered logs", FUND_ID, investor_id, data['total'])
     
     def test_get_call_logs_with_date_range_filter(self):
         """GET /api/funds/{fund_id}/call-logs with date range filters works"""
-        # Use a wide date range to include all logs
-        start_date = (datetime.now() - timedelta(days=365)).isoformat()
-        end_date = (datetime.now() + timedelta(days=1)).isoformat()
+        # A one-week window keeps the backend scan small; the filter logic is the same
+        now = datetime.now()
+        start_date = (now - timedelta(days=7)).isoformat()
+        end_date = (now + timedelta(days=1)).isoformat()
         
         response = self.session.get(
-            f"{BASE_URL}/api/funds/{FUND_ID}/call-logs?start_date={start_date}&end_date={end_date}"
+            f"{BASE_URL}{CALL_LOGS_URL}?start_date={start_date}&end_date={end_date}",
+            headers=self.headers
         )
         
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data["call_logs"], list)
         
-        print(f"✓ GET /api/funds/{FUND_ID}/call-logs with date range returns {data['total']} logs")
+        # Every returned log falls inside the window
+        for call_log in data["call_logs"]:
+            assert start_date <= call_log["call_datetime"] <= end_date
+        
+        log.info("✓ GET /api/funds/%s/call-logs with date range returns %d logs", FUND_ID, data['total'])
     
     # ============== POST /api/funds/{fund_id}/call-logs Tests ==============
     
-    def test_create_call_log_without_task(self):
+    def test_create_call_log_without_task(self, investors):
         """POST /api/funds/{fund_id}/call-logs creates a call log without task"""
-        # Get an investor
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        assert investors_response.status_code == 200
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor = investors[0]
         
-        # Create call log
-        call_data = {
-            "investor_id": investor["id"],
-            "call_datetime": datetime.now().isoformat(),
-            "outcome": "connected",
-            "notes": "TEST_call_log - Test call notes",
-            "next_step": "Schedule follow-up meeting",
-            "create_task": False
-        }
-        
-        response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Track for cleanup
-        self.created_call_logs.append(data["id"])
+        data = self._make_call_log(
+            investor["id"],
+            outcome="connected",
+            notes="TEST_call_log - Test call notes",
+            next_step="Schedule follow-up meeting"
+        )
         
         # Verify response
         assert data["investor_id"] == investor["id"]
@@ -182,42 +220,25 @@ class TestCallLogsAPI:
         assert "id" in data
         assert "created_at" in data
         
-        print(f"✓ POST /api/funds/{FUND_ID}/call-logs creates call log without task")
+        log.info("✓ POST /api/funds/%s/call-logs creates call log without task", FUND_ID)
     
-    def test_create_call_log_with_task(self):
+    def test_create_call_log_with_task(self, investors):
         """POST /api/funds/{fund_id}/call-logs with create_task=true creates both call log and user task"""
-        # Get an investor
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        assert investors_response.status_code == 200
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor = investors[0]
+        now = datetime.now()
         
         # Create call log with task
-        call_data = {
-            "investor_id": investor["id"],
-            "call_datetime": datetime.now().isoformat(),
-            "outcome": "follow_up_needed",
-            "notes": "TEST_call_log - Needs follow-up",
-            "next_step": "Send proposal",
-            "create_task": True,
-            "task_title": f"TEST_task - Follow up with {investor['investor_name']}",
-            "task_priority": "high",
-            "task_due_date": (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        }
-        
-        response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Track for cleanup
-        self.created_call_logs.append(data["id"])
-        if data.get("task_id"):
-            self.created_tasks.append(data["task_id"])
+        data = self._make_call_log(
+            investor["id"],
+            call_datetime=now.isoformat(),
+            outcome="follow_up_needed",
+            notes="TEST_call_log - Needs follow-up",
+            next_step="Send proposal",
+            create_task=True,
+            task_title=f"TEST_task - Follow up with {investor['investor_name']}",
+            task_priority="high",
+            task_due_date=(now + timedelta(days=7)).strftime("%Y-%m-%d")
+        )
         
         # Verify call log
         assert data["investor_id"] == investor["id"]
@@ -226,7 +247,7 @@ class TestCallLogsAPI:
         assert data["task_id"] is not None
         
         # Verify task was created
-        task_response = self.session.get(f"{BASE_URL}/api/funds/{FUND_ID}/user-tasks")
+        task_response = self.session.get(f"{BASE_URL}/api/funds/{FUND_ID}/user-tasks", headers=self.headers)
         assert task_response.status_code == 200
         task_data = task_response.json()
         tasks = task_data.get("tasks", [])
@@ -237,18 +258,10 @@ class TestCallLogsAPI:
         assert created_task["investor_id"] == investor["id"]
         assert created_task["priority"] == "high"
         
-        print(f"✓ POST /api/funds/{FUND_ID}/call-logs with create_task=true creates call log and task")
+        log.info("✓ POST /api/funds/%s/call-logs with create_task=true creates call log and task", FUND_ID)
     
-    def test_create_call_log_validates_outcome(self):
+    def test_create_call_log_validates_outcome(self, investors):
         """POST /api/funds/{fund_id}/call-logs validates outcome field"""
-        # Get an investor
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        assert investors_response.status_code == 200
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor = investors[0]
         
         # Try to create call log with invalid outcome
@@ -259,12 +272,12 @@ class TestCallLogsAPI:
             "create_task": False
         }
         
-        response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
+        response = self.session.post(f"{BASE_URL}{CALL_LOGS_URL}", json=call_data, headers=self.headers)
         
         assert response.status_code == 400
         assert "Invalid outcome" in response.json().get("detail", "")
         
-        print(f"✓ POST /api/funds/{FUND_ID}/call-logs validates outcome field")
+        log.info("✓ POST /api/funds/%s/call-logs validates outcome field", FUND_ID)
     
     def test_create_call_log_validates_investor(self):
         """POST /api/funds/{fund_id}/call-logs validates investor exists"""
@@ -275,39 +288,18 @@ class TestCallLogsAPI:
             "create_task": False
         }
         
-        response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
+        response = self.session.post(f"{BASE_URL}{CALL_LOGS_URL}", json=call_data, headers=self.headers)
         
         assert response.status_code == 404
         assert "Investor not found" in response.json().get("detail", "")
         
-        print(f"✓ POST /api/funds/{FUND_ID}/call-logs validates investor exists")
+        log.info("✓ POST /api/funds/%s/call-logs validates investor exists", FUND_ID)
     
     # ============== PUT /api/call-logs/{call_log_id} Tests ==============
     
-    def test_update_call_log(self):
+    def test_update_call_log(self, seed_call_log):
         """PUT /api/call-logs/{call_log_id} updates call log fields"""
-        # First create a call log
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
-        investor = investors[0]
-        
-        # Create call log
-        call_data = {
-            "investor_id": investor["id"],
-            "call_datetime": datetime.now().isoformat(),
-            "outcome": "no_answer",
-            "notes": "TEST_call_log - Original notes",
-            "create_task": False
-        }
-        
-        create_response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
-        assert create_response.status_code == 200
-        call_log = create_response.json()
-        self.created_call_logs.append(call_log["id"])
+        call_log = seed_call_log
         
         # Update call log
         update_data = {
@@ -316,7 +308,7 @@ class TestCallLogsAPI:
             "next_step": "Send follow-up email"
         }
         
-        update_response = self.session.put(f"{BASE_URL}/api/call-logs/{call_log['id']}", json=update_data)
+        update_response = self.session.put(f"{BASE_URL}/api/call-logs/{call_log['id']}", json=update_data, headers=self.headers)
         
         assert update_response.status_code == 200
         updated = update_response.json()
@@ -327,93 +319,63 @@ class TestCallLogsAPI:
         assert updated["next_step"] == "Send follow-up email"
         assert updated["updated_at"] != call_log["created_at"]
         
-        print(f"✓ PUT /api/call-logs/{call_log['id']} updates call log fields")
+        log.info("✓ PUT /api/call-logs/%s updates call log fields", call_log['id'])
     
     def test_update_call_log_not_found(self):
         """PUT /api/call-logs/{call_log_id} returns 404 for non-existent log"""
         update_data = {"outcome": "connected"}
         
-        response = self.session.put(f"{BASE_URL}/api/call-logs/non-existent-id", json=update_data)
+        response = self.session.put(f"{BASE_URL}/api/call-logs/non-existent-id", json=update_data, headers=self.headers)
         
         assert response.status_code == 404
         
-        print(f"✓ PUT /api/call-logs/non-existent-id returns 404")
+        log.info("✓ PUT /api/call-logs/non-existent-id returns 404")
     
     # ============== DELETE /api/call-logs/{call_log_id} Tests ==============
     
-    def test_delete_call_log(self):
+    def test_delete_call_log(self, seed_call_log):
         """DELETE /api/call-logs/{call_log_id} deletes call log"""
-        # First create a call log
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
+        call_log = seed_call_log
         
-        investor = investors[0]
-        
-        # Create call log
-        call_data = {
-            "investor_id": investor["id"],
-            "call_datetime": datetime.now().isoformat(),
-            "outcome": "connected",
-            "notes": "TEST_call_log - To be deleted",
-            "create_task": False
-        }
+        # Delete call log (teardown's cleanup DELETE then just gets a 404)
+        delete_response = self.session.delete(f"{BASE_URL}/api/call-logs/{call_log['id']}", headers=self.headers)
         
-        create_response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
-        assert create_response.status_code == 200
-        call_log = create_response.json()
+        assert delete_response.status_code == 200
+        assert delete_response.json()["message"] == "Call log deleted"
         
-        # Delete call log
-        delete_response = self.session.delete(f"{BASE_URL}/api/call-logs/{call_log['id']}")
+        log.info("✓ DELETE /api/call-logs/%s deletes call log", call_log['id'])
+    
+    @pytest.mark.integration
+    def test_deleted_call_log_is_gone(self, seed_call_log):
+        """GET /api/call-logs/{call_log_id} returns 404 after the log is deleted"""
+        call_log = seed_call_log
         
+        delete_response = self.session.delete(f"{BASE_URL}/api/call-logs/{call_log['id']}", headers=self.headers)
         assert delete_response.status_code == 200
-        assert delete_response.json()["message"] == "Call log deleted"
         
         # Verify deletion
-        get_response = self.session.get(f"{BASE_URL}/api/call-logs/{call_log['id']}")
+        get_response = self.session.get(f"{BASE_URL}/api/call-logs/{call_log['id']}", headers=self.headers)
         assert get_response.status_code == 404
         
-        print(f"✓ DELETE /api/call-logs/{call_log['id']} deletes call log")
+        log.info("✓ GET /api/call-logs/%s returns 404 after delete", call_log['id'])
     
     def test_delete_call_log_not_found(self):
         """DELETE /api/call-logs/{call_log_id} returns 404 for non-existent log"""
-        response = self.session.delete(f"{BASE_URL}/api/call-logs/non-existent-id")
+        response = self.session.delete(f"{BASE_URL}/api/call-logs/non-existent-id", headers=self.headers)
         
         assert response.status_code == 404
         
-        print(f"✓ DELETE /api/call-logs/non-existent-id returns 404")
+        log.info("✓ DELETE /api/call-logs/non-existent-id returns 404")
     
     # ============== GET /api/call-logs/{call_log_id} Tests ==============
     
-    def test_get_single_call_log(self):
+    def test_get_single_call_log(self, seed_call_log, investors):
         """GET /api/call-logs/{call_log_id} returns single call log"""
-        # First create a call log
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor = investors[0]
-        
-        # Create call log
-        call_data = {
-            "investor_id": investor["id"],
-            "call_datetime": datetime.now().isoformat(),
-            "outcome": "interested",
-            "notes": "TEST_call_log - Single log test",
-            "create_task": False
-        }
-        
-        create_response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
-        assert create_response.status_code == 200
-        call_log = create_response.json()
-        self.created_call_logs.append(call_log["id"])
+        call_log = seed_call_log
         
         # Get single call log
-        get_response = self.session.get(f"{BASE_URL}/api/call-logs/{call_log['id']}")
+        get_response = self.session.get(f"{BASE_URL}/api/call-logs/{call_log['id']}", headers=self.headers)
         
         assert get_response.status_code == 200
         data = get_response.json()
@@ -422,39 +384,40 @@ class TestCallLogsAPI:
         assert data["investor_id"] == investor["id"]
         assert data["outcome"] == "interested"
         
-        print(f"✓ GET /api/call-logs/{call_log['id']} returns single call log")
+        log.info("✓ GET /api/call-logs/%s returns single call log", call_log['id'])
     
     # ============== All Outcomes Test ==============
     
-    def test_create_call_log_with_all_outcomes(self):
+    def test_create_call_log_with_all_outcomes(self, investors):
         """Test creating call logs with all valid outcome types"""
-        investors_response = self.session.get(f"{BASE_URL}/api/investor-profiles/fund/{FUND_ID}")
-        investors = investors_response.json()
-        
-        if not investors:
-            pytest.skip("No investors found for fund")
-        
         investor = investors[0]
-        outcomes = ["no_answer", "connected", "interested", "not_interested", "follow_up_needed"]
+        call_datetime = datetime.now().isoformat()
         
-        for outcome in outcomes:
-            call_data = {
+        payloads = [
+            {
                 "investor_id": investor["id"],
-                "call_datetime": datetime.now().isoformat(),
+                "call_datetime": call_datetime,
                 "outcome": outcome,
                 "notes": f"TEST_call_log - Testing {outcome}",
                 "create_task": False
             }
-            
-            response = self.session.post(f"{BASE_URL}/api/funds/{FUND_ID}/call-logs", json=call_data)
+            for outcome in OUTCOMES
+        ]
+        
+        # The creates are independent, so send them together over the pooled session
+        url = f"{BASE_URL}{CALL_LOGS_URL}"
+        responses = list(self.executor.map(lambda payload: self.session.post(url, json=payload, headers=self.headers), payloads))
+        
+        # Track everything that was created before asserting, so a failure doesn't leak logs
+        self.created_call_logs.extend(r.json()["id"] for r in responses if r.status_code == 200)
+        
+        for outcome, response in zip(OUTCOMES, responses):
             assert response.status_code == 200
             data = response.json()
-            self.created_call_logs.append(data["id"])
-            
             assert data["outcome"] == outcome
             assert "outcome_label" in data
         
-        print(f"✓ Created call logs with all {len(outcomes)} outcome types")
+        log.info("✓ Created call logs with all %d outcome types", len(OUTCOMES))
 
 
 if __name__ == "__main__":
@@ -1,52 +1,80 @@
 """
 Test CSV Import Wizard - Backend API Tests
 Tests the POST /api/investor-profiles endpoint used by CSV import wizard
+
+Every test creates uniquely named investors and removes them again, so the
+module is safe to run in parallel: pytest -n auto tests/test_csv_import.py
 """
+import orjson
 import pytest
-import requests
 import os
+import uuid
+
+pytestmark = pytest.mark.network  # every test here talks to the live backend
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+AUTH_URL = f"{BASE_URL}/api/auth/login"
+FUNDS_URL = f"{BASE_URL}/api/my-funds"
+INVESTORS_URL = f"{BASE_URL}/api/investor-profiles"
+BULK_INVESTORS_URL = f"{INVESTORS_URL}/bulk"
+
+
+def _pipeline_url(fund_id):
+    return f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}"
+
+
+def _post_json(session, url, payload, headers=None):
+    """POST a payload serialised with orjson (the session already sends Content-Type: application/json)"""
+    return session.post(url, data=orjson.dumps(payload), headers=headers)
+
+
+def _parse(response):
+    return orjson.loads(response.content)
+
 
-# Test credentials
+def _uid_batch(n, width=6):
+    """n random hex suffixes of the given width from a single os.urandom call"""
+    raw = os.urandom(8 * n)
+    return [raw[i * 8:(i + 1) * 8].hex()[:width] for i in range(n)]
+
+# Credentials for the login test; everything else uses conftest's fund_manager_headers
 FM_EMAIL = "mariam@alknzventures.com"
 FM_PASSWORD = "Mariam123!"
-ADMIN_EMAIL = "khaled@alknzventures.com"
-ADMIN_PASSWORD = "Admin123!"
+
+
+@pytest.fixture(scope="session")
+def primary_fund(http, fund_manager_headers):
+    """The Fund Manager's first assigned fund, looked up once"""
+    response = http.get(FUNDS_URL, headers=fund_manager_headers)
+    assert response.status_code == 200 and response.json(), "FM needs at least one fund"
+    return response.json()[0]
+
+
+@pytest.fixture(scope="class")
+def sample_investor(http, fund_manager_headers, primary_fund):
+    """One imported investor shared by the read-only list checks, deleted once at teardown"""
+    payload = {
+        "investor_name": f"CSV_Shared_Test_{uuid.uuid4().hex[:8]}",
+        "investor_type": "Individual",
+        "country": "USA",
+        "fund_id": primary_fund["id"],
+        "source": "spreadsheet_import"
+    }
+    response = http.post(INVESTORS_URL, headers=fund_manager_headers, json=payload)
+    assert response.status_code == 200, f"Failed to create investor: {response.text}"
+    investor = response.json()
+    print(f"Created investor: {investor['investor_name']}")
+    yield investor
+    http.delete(f"{INVESTORS_URL}/{investor['id']}", headers=fund_manager_headers)
+    print("Cleaned up test investor")
 
 
 class TestCSVImportBackend:
     """Test backend APIs used by CSV Import Wizard"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test session"""
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
-        
-    def get_fm_token(self):
-        """Get Fund Manager auth token"""
-        response = self.session.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FM_EMAIL,
-            "password": FM_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip(f"FM login failed: {response.status_code}")
-        
-    def get_admin_token(self):
-        """Get Admin auth token"""
-        response = self.session.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip(f"Admin login failed: {response.status_code}")
-    
-    def test_login_as_fund_manager(self):
+    def test_login_as_fund_manager(self, http):
         """Test FM can login successfully"""
-        response = self.session.post(f"{BASE_URL}/api/auth/login", json={
+        response = http.post(AUTH_URL, json={
             "email": FM_EMAIL,
             "password": FM_PASSWORD
         })
@@ -56,12 +84,11 @@ class TestCSVImportBackend:
         assert data.get("user", {}).get("role") == "FUND_MANAGER"
         print(f"FM login successful: {data.get('user', {}).get('email')}")
         
-    def test_get_my_funds(self):
+    def test_get_my_funds(self, http, fund_manager_headers):
         """Test FM can get their assigned funds"""
-        token = self.get_fm_token()
-        response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
+        response = http.get(
+            FUNDS_URL,
+            headers=fund_manager_headers
         )
         assert response.status_code == 200
         funds = response.json()
@@ -74,20 +101,11 @@ class TestCSVImportBackend:
         print(f"Using fund: {self.fund_name} ({self.fund_id})")
         return funds[0]
         
-    def test_create_investor_profile_basic(self):
+    def test_create_investor_profile_basic(self, http, fund_manager_headers, primary_fund):
         """Test creating a basic investor profile (simulates CSV import)"""
-        token = self.get_fm_token()
-        
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
+        fund_id = primary_fund["id"]
         
         # Create investor profile (simulating CSV import)
-        import uuid
         unique_name = f"CSV_TEST_Import_{uuid.uuid4().hex[:8]}"
         
         payload = {
@@ -100,9 +118,9 @@ class TestCSVImportBackend:
             "source": "spreadsheet_import"
         }
         
-        response = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
+        response = http.post(
+            INVESTORS_URL,
+            headers=fund_manager_headers,
             json=payload
         )
         
@@ -116,97 +134,69 @@ class TestCSVImportBackend:
         
         # Cleanup - delete the test investor
         investor_id = data.get("id")
-        delete_response = self.session.delete(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {token}"}
+        delete_response = http.delete(
+            f"{INVESTORS_URL}/{investor_id}",
+            headers=fund_manager_headers
         )
         assert delete_response.status_code == 200
         print(f"Cleaned up test investor: {investor_id}")
         
-    def test_create_multiple_investors_csv_import(self):
+    def test_create_multiple_investors_csv_import(self, http, fund_manager_headers, primary_fund):
         """Test creating multiple investors (simulates batch CSV import)"""
-        token = self.get_fm_token()
-        
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
+        fund_id = primary_fund["id"]
         
         # Simulate CSV import data
-        import uuid
+        suffixes = _uid_batch(6)
         csv_data = [
             {
-                "investor_name": f"CSV_Batch_Test1_{uuid.uuid4().hex[:6]}",
+                "investor_name": f"CSV_Batch_Test1_{suffixes[0]}",
                 "investor_type": "Individual",
                 "country": "USA",
                 "city": "New York",
-                "contact_email": f"batch1_{uuid.uuid4().hex[:6]}@example.com",
+                "contact_email": f"batch1_{suffixes[1]}@example.com",
                 "fund_id": fund_id,
                 "source": "spreadsheet_import"
             },
             {
-                "investor_name": f"CSV_Batch_Test2_{uuid.uuid4().hex[:6]}",
+                "investor_name": f"CSV_Batch_Test2_{suffixes[2]}",
                 "investor_type": "Family Office",
                 "country": "UK",
                 "city": "London",
-                "contact_email": f"batch2_{uuid.uuid4().hex[:6]}@example.com",
+                "contact_email": f"batch2_{suffixes[3]}@example.com",
                 "fund_id": fund_id,
                 "source": "spreadsheet_import"
             },
             {
-                "investor_name": f"CSV_Batch_Test3_{uuid.uuid4().hex[:6]}",
+                "investor_name": f"CSV_Batch_Test3_{suffixes[4]}",
                 "investor_type": "Institution",
                 "country": "Singapore",
                 "city": "Singapore",
-                "contact_email": f"batch3_{uuid.uuid4().hex[:6]}@example.com",
+                "contact_email": f"batch3_{suffixes[5]}@example.com",
                 "fund_id": fund_id,
                 "source": "spreadsheet_import"
             }
         ]
         
-        created_ids = []
-        success_count = 0
-        
-        for investor_data in csv_data:
-            response = self.session.post(
-                f"{BASE_URL}/api/investor-profiles",
-                headers={"Authorization": f"Bearer {token}"},
-                json=investor_data
-            )
-            if response.status_code == 200:
-                success_count += 1
-                created_ids.append(response.json().get("id"))
-                print(f"Created: {investor_data['investor_name']}")
-            else:
-                print(f"Failed to create {investor_data['investor_name']}: {response.text}")
-        
-        assert success_count == 3, f"Expected 3 investors created, got {success_count}"
-        print(f"Successfully created {success_count} investors via batch import")
+        # One request for the whole sheet, like the import wizard sends it
+        response = _post_json(http, BULK_INVESTORS_URL, {"items": csv_data}, headers=fund_manager_headers)
+        assert response.status_code == 200, f"Bulk create failed: {response.text}"
+        
+        data = _parse(response)
+        for skipped in data["skipped"]:
+            print(f"Failed to create {skipped['investor_name']}: {skipped['detail']}")
+        created_ids = [inv["id"] for inv in data["investors"]]
+        
+        assert data["created"] == 3, f"Expected 3 investors created, got {data['created']}"
+        print(f"Successfully created {data['created']} investors via batch import")
         
         # Cleanup
-        for inv_id in created_ids:
-            self.session.delete(
-                f"{BASE_URL}/api/investor-profiles/{inv_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        http.delete(BULK_INVESTORS_URL, params={"ids": ",".join(created_ids)}, headers=fund_manager_headers)
         print(f"Cleaned up {len(created_ids)} test investors")
         
-    def test_duplicate_investor_rejection(self):
+    def test_duplicate_investor_rejection(self, http, fund_manager_headers, primary_fund):
         """Test that duplicate investor names in same fund are rejected"""
-        token = self.get_fm_token()
+        fund_id = primary_fund["id"]
         
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
-        
-        import uuid
         unique_name = f"CSV_Duplicate_Test_{uuid.uuid4().hex[:8]}"
         
         # Create first investor
@@ -217,9 +207,9 @@ class TestCSVImportBackend:
             "source": "spreadsheet_import"
         }
         
-        response1 = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
+        response1 = http.post(
+            INVESTORS_URL,
+            headers=fund_manager_headers,
             json=payload
         )
         assert response1.status_code == 200
@@ -227,9 +217,9 @@ class TestCSVImportBackend:
         print(f"Created first investor: {unique_name}")
         
         # Try to create duplicate
-        response2 = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
+        response2 = http.post(
+            INVESTORS_URL,
+            headers=fund_manager_headers,
             json=payload
         )
         assert response2.status_code == 400, "Duplicate should be rejected"
@@ -237,25 +227,16 @@ class TestCSVImportBackend:
         print(f"Duplicate correctly rejected: {response2.json().get('detail')}")
         
         # Cleanup
-        self.session.delete(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {token}"}
+        http.delete(
+            f"{INVESTORS_URL}/{investor_id}",
+            headers=fund_manager_headers
         )
         print("Cleaned up test investor")
         
-    def test_investor_profile_with_all_csv_fields(self):
+    def test_investor_profile_with_all_csv_fields(self, http, fund_manager_headers, primary_fund):
         """Test creating investor with all fields that can be mapped from CSV"""
-        token = self.get_fm_token()
-        
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
+        fund_id = primary_fund["id"]
         
-        import uuid
         unique_name = f"CSV_Full_Test_{uuid.uuid4().hex[:8]}"
         
         # Full payload with all mappable fields from CSV
@@ -287,9 +268,9 @@ class TestCSVImportBackend:
             "source": "spreadsheet_import"
         }
         
-        response = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
+        response = http.post(
+            INVESTORS_URL,
+            headers=fund_manager_headers,
             json=payload
         )
         
@@ -307,104 +288,41 @@ class TestCSVImportBackend:
         
         # Cleanup
         investor_id = data.get("id")
-        self.session.delete(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {token}"}
+        http.delete(
+            f"{INVESTORS_URL}/{investor_id}",
+            headers=fund_manager_headers
         )
         print("Cleaned up test investor")
         
-    def test_verify_investor_appears_in_fund_list(self):
+    def test_verify_investor_appears_in_fund_list(self, http, fund_manager_headers, primary_fund, sample_investor):
         """Test that created investor appears in fund's investor list"""
-        token = self.get_fm_token()
-        
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
-        
-        import uuid
-        unique_name = f"CSV_List_Test_{uuid.uuid4().hex[:8]}"
-        
-        # Create investor
-        payload = {
-            "investor_name": unique_name,
-            "investor_type": "Individual",
-            "country": "USA",
-            "fund_id": fund_id,
-            "source": "spreadsheet_import"
-        }
-        
-        create_response = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
-            json=payload
-        )
-        assert create_response.status_code == 200
-        investor_id = create_response.json().get("id")
-        print(f"Created investor: {unique_name}")
+        fund_id = primary_fund["id"]
+        investor_id = sample_investor["id"]
         
         # Verify investor appears in fund's investor list
-        list_response = self.session.get(
-            f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {token}"}
+        list_response = http.get(
+            _pipeline_url(fund_id),
+            headers=fund_manager_headers
         )
         assert list_response.status_code == 200
-        investors = list_response.json()
+        investors = _parse(list_response)
         
         found = any(inv.get("id") == investor_id for inv in investors)
         assert found, f"Investor {investor_id} not found in fund's investor list"
         print(f"Verified investor appears in fund list")
         
-        # Cleanup
-        self.session.delete(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        print("Cleaned up test investor")
-        
-    def test_investor_pipeline_entry_created(self):
+    def test_investor_pipeline_entry_created(self, http, fund_manager_headers, primary_fund, sample_investor):
         """Test that pipeline entry is created for imported investor"""
-        token = self.get_fm_token()
-        
-        # Get fund first
-        funds_response = self.session.get(
-            f"{BASE_URL}/api/my-funds",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        fund = funds_response.json()[0]
-        fund_id = fund.get("id")
-        
-        import uuid
-        unique_name = f"CSV_Pipeline_Test_{uuid.uuid4().hex[:8]}"
-        
-        # Create investor
-        payload = {
-            "investor_name": unique_name,
-            "investor_type": "Individual",
-            "country": "USA",
-            "fund_id": fund_id,
-            "source": "spreadsheet_import"
-        }
-        
-        create_response = self.session.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {token}"},
-            json=payload
-        )
-        assert create_response.status_code == 200
-        investor_id = create_response.json().get("id")
-        print(f"Created investor: {unique_name}")
+        fund_id = primary_fund["id"]
+        investor_id = sample_investor["id"]
         
         # Check investor in pipeline list (with pipeline status)
-        list_response = self.session.get(
-            f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {token}"}
+        list_response = http.get(
+            _pipeline_url(fund_id),
+            headers=fund_manager_headers
         )
         assert list_response.status_code == 200
-        investors = list_response.json()
+        investors = _parse(list_response)
         
         # Find our investor
         our_investor = next((inv for inv in investors if inv.get("id") == investor_id), None)
@@ -414,13 +332,6 @@ class TestCSVImportBackend:
         # The ImportWizard creates investors via POST /api/investor-profiles
         # Pipeline entries might need to be created separately
         print(f"Investor found in list. Pipeline stage: {our_investor.get('pipeline_stage_name', 'Not in pipeline')}")
-        
-        # Cleanup
-        self.session.delete(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        print("Cleaned up test investor")
 
 
 if __name__ == "__main__":
@@ -1,54 +1,150 @@
 """
 Test Suite for Admin Dashboard Section 5 (Investor Intelligence) and Section 6 (Execution Health)
 Tests the new dashboard endpoints: /api/dashboard/investor-intelligence and /api/dashboard/execution-health
+
+The tests only read, so they can run in parallel with the other modules; each xdist
+worker logs in once.
 """
 import pytest
-import requests
 import os
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+pytestmark = pytest.mark.network  # every test here talks to the live backend
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+INVESTOR_INTEL_URL = f"{BASE_URL}/api/dashboard/investor-intelligence"
+EXEC_HEALTH_URL = f"{BASE_URL}/api/dashboard/execution-health"
+
+
+# Response schemas. Strict mode keeps the old isinstance semantics: ints stay ints, floats accept ints.
+class _Schema(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+
+class GeoItem(_Schema):
+    country: str
+    count: int
+
+
+class InvestorTypeItem(_Schema):
+    type: str
+    count: int
+    percentage: float
+
+
+class AvgTicketItem(_Schema):
+    type: str
+    average_ticket: float
+
+
+class FitScoreItem(_Schema):
+    score: str
+    count: int
+    percentage: float
+
+
+class StageItem(_Schema):
+    stage: str
+    count: int
+    percentage: float
+
+
+class InvestorIntelligence(_Schema):
+    total_investors: int
+    geography: List[GeoItem]
+    investor_types: List[InvestorTypeItem]
+    avg_ticket_by_type: List[AvgTicketItem]
+    fit_score_distribution: List[FitScoreItem]
+    stage_distribution: List[StageItem]
+    generated_at: str
+
+
+# (field, item schema) for the list sections; adding a section is a one-line change
+INTEL_LIST_FIELDS = [
+    ("geography", GeoItem),
+    ("investor_types", InvestorTypeItem),
+    ("avg_ticket_by_type", AvgTicketItem),
+    ("stage_distribution", StageItem),
+]
+
+
+class FundManagerTasks(_Schema):
+    fund_manager: Optional[str]
+    total: int
+    open: int
+    completed: int
+    overdue: int
+
+
+class OverdueByPriority(_Schema):
+    high: int
+    medium: int
+    low: int
+
+
+class OverdueTasks(_Schema):
+    total: int
+    by_priority: OverdueByPriority
+
+
+class Meetings(_Schema):
+    scheduled: int
+    completed: int
+    completion_rate: float
+
+
+class Bottleneck(_Schema):
+    category: str
+    task_count: int
+    capital_blocked: float
+
+
+class ExecutionHealth(_Schema):
+    tasks_per_fund_manager: List[FundManagerTasks]
+    overdue_tasks: OverdueTasks
+    avg_response_time_days: Optional[float]
+    meetings: Meetings
+    bottlenecks: List[Bottleneck]
+    generated_at: str
 
-# Test credentials
-ADMIN_EMAIL = "khaled@alknzventures.com"
-ADMIN_PASSWORD = "Admin123!"
 
+@pytest.fixture(scope="class")
+def investor_intel_response(http, auth_headers):
+    """Fetch the investor intelligence aggregation once per class"""
+    return http.get(INVESTOR_INTEL_URL, headers=auth_headers)
 
-@pytest.fixture(scope="module")
-def auth_token():
-    """Get authentication token for admin user"""
-    response = requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
-    )
-    assert response.status_code == 200, f"Login failed: {response.text}"
-    return response.json()["token"]
 
+@pytest.fixture(scope="class")
+def investor_intel(investor_intel_response):
+    """Investor intelligence payload, validated against the schema once per class"""
+    assert investor_intel_response.status_code == 200, f"Request failed: {investor_intel_response.text}"
+    return InvestorIntelligence.model_validate_json(investor_intel_response.content)
 
-@pytest.fixture(scope="module")
-def auth_headers(auth_token):
-    """Get authorization headers"""
-    return {"Authorization": f"Bearer {auth_token}"}
+
+@pytest.fixture(scope="class")
+def exec_health_response(http, auth_headers):
+    """Fetch the execution health aggregation once per class"""
+    return http.get(EXEC_HEALTH_URL, headers=auth_headers)
+
+
+@pytest.fixture(scope="class")
+def exec_health(exec_health_response):
+    """Execution health payload, validated against the schema once per class"""
+    assert exec_health_response.status_code == 200, f"Request failed: {exec_health_response.text}"
+    return ExecutionHealth.model_validate_json(exec_health_response.content)
 
 
 class TestInvestorIntelligenceEndpoint:
     """Tests for GET /api/dashboard/investor-intelligence (Section 5)"""
     
-    def test_investor_intelligence_returns_200(self, auth_headers):
+    def test_investor_intelligence_returns_200(self, investor_intel_response):
         """Test that investor intelligence endpoint returns 200"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
+        response = investor_intel_response
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
     
-    def test_investor_intelligence_has_required_fields(self, auth_headers):
+    def test_investor_intelligence_has_required_fields(self, investor_intel):
         """Test that response contains all required fields"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
         # Check all required top-level fields
         required_fields = [
             "total_investors",
@@ -61,125 +157,38 @@ class TestInvestorIntelligenceEndpoint:
         ]
         
         for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+            assert field in investor_intel.model_fields_set, f"Missing required field: {field}"
     
-    def test_geography_structure(self, auth_headers):
-        """Test geography data structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["geography"], list), "geography should be a list"
-        
-        if len(data["geography"]) > 0:
-            geo = data["geography"][0]
-            assert "country" in geo, "geography item should have 'country'"
-            assert "count" in geo, "geography item should have 'count'"
-            assert isinstance(geo["count"], int), "count should be an integer"
+    @pytest.mark.parametrize("field,item_model", INTEL_LIST_FIELDS)
+    def test_list_field_structure(self, investor_intel, field, item_model):
+        """Test each distribution list holds items of the expected shape"""
+        items = getattr(investor_intel, field)
+        assert all(isinstance(item, item_model) for item in items), f"{field} items should be {item_model.__name__}"
     
-    def test_investor_types_structure(self, auth_headers):
-        """Test investor types distribution structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["investor_types"], list), "investor_types should be a list"
-        
-        if len(data["investor_types"]) > 0:
-            inv_type = data["investor_types"][0]
-            assert "type" in inv_type, "investor_types item should have 'type'"
-            assert "count" in inv_type, "investor_types item should have 'count'"
-            assert "percentage" in inv_type, "investor_types item should have 'percentage'"
-    
-    def test_avg_ticket_by_type_structure(self, auth_headers):
-        """Test average ticket by type structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["avg_ticket_by_type"], list), "avg_ticket_by_type should be a list"
-        
-        if len(data["avg_ticket_by_type"]) > 0:
-            ticket = data["avg_ticket_by_type"][0]
-            assert "type" in ticket, "avg_ticket_by_type item should have 'type'"
-            assert "average_ticket" in ticket, "avg_ticket_by_type item should have 'average_ticket'"
-            assert isinstance(ticket["average_ticket"], (int, float)), "average_ticket should be numeric"
-    
-    def test_fit_score_distribution_structure(self, auth_headers):
+    def test_fit_score_distribution_structure(self, investor_intel):
         """Test fit score (relationship strength) distribution structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["fit_score_distribution"], list), "fit_score_distribution should be a list"
-        
         # Should have predefined categories
         expected_scores = ["Excellent", "Good", "Fair", "Poor", "Unknown"]
-        actual_scores = [item["score"] for item in data["fit_score_distribution"]]
+        actual_scores = [item.score for item in investor_intel.fit_score_distribution]
         
         for score in expected_scores:
             assert score in actual_scores, f"Missing fit score category: {score}"
-        
-        for item in data["fit_score_distribution"]:
-            assert "score" in item, "fit_score item should have 'score'"
-            assert "count" in item, "fit_score item should have 'count'"
-            assert "percentage" in item, "fit_score item should have 'percentage'"
     
-    def test_stage_distribution_structure(self, auth_headers):
-        """Test stage distribution structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["stage_distribution"], list), "stage_distribution should be a list"
-        
-        if len(data["stage_distribution"]) > 0:
-            stage = data["stage_distribution"][0]
-            assert "stage" in stage, "stage_distribution item should have 'stage'"
-            assert "count" in stage, "stage_distribution item should have 'count'"
-            assert "percentage" in stage, "stage_distribution item should have 'percentage'"
-    
-    def test_total_investors_is_positive(self, auth_headers):
+    def test_total_investors_is_positive(self, investor_intel):
         """Test that total_investors is a non-negative integer"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/investor-intelligence",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["total_investors"], int), "total_investors should be an integer"
-        assert data["total_investors"] >= 0, "total_investors should be non-negative"
+        assert investor_intel.total_investors >= 0, "total_investors should be non-negative"
 
 
 class TestExecutionHealthEndpoint:
     """Tests for GET /api/dashboard/execution-health (Section 6)"""
     
-    def test_execution_health_returns_200(self, auth_headers):
+    def test_execution_health_returns_200(self, exec_health_response):
         """Test that execution health endpoint returns 200"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
+        response = exec_health_response
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
     
-    def test_execution_health_has_required_fields(self, auth_headers):
+    def test_execution_health_has_required_fields(self, exec_health):
         """Test that response contains all required fields"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
         # Check all required top-level fields
         required_fields = [
             "tasks_per_fund_manager",
@@ -191,112 +200,45 @@ class TestExecutionHealthEndpoint:
         ]
         
         for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+            assert field in exec_health.model_fields_set, f"Missing required field: {field}"
     
-    def test_tasks_per_fund_manager_structure(self, auth_headers):
-        """Test tasks per fund manager structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["tasks_per_fund_manager"], list), "tasks_per_fund_manager should be a list"
-        
-        if len(data["tasks_per_fund_manager"]) > 0:
-            fm = data["tasks_per_fund_manager"][0]
-            # Check required columns: FM Name, Total, Open, Done, Overdue
-            assert "fund_manager" in fm, "tasks_per_fund_manager item should have 'fund_manager'"
-            assert "total" in fm, "tasks_per_fund_manager item should have 'total'"
-            assert "open" in fm, "tasks_per_fund_manager item should have 'open'"
-            assert "completed" in fm, "tasks_per_fund_manager item should have 'completed'"
-            assert "overdue" in fm, "tasks_per_fund_manager item should have 'overdue'"
-            
-            # Verify types
-            assert isinstance(fm["total"], int), "total should be an integer"
-            assert isinstance(fm["open"], int), "open should be an integer"
-            assert isinstance(fm["completed"], int), "completed should be an integer"
-            assert isinstance(fm["overdue"], int), "overdue should be an integer"
+    def test_tasks_per_fund_manager_structure(self, exec_health):
+        """Test tasks per fund manager structure (FM Name, Total, Open, Done, Overdue)"""
+        assert all(isinstance(fm, FundManagerTasks) for fm in exec_health.tasks_per_fund_manager)
     
-    def test_overdue_tasks_structure(self, auth_headers):
+    def test_overdue_tasks_structure(self, exec_health):
         """Test overdue tasks structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        overdue = data["overdue_tasks"]
-        assert "total" in overdue, "overdue_tasks should have 'total'"
-        assert "by_priority" in overdue, "overdue_tasks should have 'by_priority'"
-        
-        by_priority = overdue["by_priority"]
-        assert "high" in by_priority, "by_priority should have 'high'"
-        assert "medium" in by_priority, "by_priority should have 'medium'"
-        assert "low" in by_priority, "by_priority should have 'low'"
+        assert isinstance(exec_health.overdue_tasks.by_priority, OverdueByPriority)
     
-    def test_meetings_structure(self, auth_headers):
+    def test_meetings_structure(self, exec_health):
         """Test meetings structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        meetings = data["meetings"]
-        assert "scheduled" in meetings, "meetings should have 'scheduled'"
-        assert "completed" in meetings, "meetings should have 'completed'"
-        assert "completion_rate" in meetings, "meetings should have 'completion_rate'"
-        
-        assert isinstance(meetings["scheduled"], int), "scheduled should be an integer"
-        assert isinstance(meetings["completed"], int), "completed should be an integer"
-        assert isinstance(meetings["completion_rate"], (int, float)), "completion_rate should be numeric"
+        assert isinstance(exec_health.meetings, Meetings)
     
-    def test_bottlenecks_structure(self, auth_headers):
+    def test_bottlenecks_structure(self, exec_health):
         """Test bottlenecks structure"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        assert isinstance(data["bottlenecks"], list), "bottlenecks should be a list"
-        
-        if len(data["bottlenecks"]) > 0:
-            bottleneck = data["bottlenecks"][0]
-            assert "category" in bottleneck, "bottleneck should have 'category'"
-            assert "task_count" in bottleneck, "bottleneck should have 'task_count'"
-            assert "capital_blocked" in bottleneck, "bottleneck should have 'capital_blocked'"
-            
-            # Verify category is one of expected values
-            expected_categories = ["Legal", "IC", "Documentation", "Compliance", "Other"]
-            assert bottleneck["category"] in expected_categories, f"Unexpected category: {bottleneck['category']}"
+        # Verify category is one of expected values
+        expected_categories = ["Legal", "IC", "Documentation", "Compliance", "Other"]
+        for bottleneck in exec_health.bottlenecks:
+            assert bottleneck.category in expected_categories, f"Unexpected category: {bottleneck.category}"
     
-    def test_avg_response_time_is_nullable(self, auth_headers):
+    def test_avg_response_time_is_nullable(self, exec_health):
         """Test that avg_response_time_days can be null or numeric"""
-        response = requests.get(
-            f"{BASE_URL}/api/dashboard/execution-health",
-            headers=auth_headers
-        )
-        data = response.json()
-        
-        avg_time = data["avg_response_time_days"]
-        assert avg_time is None or isinstance(avg_time, (int, float)), \
-            "avg_response_time_days should be null or numeric"
+        # The schema types it Optional[float]; an explicit null must still be present in the payload
+        assert "avg_response_time_days" in exec_health.model_fields_set
 
 
 class TestEndpointAuthentication:
     """Test authentication requirements for dashboard endpoints"""
     
-    def test_investor_intelligence_requires_auth(self):
+    def test_investor_intelligence_requires_auth(self, http):
         """Test that investor intelligence endpoint requires authentication"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/investor-intelligence")
+        response = http.get(INVESTOR_INTEL_URL)
         assert response.status_code in [401, 403], \
             f"Expected 401/403 without auth, got {response.status_code}"
     
-    def test_execution_health_requires_auth(self):
+    def test_execution_health_requires_auth(self, http):
         """Test that execution health endpoint requires authentication"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/execution-health")
+        response = http.get(EXEC_HEALTH_URL)
         assert response.status_code in [401, 403], \
             f"Expected 401/403 without auth, got {response.status_code}"
 
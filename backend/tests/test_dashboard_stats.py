@@ -1,105 +1,150 @@
 """
 Test suite for Admin Dashboard Stats and Fund Performance APIs
-Tests GET /api/dashboard/stats and GET /api/dashboard/fund-performance endpoints
+Tests GET /api/dashboard/stats and GET /api/dashboard/fund-performance endpoints, and the
+combined GET /api/dashboard/overview the dashboard page loads them through
+
+Every test reads the same module-scoped responses, so the module runs on one xdist
+worker beside the other modules rather than being split up. The default --dist loadfile
+does that already; the xdist_group mark keeps it together under --dist loadgroup too.
 """
 import pytest
-import requests
+import logging
+import math
 import os
+import statistics
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
+# Diagnostics are logged at DEBUG so xdist workers don't contend for stdout; show them with --log-cli-level=DEBUG
+log = logging.getLogger(__name__)
+
+pytestmark = [
+    pytest.mark.network,  # every test here talks to the live backend
+    pytest.mark.xdist_group("dashboard_readonly"),
+]
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+STATS_URL = f"{BASE_URL}/api/dashboard/stats"
+FUND_PERFORMANCE_URL = f"{BASE_URL}/api/dashboard/fund-performance"
+OVERVIEW_URL = f"{BASE_URL}/api/dashboard/overview"
+# Every dashboard endpoint, for the checks that apply to all of them
+DASHBOARD_URLS = pytest.mark.parametrize(
+    "url", [STATS_URL, FUND_PERFORMANCE_URL, OVERVIEW_URL], ids=["stats", "fund-performance", "overview"]
+)
+
+# Field contracts, checked against the single cached response for each endpoint. The stats fields
+# feed parametrize, so they stay tuples (xdist needs the same test order on every worker); the
+# per-fund fields are sets so each fund is checked with one set difference.
+STATS_COUNT_FIELDS = ("total_users", "total_funds", "total_investors", "active_users", "active_funds", "active_fund_managers")
+STATS_CAPITAL_FIELDS = ("total_deployed_capital", "total_potential_capital", "capital_in_final_stages")
+STATS_REQUIRED_FIELDS = STATS_COUNT_FIELDS + STATS_CAPITAL_FIELDS
+FUND_NUMERIC_FIELDS = frozenset({
+    "target_capital",
+    "deployed_capital",
+    "percent_of_goal",
+    "capital_in_final_stages",
+    "active_investors",
+    "investors_in_deployed",
+    "investors_in_final",
+    "average_investment_size"
+})
+FUND_REQUIRED_FIELDS = FUND_NUMERIC_FIELDS | {"fund_id", "fund_name", "days_since_last_close", "alerts", "status"}
+VALID_SEVERITIES = frozenset({"critical", "warning", "info"})
 
-BASE_URL = os.environ.get('REACT_APP_BACKEND_URL').rstrip('/')
+# Budget for building the fund performance snapshot; override for slow remote backends
+FUND_PERFORMANCE_MAX_SECONDS = float(os.environ.get("FUND_PERFORMANCE_MAX_SECONDS", "0.5"))
 
-# Admin credentials
-ADMIN_EMAIL = "khaled@alknzventures.com"
-ADMIN_PASSWORD = "Admin123!"
+# Concurrency probe: CONCURRENT_REQUESTS GETs over CONCURRENT_WORKERS threads (kept under the
+# shared session's pool size), with a p95 latency budget
+CONCURRENT_REQUESTS = 100
+CONCURRENT_WORKERS = 20
+CONCURRENT_P95_MAX_SECONDS = float(os.environ.get("CONCURRENT_P95_MAX_SECONDS", "1.0"))
+
+# Bodies below this size are sent uncompressed; matches GZipMiddleware(minimum_size=512) in server.py
+GZIP_MINIMUM_SIZE = 512
+
+
+def _json(response):
+    """Parse a response body with orjson; the fund list is float-heavy and stdlib json is slow on it"""
+    return orjson.loads(response.content)
 
 
 @pytest.fixture(scope="module")
-def auth_token():
-    """Get authentication token for admin user"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json().get("token")
-    pytest.skip(f"Authentication failed: {response.status_code} - {response.text}")
+def stats_response(http, auth_headers):
+    """Fetch dashboard stats once for the module"""
+    return http.get(STATS_URL, headers=auth_headers)
 
 
 @pytest.fixture(scope="module")
-def auth_headers(auth_token):
-    """Get headers with auth token"""
-    return {"Authorization": f"Bearer {auth_token}"}
+def overview_response(http, auth_headers):
+    """Fetch stats and fund performance together, as the admin dashboard does"""
+    return http.get(OVERVIEW_URL, headers=auth_headers)
+
+
+@pytest.fixture(scope="module")
+def overview(overview_response):
+    """Parsed overview payload"""
+    assert overview_response.status_code == 200, f"Request failed: {overview_response.text}"
+    return _json(overview_response)
+
+
+@pytest.fixture(scope="module")
+def stats(overview):
+    """Dashboard stats section of the overview"""
+    return overview["stats"]
+
+
+@pytest.fixture(scope="module")
+def fund_performance_response(http, auth_headers):
+    """Fetch the fund performance snapshot once for the module"""
+    return http.get(FUND_PERFORMANCE_URL, headers=auth_headers)
+
+
+@pytest.fixture(scope="module")
+def fund_performance(overview):
+    """Fund performance section of the overview"""
+    return overview["fund_performance"]
 
 
 class TestDashboardStats:
     """Tests for GET /api/dashboard/stats endpoint"""
     
-    def test_dashboard_stats_returns_200(self, auth_headers):
+    def test_dashboard_stats_returns_200(self, stats_response):
         """Test that dashboard stats endpoint returns 200"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=auth_headers)
+        response = stats_response
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
     
-    def test_dashboard_stats_has_required_fields(self, auth_headers):
-        """Test that dashboard stats response has all required fields"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        required_fields = [
-            "total_users",
-            "total_funds",
-            "total_investors",
-            "active_users",
-            "active_funds",
-            "active_fund_managers",
-            "total_deployed_capital",
-            "total_potential_capital",
-            "capital_in_final_stages"
-        ]
-        
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+    def test_dashboard_stats_endpoint_has_required_fields(self, stats_response):
+        """Test that /dashboard/stats itself, not just the overview, returns every required field"""
+        assert stats_response.status_code == 200
+        data = _json(stats_response)
+        missing = [field for field in STATS_REQUIRED_FIELDS if field not in data]
+        assert not missing, f"/dashboard/stats missing required fields: {missing}"
     
-    def test_dashboard_stats_capital_values_are_numbers(self, auth_headers):
-        """Test that capital values are numeric"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        
-        # Capital fields should be numeric
-        assert isinstance(data["total_deployed_capital"], (int, float)), "total_deployed_capital should be numeric"
-        assert isinstance(data["total_potential_capital"], (int, float)), "total_potential_capital should be numeric"
-        assert isinstance(data["capital_in_final_stages"], (int, float)), "capital_in_final_stages should be numeric"
-        
-        # Capital values should be non-negative
-        assert data["total_deployed_capital"] >= 0, "total_deployed_capital should be non-negative"
-        assert data["total_potential_capital"] >= 0, "total_potential_capital should be non-negative"
-        assert data["capital_in_final_stages"] >= 0, "capital_in_final_stages should be non-negative"
+    @pytest.mark.parametrize("field", STATS_REQUIRED_FIELDS)
+    def test_dashboard_stats_has_required_field(self, stats, field):
+        """Test that dashboard stats response has each required field"""
+        assert field in stats, f"Missing required field: {field}"
     
-    def test_dashboard_stats_count_values_are_integers(self, auth_headers):
-        """Test that count values are integers"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        
-        count_fields = ["total_users", "total_funds", "total_investors", "active_users", "active_funds", "active_fund_managers"]
-        for field in count_fields:
-            assert isinstance(data[field], int), f"{field} should be an integer"
-            assert data[field] >= 0, f"{field} should be non-negative"
+    @pytest.mark.parametrize("field", STATS_CAPITAL_FIELDS)
+    def test_dashboard_stats_capital_value_is_number(self, stats, field):
+        """Test that capital values are numeric and non-negative"""
+        assert isinstance(stats[field], (int, float)), f"{field} should be numeric"
+        assert stats[field] >= 0, f"{field} should be non-negative"
+    
+    @pytest.mark.parametrize("field", STATS_COUNT_FIELDS)
+    def test_dashboard_stats_count_value_is_integer(self, stats, field):
+        """Test that count values are non-negative integers"""
+        assert isinstance(stats[field], int), f"{field} should be an integer"
+        assert stats[field] >= 0, f"{field} should be non-negative"
     
-    def test_dashboard_stats_expected_capital_values(self, auth_headers):
+    def test_dashboard_stats_expected_capital_values(self, stats):
         """Test that capital values are in expected ranges based on test data"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        
         # Log actual values for debugging
-        print(f"Total Deployed Capital: ${data['total_deployed_capital']:,.2f}")
-        print(f"Total Potential Capital: ${data['total_potential_capital']:,.2f}")
-        print(f"Capital in Final Stages: ${data['capital_in_final_stages']:,.2f}")
+        log.debug("Total Deployed Capital: $%.2f", stats['total_deployed_capital'])
+        log.debug("Total Potential Capital: $%.2f", stats['total_potential_capital'])
+        log.debug("Capital in Final Stages: $%.2f", stats['capital_in_final_stages'])
         
         # Expected values from the test request:
         # total_deployed_capital: ~$1,050,000
@@ -108,67 +153,49 @@ class TestDashboardStats:
         
         # Verify values are reasonable (not zero if there's data)
         # These are soft checks - actual values depend on test data
-        if data["total_funds"] > 0:
-            print(f"Total Funds: {data['total_funds']}")
-            print(f"Total Investors: {data['total_investors']}")
+        if stats["total_funds"] > 0:
+            log.debug("Total Funds: %d", stats['total_funds'])
+            log.debug("Total Investors: %d", stats['total_investors'])
 
 
 class TestFundPerformance:
     """Tests for GET /api/dashboard/fund-performance endpoint"""
     
-    def test_fund_performance_returns_200(self, auth_headers):
+    def test_fund_performance_returns_200(self, fund_performance_response):
         """Test that fund performance endpoint returns 200"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
+        response = fund_performance_response
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
     
-    def test_fund_performance_has_funds_array(self, auth_headers):
-        """Test that fund performance response has funds array"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "funds" in data, "Response should have 'funds' field"
-        assert isinstance(data["funds"], list), "'funds' should be a list"
+    def test_fund_performance_endpoint_structure(self, fund_performance_response):
+        """Test that /dashboard/fund-performance itself, not just the overview, returns well-formed funds"""
+        assert fund_performance_response.status_code == 200
+        data = _json(fund_performance_response)
+        assert isinstance(data.get("funds"), list), "'funds' should be a list"
         assert "generated_at" in data, "Response should have 'generated_at' timestamp"
+        for fund in data["funds"]:
+            missing = FUND_REQUIRED_FIELDS - fund.keys()
+            assert not missing, f"Fund '{fund.get('fund_name', 'Unknown')}' missing required fields: {sorted(missing)}"
     
-    def test_fund_performance_fund_has_required_fields(self, auth_headers):
+    def test_fund_performance_has_funds_array(self, fund_performance):
+        """Test that fund performance response has funds array"""
+        assert "funds" in fund_performance, "Response should have 'funds' field"
+        assert isinstance(fund_performance["funds"], list), "'funds' should be a list"
+        assert "generated_at" in fund_performance, "Response should have 'generated_at' timestamp"
+    
+    def test_fund_performance_fund_has_required_fields(self, fund_performance):
         """Test that each fund in the response has all required fields"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
+        funds = fund_performance.get("funds", [])
         
         if len(funds) == 0:
             pytest.skip("No funds available to test")
         
-        required_fields = [
-            "fund_id",
-            "fund_name",
-            "target_capital",
-            "deployed_capital",
-            "percent_of_goal",
-            "capital_in_final_stages",
-            "active_investors",
-            "investors_in_deployed",
-            "investors_in_final",
-            "average_investment_size",
-            "days_since_last_close",
-            "alerts",
-            "status"
-        ]
-        
         for fund in funds:
-            for field in required_fields:
-                assert field in fund, f"Fund '{fund.get('fund_name', 'Unknown')}' missing required field: {field}"
+            missing = FUND_REQUIRED_FIELDS - fund.keys()
+            assert not missing, f"Fund '{fund.get('fund_name', 'Unknown')}' missing required fields: {sorted(missing)}"
     
-    def test_fund_performance_alerts_structure(self, auth_headers):
+    def test_fund_performance_alerts_structure(self, fund_performance):
         """Test that alerts have correct structure"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
+        funds = fund_performance.get("funds", [])
         
         for fund in funds:
             alerts = fund.get("alerts", [])
@@ -180,62 +207,39 @@ class TestFundPerformance:
                 assert "message" in alert, "Alert should have 'message' field"
                 
                 # Severity should be one of: critical, warning, info
-                assert alert["severity"] in ["critical", "warning", "info"], \
+                assert alert["severity"] in VALID_SEVERITIES, \
                     f"Invalid severity: {alert['severity']}"
     
-    def test_fund_performance_percent_of_goal_calculation(self, auth_headers):
+    def test_fund_performance_percent_of_goal_calculation(self, fund_performance):
         """Test that percent_of_goal is calculated correctly"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
+        funds = fund_performance.get("funds", [])
         
         for fund in funds:
             target = fund.get("target_capital", 0)
-            deployed = fund.get("deployed_capital", 0)
             percent = fund.get("percent_of_goal", 0)
             
-            if target > 0:
-                expected_percent = (deployed / target) * 100
-                # Allow small floating point differences
-                assert abs(percent - expected_percent) < 0.5, \
-                    f"Fund '{fund.get('fund_name')}': percent_of_goal mismatch. Expected ~{expected_percent:.1f}, got {percent}"
-            else:
+            if target <= 0:
                 assert percent == 0, f"Fund '{fund.get('fund_name')}': percent_of_goal should be 0 when target is 0"
+                continue
+            
+            expected_percent = fund.get("deployed_capital", 0) / target * 100
+            # Allow small rounding differences
+            assert math.isclose(percent, expected_percent, abs_tol=0.5), \
+                f"Fund '{fund.get('fund_name')}': percent_of_goal mismatch. Expected ~{expected_percent:.1f}, got {percent}"
     
-    def test_fund_performance_numeric_fields(self, auth_headers):
+    def test_fund_performance_numeric_fields(self, fund_performance):
         """Test that numeric fields are properly typed"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
-        
-        numeric_fields = [
-            "target_capital",
-            "deployed_capital",
-            "percent_of_goal",
-            "capital_in_final_stages",
-            "active_investors",
-            "investors_in_deployed",
-            "investors_in_final",
-            "average_investment_size"
-        ]
-        
-        for fund in funds:
-            for field in numeric_fields:
-                value = fund.get(field)
-                assert isinstance(value, (int, float)), \
-                    f"Fund '{fund.get('fund_name')}': {field} should be numeric, got {type(value)}"
+        for fund in fund_performance.get("funds", []):
+            bad = {
+                field: type(fund.get(field)).__name__
+                for field in FUND_NUMERIC_FIELDS
+                if not isinstance(fund.get(field), (int, float))
+            }
+            assert not bad, f"Fund '{fund.get('fund_name')}': fields should be numeric, got {bad}"
     
-    def test_fund_performance_days_since_last_close(self, auth_headers):
+    def test_fund_performance_days_since_last_close(self, fund_performance):
         """Test that days_since_last_close is null or non-negative integer"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
+        funds = fund_performance.get("funds", [])
         
         for fund in funds:
             days = fund.get("days_since_last_close")
@@ -245,13 +249,9 @@ class TestFundPerformance:
                 assert days >= 0, \
                     f"Fund '{fund.get('fund_name')}': days_since_last_close should be non-negative"
     
-    def test_fund_performance_sorted_by_deployed_capital(self, auth_headers):
+    def test_fund_performance_sorted_by_deployed_capital(self, fund_performance):
         """Test that funds are sorted by deployed capital descending"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
-        assert response.status_code == 200
-        
-        data = response.json()
-        funds = data.get("funds", [])
+        funds = fund_performance.get("funds", [])
         
         if len(funds) < 2:
             pytest.skip("Need at least 2 funds to test sorting")
@@ -260,40 +260,104 @@ class TestFundPerformance:
         assert deployed_capitals == sorted(deployed_capitals, reverse=True), \
             "Funds should be sorted by deployed_capital descending"
     
-    def test_fund_performance_log_values(self, auth_headers):
-        """Log fund performance values for verification"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance", headers=auth_headers)
+    @pytest.mark.performance
+    def test_fund_performance_response_time_under_threshold(self, overview_response):
+        """Test that the snapshot is built within budget (no per-fund query loop creeping back in)"""
+        # The overview builds the fund performance section unless an earlier request cached it
+        elapsed = overview_response.elapsed.total_seconds()
+        cache = overview_response.headers.get("X-Cache")
+        assert elapsed < FUND_PERFORMANCE_MAX_SECONDS, \
+            f"fund-performance took {elapsed:.3f}s (X-Cache={cache}), budget {FUND_PERFORMANCE_MAX_SECONDS}s"
+    
+    def test_fund_performance_respects_limit(self, http, auth_headers):
+        """Test that limit/offset page through the funds and report where the next page starts"""
+        response = http.get(FUND_PERFORMANCE_URL, headers=auth_headers, params={"limit": 2, "offset": 0})
         assert response.status_code == 200
+        data = _json(response)
         
-        data = response.json()
-        funds = data.get("funds", [])
+        assert len(data["funds"]) <= 2, f"Expected at most 2 funds, got {len(data['funds'])}"
+        assert isinstance(data.get("total"), int), "Paged response should include the total fund count"
+        assert "next_offset" in data, "Paged response should include next_offset"
+        if data["total"] > 2:
+            assert data["next_offset"] == 2
+        else:
+            assert data["next_offset"] is None
+    
+    def test_fund_performance_payload_is_compressed(self, http, auth_headers):
+        """Test that the fund performance payload is gzipped when the client accepts it"""
+        response = http.get(FUND_PERFORMANCE_URL, headers={**auth_headers, "Accept-Encoding": "gzip"})
+        assert response.status_code == 200
         
-        print(f"\n=== Fund Performance Snapshot ({len(funds)} funds) ===")
+        encoding = response.headers.get("Content-Encoding")
+        if encoding is None and len(response.content) < GZIP_MINIMUM_SIZE:
+            pytest.skip(f"Payload is {len(response.content)} bytes, below the compression threshold")
+        assert encoding == "gzip", f"Expected a gzip-encoded payload, got Content-Encoding={encoding}"
+    
+    def test_fund_performance_log_values(self, fund_performance):
+        """Log fund performance values for verification"""
+        if not log.isEnabledFor(logging.DEBUG):
+            return  # skip formatting every fund when nobody is reading the output
+        
+        funds = fund_performance.get("funds", [])
+        lines = [f"=== Fund Performance Snapshot ({len(funds)} funds) ==="]
         for fund in funds:
-            print(f"\nFund: {fund.get('fund_name')}")
-            print(f"  Target Capital: ${fund.get('target_capital', 0):,.2f}")
-            print(f"  Deployed Capital: ${fund.get('deployed_capital', 0):,.2f}")
-            print(f"  % of Goal: {fund.get('percent_of_goal', 0):.1f}%")
-            print(f"  Capital in Final Stages: ${fund.get('capital_in_final_stages', 0):,.2f}")
-            print(f"  Active Investors: {fund.get('active_investors', 0)}")
-            print(f"  Avg Investment Size: ${fund.get('average_investment_size', 0):,.2f}")
-            print(f"  Days Since Last Close: {fund.get('days_since_last_close')}")
-            print(f"  Alerts: {len(fund.get('alerts', []))}")
+            lines.append(f"Fund: {fund.get('fund_name')}")
+            lines.append(f"  Target Capital: ${fund.get('target_capital', 0):,.2f}")
+            lines.append(f"  Deployed Capital: ${fund.get('deployed_capital', 0):,.2f}")
+            lines.append(f"  % of Goal: {fund.get('percent_of_goal', 0):.1f}%")
+            lines.append(f"  Capital in Final Stages: ${fund.get('capital_in_final_stages', 0):,.2f}")
+            lines.append(f"  Active Investors: {fund.get('active_investors', 0)}")
+            lines.append(f"  Avg Investment Size: ${fund.get('average_investment_size', 0):,.2f}")
+            lines.append(f"  Days Since Last Close: {fund.get('days_since_last_close')}")
+            lines.append(f"  Alerts: {len(fund.get('alerts', []))}")
             for alert in fund.get("alerts", []):
-                print(f"    - [{alert.get('severity')}] {alert.get('message')}")
+                lines.append(f"    - [{alert.get('severity')}] {alert.get('message')}")
+        log.debug("\n".join(lines))
+
+class TestDashboardCache:
+    """The server keeps each dashboard aggregate for a short TTL instead of recomputing it per request"""
+    
+    @DASHBOARD_URLS
+    def test_repeat_request_served_from_cache(self, http, auth_headers, url):
+        """Test that a request right after another is answered from the cache"""
+        http.get(url, headers=auth_headers)
+        response = http.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers.get("X-Cache") == "HIT", \
+            f"Expected a cache hit on the repeat request, got X-Cache={response.headers.get('X-Cache')}"
+
+
+@pytest.mark.performance
+class TestDashboardConcurrency:
+    """Load probe: the stats endpoint must stay fast and error-free under concurrent requests"""
+    
+    def test_stats_under_concurrency(self, http, auth_headers):
+        """Test that concurrent stats requests all succeed within the p95 budget"""
+        def timed_get(_):
+            started = time.perf_counter()
+            response = http.get(STATS_URL, headers=auth_headers)
+            return response.status_code, time.perf_counter() - started
+        
+        with ThreadPoolExecutor(max_workers=CONCURRENT_WORKERS) as pool:
+            results = list(pool.map(timed_get, range(CONCURRENT_REQUESTS)))
+        
+        codes = [code for code, _ in results]
+        latencies = [elapsed for _, elapsed in results]
+        assert all(code == 200 for code in codes), f"Non-200 responses under load: {sorted(set(codes))}"
+        
+        p95 = statistics.quantiles(latencies, n=20)[18]
+        log.debug("Stats under load: min %.3fs, avg %.3fs, p95 %.3fs, max %.3fs",
+                  min(latencies), statistics.fmean(latencies), p95, max(latencies))
+        assert p95 < CONCURRENT_P95_MAX_SECONDS, \
+            f"p95 latency {p95:.3f}s over {CONCURRENT_REQUESTS} concurrent requests, budget {CONCURRENT_P95_MAX_SECONDS}s"
 
 
 class TestDashboardUnauthorized:
     """Test unauthorized access to dashboard endpoints"""
     
-    def test_dashboard_stats_requires_auth(self):
-        """Test that dashboard stats requires authentication"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/stats")
-        assert response.status_code in [401, 403], \
-            f"Expected 401/403 without auth, got {response.status_code}"
-    
-    def test_fund_performance_requires_auth(self):
-        """Test that fund performance requires authentication"""
-        response = requests.get(f"{BASE_URL}/api/dashboard/fund-performance")
+    @DASHBOARD_URLS
+    def test_requires_auth(self, http, url):
+        """Test that each dashboard endpoint rejects requests without a token"""
+        response = http.get(url)
         assert response.status_code in [401, 403], \
-            f"Expected 401/403 without auth, got {response.status_code}"
+            f"Expected 401/403 without auth on {url}, got {response.status_code}"
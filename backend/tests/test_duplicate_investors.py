@@ -9,11 +9,12 @@ Tests:
 """
 
 import pytest
-import requests
 import os
 import uuid
 
-BASE_URL = os.environ.get('REACT_APP_BACKEND_URL').rstrip('/')
+pytestmark = pytest.mark.network  # every test here talks to the live backend
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 # Test credentials
 ADMIN_EMAIL = "khaled@alknzventures.com"
@@ -22,12 +23,45 @@ FUND_MANAGER_EMAIL = "mariam@alknzventures.com"
 FUND_MANAGER_PASSWORD = "Mariam123!"
 
 
+@pytest.fixture(scope="class")
+def shared_investor(http, auth_headers, fund_id, cleanup_ids):
+    """One fully populated investor shared by the read-only checks, deleted with the session's other test investors"""
+    response = http.post(
+        f"{BASE_URL}/api/investor-profiles",
+        headers=auth_headers,
+        json={
+            "fund_id": fund_id,
+            "investor_name": f"TEST_AllSections_{uuid.uuid4().hex[:8]}",
+            "investor_type": "Institution",
+            "title": "Mr.",
+            "gender": "Male",
+            "nationality": "American",
+            "job_title": "CEO",
+            "sector": "Technology",
+            "country": "USA",
+            "city": "New York",
+            "wealth": "High Net Worth",
+            "expected_ticket_amount": 500000,
+            "contact_name": "John Doe",
+            "contact_email": "john@example.com",
+            "contact_phone": "+1234567890",
+            "relationship_strength": "warm",
+            "decision_role": "decision_maker",
+            "preferred_intro_path": "direct email"
+        }
+    )
+    assert response.status_code == 200, f"Failed: {response.text}"
+    investor = response.json()
+    cleanup_ids.append(investor["id"])
+    return investor
+
+
 class TestAuthentication:
     """Authentication tests for both Admin and Fund Manager"""
     
-    def test_admin_login(self):
+    def test_admin_login(self, http):
         """Test admin login returns valid token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        response = http.post(f"{BASE_URL}/api/auth/login", json={
             "email": ADMIN_EMAIL,
             "password": ADMIN_PASSWORD
         })
@@ -38,9 +72,9 @@ class TestAuthentication:
         assert data["user"]["role"] == "ADMIN"
         print(f"✓ Admin login successful - role: {data['user']['role']}")
     
-    def test_fund_manager_login(self):
+    def test_fund_manager_login(self, http):
         """Test fund manager login returns valid token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+        response = http.post(f"{BASE_URL}/api/auth/login", json={
             "email": FUND_MANAGER_EMAIL,
             "password": FUND_MANAGER_PASSWORD
         })
@@ -55,33 +89,11 @@ class TestAuthentication:
 class TestDuplicateInvestorDetection:
     """Tests for GET /api/admin/duplicate-investors endpoint"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_token(self):
-        """Get fund manager authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Fund Manager authentication failed")
-    
-    def test_get_duplicate_investors_admin_access(self, admin_token):
+    def test_get_duplicate_investors_admin_access(self, http, auth_headers):
         """Admin can access duplicate investors endpoint"""
-        response = requests.get(
+        response = http.get(
             f"{BASE_URL}/api/admin/duplicate-investors",
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers=auth_headers
         )
         assert response.status_code == 200, f"Failed: {response.text}"
         data = response.json()
@@ -96,26 +108,26 @@ class TestDuplicateInvestorDetection:
         print(f"  - Total duplicate groups: {data['total_duplicate_groups']}")
         print(f"  - Total duplicate records: {data['total_duplicate_records']}")
     
-    def test_get_duplicate_investors_fund_manager_denied(self, fund_manager_token):
+    def test_get_duplicate_investors_fund_manager_denied(self, http, fund_manager_headers):
         """Fund Manager cannot access duplicate investors endpoint (admin only)"""
-        response = requests.get(
+        response = http.get(
             f"{BASE_URL}/api/admin/duplicate-investors",
-            headers={"Authorization": f"Bearer {fund_manager_token}"}
+            headers=fund_manager_headers
         )
         assert response.status_code == 403, f"Expected 403, got {response.status_code}"
         print("✓ Fund Manager correctly denied access to duplicate investors")
     
-    def test_get_duplicate_investors_unauthenticated(self):
+    def test_get_duplicate_investors_unauthenticated(self, http):
         """Unauthenticated request returns 401/403"""
-        response = requests.get(f"{BASE_URL}/api/admin/duplicate-investors")
+        response = http.get(f"{BASE_URL}/api/admin/duplicate-investors")
         assert response.status_code in [401, 403], f"Expected 401/403, got {response.status_code}"
         print("✓ Unauthenticated request correctly denied")
     
-    def test_duplicate_group_structure(self, admin_token):
+    def test_duplicate_group_structure(self, http, auth_headers):
         """Verify duplicate group data structure"""
-        response = requests.get(
+        response = http.get(
             f"{BASE_URL}/api/admin/duplicate-investors",
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers=auth_headers
         )
         assert response.status_code == 200
         data = response.json()
@@ -149,33 +161,11 @@ class TestDuplicateInvestorDetection:
 class TestMergeInvestors:
     """Tests for POST /api/admin/merge-investors endpoint"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_token(self):
-        """Get fund manager authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Fund Manager authentication failed")
-    
-    def test_merge_investors_fund_manager_denied(self, fund_manager_token):
+    def test_merge_investors_fund_manager_denied(self, http, fund_manager_headers):
         """Fund Manager cannot merge investors (admin only)"""
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/api/admin/merge-investors",
-            headers={"Authorization": f"Bearer {fund_manager_token}"},
+            headers=fund_manager_headers,
             json={
                 "keep_investor_id": "fake-id",
                 "delete_investor_ids": ["fake-id-2"]
@@ -184,11 +174,11 @@ class TestMergeInvestors:
         assert response.status_code == 403, f"Expected 403, got {response.status_code}"
         print("✓ Fund Manager correctly denied merge access")
     
-    def test_merge_investors_invalid_keep_id(self, admin_token):
+    def test_merge_investors_invalid_keep_id(self, http, auth_headers):
         """Merge with invalid keep_investor_id returns 404"""
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/api/admin/merge-investors",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "keep_investor_id": "non-existent-id",
                 "delete_investor_ids": ["another-fake-id"]
@@ -201,42 +191,20 @@ class TestMergeInvestors:
 class TestAdminDeleteInvestor:
     """Tests for DELETE /api/admin/investor/{id} endpoint"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_token(self):
-        """Get fund manager authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Fund Manager authentication failed")
-    
-    def test_delete_investor_fund_manager_denied(self, fund_manager_token):
+    def test_delete_investor_fund_manager_denied(self, http, fund_manager_headers):
         """Fund Manager cannot delete investor via admin endpoint"""
-        response = requests.delete(
+        response = http.delete(
             f"{BASE_URL}/api/admin/investor/fake-id",
-            headers={"Authorization": f"Bearer {fund_manager_token}"}
+            headers=fund_manager_headers
         )
         assert response.status_code == 403, f"Expected 403, got {response.status_code}"
         print("✓ Fund Manager correctly denied admin delete access")
     
-    def test_delete_investor_not_found(self, admin_token):
+    def test_delete_investor_not_found(self, http, auth_headers):
         """Delete non-existent investor returns 404"""
-        response = requests.delete(
+        response = http.delete(
             f"{BASE_URL}/api/admin/investor/non-existent-id",
-            headers={"Authorization": f"Bearer {admin_token}"}
+            headers=auth_headers
         )
         assert response.status_code == 404, f"Expected 404, got {response.status_code}"
         print("✓ Delete non-existent investor correctly returns 404")
@@ -245,48 +213,14 @@ class TestAdminDeleteInvestor:
 class TestDuplicatePrevention:
     """Tests for duplicate prevention on investor creation"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_token(self):
-        """Get fund manager authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Fund Manager authentication failed")
-    
-    @pytest.fixture
-    def get_fund_id(self, admin_token):
-        """Get a valid fund ID for testing"""
-        response = requests.get(
-            f"{BASE_URL}/api/funds",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        if response.status_code == 200 and len(response.json()) > 0:
-            return response.json()[0]["id"]
-        pytest.skip("No funds available for testing")
-    
-    def test_create_investor_duplicate_name_same_fund(self, admin_token, get_fund_id):
+    def test_create_investor_duplicate_name_same_fund(self, http, auth_headers, fund_id, cleanup_ids):
         """Creating investor with same name in same fund should fail"""
-        fund_id = get_fund_id
         unique_name = f"TEST_DuplicateCheck_{uuid.uuid4().hex[:8]}"
         
         # Create first investor
-        response1 = requests.post(
+        response1 = http.post(
             f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "fund_id": fund_id,
                 "investor_name": unique_name,
@@ -294,13 +228,13 @@ class TestDuplicatePrevention:
             }
         )
         assert response1.status_code == 200, f"First investor creation failed: {response1.text}"
-        created_id = response1.json().get("id")
+        cleanup_ids.append(response1.json().get("id"))
         print(f"✓ First investor created: {unique_name}")
         
         # Try to create duplicate
-        response2 = requests.post(
+        response2 = http.post(
             f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "fund_id": fund_id,
                 "investor_name": unique_name,
@@ -310,23 +244,15 @@ class TestDuplicatePrevention:
         assert response2.status_code == 400, f"Expected 400 for duplicate, got {response2.status_code}"
         assert "already exists" in response2.json().get("detail", "").lower()
         print(f"✓ Duplicate creation correctly blocked")
-        
-        # Cleanup - delete the test investor
-        requests.delete(
-            f"{BASE_URL}/api/admin/investor/{created_id}",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        print(f"✓ Test investor cleaned up")
     
-    def test_create_investor_duplicate_name_case_insensitive(self, admin_token, get_fund_id):
+    def test_create_investor_duplicate_name_case_insensitive(self, http, auth_headers, fund_id, cleanup_ids):
         """Duplicate check should be case-insensitive"""
-        fund_id = get_fund_id
         unique_name = f"TEST_CaseCheck_{uuid.uuid4().hex[:8]}"
         
         # Create first investor with lowercase
-        response1 = requests.post(
+        response1 = http.post(
             f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "fund_id": fund_id,
                 "investor_name": unique_name.lower(),
@@ -334,12 +260,12 @@ class TestDuplicatePrevention:
             }
         )
         assert response1.status_code == 200, f"First investor creation failed: {response1.text}"
-        created_id = response1.json().get("id")
+        cleanup_ids.append(response1.json().get("id"))
         
         # Try to create with uppercase - should fail
-        response2 = requests.post(
+        response2 = http.post(
             f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "fund_id": fund_id,
                 "investor_name": unique_name.upper(),
@@ -348,66 +274,22 @@ class TestDuplicatePrevention:
         )
         assert response2.status_code == 400, f"Expected 400 for case-insensitive duplicate, got {response2.status_code}"
         print(f"✓ Case-insensitive duplicate check working")
-        
-        # Cleanup
-        requests.delete(
-            f"{BASE_URL}/api/admin/investor/{created_id}",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
 
 
 class TestFundAssignmentLogic:
     """Tests for fund assignment logic - Fund Managers only see assigned funds"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_token(self):
-        """Get fund manager authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": FUND_MANAGER_EMAIL,
-            "password": FUND_MANAGER_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Fund Manager authentication failed")
-    
-    @pytest.fixture
-    def fund_manager_user(self, fund_manager_token):
-        """Get fund manager user details"""
-        response = requests.get(
-            f"{BASE_URL}/api/auth/me",
-            headers={"Authorization": f"Bearer {fund_manager_token}"}
-        )
-        if response.status_code == 200:
-            return response.json()
-        pytest.skip("Could not get fund manager user details")
-    
-    def test_admin_sees_all_funds(self, admin_token):
+    def test_admin_sees_all_funds(self, all_funds_admin):
         """Admin should see all funds"""
-        response = requests.get(
-            f"{BASE_URL}/api/funds",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        assert response.status_code == 200, f"Failed: {response.text}"
-        funds = response.json()
+        funds = all_funds_admin
         print(f"✓ Admin sees {len(funds)} funds")
         assert len(funds) >= 0  # Admin sees all funds
     
-    def test_fund_manager_sees_only_assigned_funds(self, fund_manager_token, fund_manager_user):
+    def test_fund_manager_sees_only_assigned_funds(self, http, fund_manager_headers, fund_manager_user):
         """Fund Manager should only see assigned funds"""
-        response = requests.get(
+        response = http.get(
             f"{BASE_URL}/api/funds",
-            headers={"Authorization": f"Bearer {fund_manager_token}"}
+            headers=fund_manager_headers
         )
         assert response.status_code == 200, f"Failed: {response.text}"
         funds = response.json()
@@ -421,29 +303,22 @@ class TestFundAssignmentLogic:
         print(f"✓ Fund Manager sees {len(funds)} funds (assigned: {len(assigned_fund_ids)})")
         print(f"  - Assigned fund IDs: {assigned_fund_ids}")
     
-    def test_fund_manager_cannot_access_unassigned_fund(self, fund_manager_token, fund_manager_user, admin_token):
+    def test_fund_manager_cannot_access_unassigned_fund(self, http, fund_manager_headers, fund_manager_user, all_funds_admin):
         """Fund Manager cannot access fund not assigned to them"""
-        # Get all funds as admin
-        admin_response = requests.get(
-            f"{BASE_URL}/api/funds",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        all_funds = admin_response.json()
-        
         assigned_fund_ids = fund_manager_user.get("assigned_funds", [])
         
         # Find an unassigned fund
         unassigned_fund = None
-        for fund in all_funds:
+        for fund in all_funds_admin:
             if fund["id"] not in assigned_fund_ids:
                 unassigned_fund = fund
                 break
         
         if unassigned_fund:
             # Try to access unassigned fund
-            response = requests.get(
+            response = http.get(
                 f"{BASE_URL}/api/funds/{unassigned_fund['id']}",
-                headers={"Authorization": f"Bearer {fund_manager_token}"}
+                headers=fund_manager_headers
             )
             assert response.status_code == 403, f"Expected 403, got {response.status_code}"
             print(f"✓ Fund Manager correctly denied access to unassigned fund: {unassigned_fund['name']}")
@@ -454,73 +329,26 @@ class TestFundAssignmentLogic:
 class TestInvestorProfileEndpoints:
     """Tests for investor profile CRUD with relationship intelligence fields"""
     
-    @pytest.fixture
-    def admin_token(self):
-        """Get admin authentication token"""
-        response = requests.post(f"{BASE_URL}/api/auth/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if response.status_code == 200:
-            return response.json().get("token")
-        pytest.skip("Admin authentication failed")
-    
-    @pytest.fixture
-    def get_fund_id(self, admin_token):
-        """Get a valid fund ID for testing"""
-        response = requests.get(
-            f"{BASE_URL}/api/funds",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-        if response.status_code == 200 and len(response.json()) > 0:
-            return response.json()[0]["id"]
-        pytest.skip("No funds available for testing")
-    
-    def test_create_investor_with_relationship_fields(self, admin_token, get_fund_id):
+    def test_create_investor_with_relationship_fields(self, shared_investor):
         """Create investor with relationship intelligence fields"""
-        fund_id = get_fund_id
-        unique_name = f"TEST_RelFields_{uuid.uuid4().hex[:8]}"
-        
-        response = requests.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
-            json={
-                "fund_id": fund_id,
-                "investor_name": unique_name,
-                "investor_type": "Family Office",
-                "relationship_strength": "warm",
-                "decision_role": "decision_maker",
-                "preferred_intro_path": "via GP referral"
-            }
-        )
-        assert response.status_code == 200, f"Failed: {response.text}"
-        data = response.json()
-        
         # Verify relationship fields saved
-        assert data.get("relationship_strength") == "warm"
-        assert data.get("decision_role") == "decision_maker"
-        assert data.get("preferred_intro_path") == "via GP referral"
+        assert shared_investor.get("relationship_strength") == "warm"
+        assert shared_investor.get("decision_role") == "decision_maker"
+        assert shared_investor.get("preferred_intro_path") == "direct email"
         
         print(f"✓ Investor created with relationship fields")
-        print(f"  - relationship_strength: {data.get('relationship_strength')}")
-        print(f"  - decision_role: {data.get('decision_role')}")
-        print(f"  - preferred_intro_path: {data.get('preferred_intro_path')}")
-        
-        # Cleanup
-        requests.delete(
-            f"{BASE_URL}/api/admin/investor/{data['id']}",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
+        print(f"  - relationship_strength: {shared_investor.get('relationship_strength')}")
+        print(f"  - decision_role: {shared_investor.get('decision_role')}")
+        print(f"  - preferred_intro_path: {shared_investor.get('preferred_intro_path')}")
     
-    def test_update_investor_relationship_fields(self, admin_token, get_fund_id):
+    def test_update_investor_relationship_fields(self, http, auth_headers, fund_id, cleanup_ids):
         """Update investor relationship intelligence fields"""
-        fund_id = get_fund_id
         unique_name = f"TEST_UpdateRel_{uuid.uuid4().hex[:8]}"
         
         # Create investor
-        create_response = requests.post(
+        create_response = http.post(
             f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "fund_id": fund_id,
                 "investor_name": unique_name,
@@ -531,11 +359,12 @@ class TestInvestorProfileEndpoints:
         )
         assert create_response.status_code == 200
         investor_id = create_response.json()["id"]
+        cleanup_ids.append(investor_id)
         
         # Update relationship fields
-        update_response = requests.put(
+        update_response = http.put(
             f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {admin_token}"},
+            headers=auth_headers,
             json={
                 "relationship_strength": "direct",
                 "decision_role": "influencer",
@@ -551,56 +380,18 @@ class TestInvestorProfileEndpoints:
         assert data.get("preferred_intro_path") == "assistant email first"
         
         print(f"✓ Investor relationship fields updated successfully")
-        
-        # Cleanup
-        requests.delete(
-            f"{BASE_URL}/api/admin/investor/{investor_id}",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
     
-    def test_get_investor_profile_includes_all_sections(self, admin_token, get_fund_id):
+    def test_get_investor_profile_includes_all_sections(self, http, auth_headers, shared_investor):
         """Get investor profile includes all required sections"""
-        fund_id = get_fund_id
-        unique_name = f"TEST_AllSections_{uuid.uuid4().hex[:8]}"
-        
-        # Create investor with all fields
-        create_response = requests.post(
-            f"{BASE_URL}/api/investor-profiles",
-            headers={"Authorization": f"Bearer {admin_token}"},
-            json={
-                "fund_id": fund_id,
-                "investor_name": unique_name,
-                "investor_type": "Institution",
-                "title": "Mr.",
-                "gender": "Male",
-                "nationality": "American",
-                "job_title": "CEO",
-                "sector": "Technology",
-                "country": "USA",
-                "city": "New York",
-                "wealth": "High Net Worth",
-                "expected_ticket_amount": 500000,
-                "contact_name": "John Doe",
-                "contact_email": "john@example.com",
-                "contact_phone": "+1234567890",
-                "relationship_strength": "warm",
-                "decision_role": "decision_maker",
-                "preferred_intro_path": "direct email"
-            }
-        )
-        assert create_response.status_code == 200
-        investor_id = create_response.json()["id"]
-        
-        # Get investor profile
-        get_response = requests.get(
-            f"{BASE_URL}/api/investor-profiles/{investor_id}",
-            headers={"Authorization": f"Bearer {admin_token}"}
+        get_response = http.get(
+            f"{BASE_URL}/api/investor-profiles/{shared_investor['id']}",
+            headers=auth_headers
         )
         assert get_response.status_code == 200
         data = get_response.json()
         
         # Verify Investment Identity fields
-        assert data.get("investor_name") == unique_name
+        assert data.get("investor_name") == shared_investor["investor_name"]
         assert data.get("investor_type") == "Institution"
         assert data.get("title") == "Mr."
         assert data.get("job_title") == "CEO"
@@ -619,13 +410,6 @@ class TestInvestorProfileEndpoints:
         assert data.get("preferred_intro_path") == "direct email"
         
         print(f"✓ Investor profile includes all sections")
-        
-        # Cleanup
-        requests.delete(
-            f"{BASE_URL}/api/admin/investor/{investor_id}",
-            headers={"Authorization": f"Bearer {admin_token}"}
-        )
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -8,6 +8,8 @@ import pytest
 import requests
 import os
 
+pytestmark = pytest.mark.network  # every test here talks to the live backend
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 # Test credentials
@@ -45,30 +47,6 @@ class TestAuth:
         print(f"✓ Fund Manager login successful: {data['user']['email']}")
 
 
-@pytest.fixture
-def admin_token():
-    """Get admin authentication token"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json()["token"]
-    pytest.skip("Admin authentication failed")
-
-
-@pytest.fixture
-def fund_manager_token():
-    """Get fund manager authentication token"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": FUND_MANAGER_EMAIL,
-        "password": FUND_MANAGER_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json()["token"]
-    pytest.skip("Fund Manager authentication failed")
-
-
 @pytest.fixture
 def admin_headers(admin_token):
     """Headers with admin auth token"""
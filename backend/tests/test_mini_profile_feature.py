@@ -6,6 +6,8 @@ import pytest
 import requests
 import os
 
+pytestmark = pytest.mark.network  # every test here talks to the live backend
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 # Test credentials
@@ -46,35 +48,11 @@ class TestAuthentication:
 
 
 @pytest.fixture(scope="module")
-def fm_token():
-    """Get Fund Manager auth token"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": FUND_MANAGER_EMAIL,
-        "password": FUND_MANAGER_PASSWORD
-    })
-    if response.status_code != 200:
-        pytest.skip("Fund Manager authentication failed")
-    return response.json()["token"]
-
-
-@pytest.fixture(scope="module")
-def admin_token():
-    """Get Admin auth token"""
-    response = requests.post(f"{BASE_URL}/api/auth/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code != 200:
-        pytest.skip("Admin authentication failed")
-    return response.json()["token"]
-
-
-@pytest.fixture(scope="module")
-def fund_id(fm_token):
+def fund_id(fund_manager_token):
     """Get first assigned fund ID"""
     response = requests.get(
         f"{BASE_URL}/api/my-funds",
-        headers={"Authorization": f"Bearer {fm_token}"}
+        headers={"Authorization": f"Bearer {fund_manager_token}"}
     )
     if response.status_code != 200 or not response.json():
         pytest.skip("No funds assigned to Fund Manager")
@@ -84,11 +62,11 @@ def fund_id(fm_token):
 class TestPipelineStages:
     """Test Pipeline Stages API - 12 lanes for Kanban board"""
     
-    def test_get_pipeline_stages(self, fm_token, fund_id):
+    def test_get_pipeline_stages(self, fund_manager_token, fund_id):
         """Test getting pipeline stages for a fund - should return 12 stages"""
         response = requests.get(
             f"{BASE_URL}/api/funds/{fund_id}/pipeline-stages",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to get stages: {response.text}"
         stages = response.json()
@@ -108,11 +86,11 @@ class TestPipelineStages:
         
         print(f"✓ Pipeline has {len(stages)} stages: {', '.join(stage_names)}")
     
-    def test_stages_have_required_fields(self, fm_token, fund_id):
+    def test_stages_have_required_fields(self, fund_manager_token, fund_id):
         """Test that each stage has required fields"""
         response = requests.get(
             f"{BASE_URL}/api/funds/{fund_id}/pipeline-stages",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         stages = response.json()
         
@@ -128,11 +106,11 @@ class TestPipelineStages:
 class TestInvestorProfilesWithPipeline:
     """Test Investor Profiles with Pipeline data - for card display"""
     
-    def test_get_investor_profiles_with_pipeline(self, fm_token, fund_id):
+    def test_get_investor_profiles_with_pipeline(self, fund_manager_token, fund_id):
         """Test getting investor profiles with pipeline status"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to get profiles: {response.text}"
         profiles = response.json()
@@ -156,11 +134,11 @@ class TestInvestorProfilesWithPipeline:
             
             print(f"✓ Profile has all required fields for card display")
     
-    def test_investor_card_data_fields(self, fm_token, fund_id):
+    def test_investor_card_data_fields(self, fund_manager_token, fund_id):
         """Test that investor profiles have all fields needed for card display"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         
@@ -188,11 +166,11 @@ class TestInvestorProfilesWithPipeline:
 class TestInvestorMiniProfile:
     """Test Mini Profile data - Quick Identity, Contact, Investment Context, Pipeline Context"""
     
-    def test_mini_profile_quick_identity_fields(self, fm_token, fund_id):
+    def test_mini_profile_quick_identity_fields(self, fund_manager_token, fund_id):
         """Test Quick Identity section fields"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         
@@ -205,11 +183,11 @@ class TestInvestorMiniProfile:
         
         print(f"✓ Quick Identity fields present in all profiles")
     
-    def test_mini_profile_contact_fields(self, fm_token, fund_id):
+    def test_mini_profile_contact_fields(self, fund_manager_token, fund_id):
         """Test Contact & Relationship section fields - verify API returns investor data"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         
@@ -223,11 +201,11 @@ class TestInvestorMiniProfile:
         
         print(f"✓ {len(profiles)} profiles retrieved with contact data available")
     
-    def test_mini_profile_investment_context_fields(self, fm_token, fund_id):
+    def test_mini_profile_investment_context_fields(self, fund_manager_token, fund_id):
         """Test Investment Context section fields"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         
@@ -244,11 +222,11 @@ class TestInvestorMiniProfile:
         
         print(f"✓ Investment Context fields present in all profiles")
     
-    def test_mini_profile_pipeline_context_fields(self, fm_token, fund_id):
+    def test_mini_profile_pipeline_context_fields(self, fund_manager_token, fund_id):
         """Test Pipeline Context section fields"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         
@@ -270,22 +248,22 @@ class TestInvestorNotes:
     """Test Investor Notes API - for mini profile notes section"""
     
     @pytest.fixture
-    def test_investor_id(self, fm_token, fund_id):
+    def test_investor_id(self, fund_manager_token, fund_id):
         """Get a test investor ID"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         if not profiles:
             pytest.skip("No investors available for testing")
         return profiles[0]["id"]
     
-    def test_get_investor_notes(self, fm_token, test_investor_id):
+    def test_get_investor_notes(self, fund_manager_token, test_investor_id):
         """Test getting notes for an investor"""
         response = requests.get(
             f"{BASE_URL}/api/investor-notes/{test_investor_id}?limit=5",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to get notes: {response.text}"
         notes = response.json()
@@ -302,14 +280,14 @@ class TestInvestorNotes:
             assert "created_at" in note, "Note missing 'created_at'"
             print(f"✓ Note structure is correct")
     
-    def test_create_investor_note(self, fm_token, test_investor_id):
+    def test_create_investor_note(self, fund_manager_token, test_investor_id):
         """Test creating a new note"""
         note_content = "TEST_NOTE: This is a test note from automated testing"
         
         response = requests.post(
             f"{BASE_URL}/api/investor-notes",
             json={"investor_id": test_investor_id, "content": note_content},
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to create note: {response.text}"
         
@@ -324,7 +302,7 @@ class TestInvestorNotes:
         # Verify note appears in list
         get_response = requests.get(
             f"{BASE_URL}/api/investor-notes/{test_investor_id}?limit=5",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         notes = get_response.json()
         note_ids = [n["id"] for n in notes]
@@ -335,32 +313,32 @@ class TestInvestorNotes:
         # Cleanup - delete the test note
         delete_response = requests.delete(
             f"{BASE_URL}/api/investor-notes/{note['id']}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert delete_response.status_code == 200, f"Failed to delete note: {delete_response.text}"
         print(f"✓ Test note cleaned up")
     
-    def test_delete_investor_note(self, fm_token, test_investor_id):
+    def test_delete_investor_note(self, fund_manager_token, test_investor_id):
         """Test deleting a note"""
         # First create a note to delete
         response = requests.post(
             f"{BASE_URL}/api/investor-notes",
             json={"investor_id": test_investor_id, "content": "TEST_NOTE: To be deleted"},
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         note_id = response.json()["id"]
         
         # Delete the note
         delete_response = requests.delete(
             f"{BASE_URL}/api/investor-notes/{note_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert delete_response.status_code == 200, f"Failed to delete note: {delete_response.text}"
         
         # Verify note is deleted
         get_response = requests.get(
             f"{BASE_URL}/api/investor-notes/{test_investor_id}?limit=10",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         notes = get_response.json()
         note_ids = [n["id"] for n in notes]
@@ -373,11 +351,11 @@ class TestPipelineMovement:
     """Test moving investors in pipeline - for drag and drop"""
     
     @pytest.fixture
-    def test_investor_id(self, fm_token, fund_id):
+    def test_investor_id(self, fund_manager_token, fund_id):
         """Get a test investor ID"""
         response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = response.json()
         if not profiles:
@@ -385,16 +363,16 @@ class TestPipelineMovement:
         return profiles[0]["id"]
     
     @pytest.fixture
-    def stage_ids(self, fm_token, fund_id):
+    def stage_ids(self, fund_manager_token, fund_id):
         """Get stage IDs"""
         response = requests.get(
             f"{BASE_URL}/api/funds/{fund_id}/pipeline-stages",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         stages = response.json()
         return {s["name"]: s["id"] for s in stages}
     
-    def test_move_investor_to_stage(self, fm_token, fund_id, test_investor_id, stage_ids):
+    def test_move_investor_to_stage(self, fund_manager_token, fund_id, test_investor_id, stage_ids):
         """Test moving an investor to a different stage"""
         # Move to "Intro Email" stage
         target_stage = "Intro Email"
@@ -405,7 +383,7 @@ class TestPipelineMovement:
         
         response = requests.put(
             f"{BASE_URL}/api/investor-pipeline/move/{test_investor_id}?fund_id={fund_id}&new_stage_id={target_stage_id}&new_position=0",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to move investor: {response.text}"
         
@@ -418,7 +396,7 @@ class TestPipelineMovement:
         # Verify the move
         verify_response = requests.get(
             f"{BASE_URL}/api/investor-profiles-with-pipeline/fund/{fund_id}",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         profiles = verify_response.json()
         investor = next((p for p in profiles if p["id"] == test_investor_id), None)
@@ -433,11 +411,11 @@ class TestPipelineMovement:
 class TestTeamMembers:
     """Test Team Members API - for ALKNZ POC display"""
     
-    def test_get_team_members(self, fm_token):
+    def test_get_team_members(self, fund_manager_token):
         """Test getting team members for POC dropdown"""
         response = requests.get(
             f"{BASE_URL}/api/team-members",
-            headers={"Authorization": f"Bearer {fm_token}"}
+            headers={"Authorization": f"Bearer {fund_manager_token}"}
         )
         assert response.status_code == 200, f"Failed to get team members: {response.text}"
         
@@ -7,6 +7,8 @@ import requests
 import os
 from datetime import datetime, timedelta
 
+pytestmark = pytest.mark.network  # every test here talks to the live backend
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 # Test credentials
@@ -614,53 +614,40 @@ const ImportWizard = ({
         })
         .filter(inv => inv.investor_name?.trim());
       
-      // Import investors in batches to prevent overwhelming the browser/server
+      // Send the sheet to the bulk endpoint in chunks; the server skips and reports bad rows
       let successCount = 0;
       let errorCount = 0;
       const errors = [];
-      const BATCH_SIZE = 5; // Process 5 at a time
+      const CHUNK_SIZE = 500; // Server accepts up to 1000 rows per request
       
-      for (let i = 0; i < investorsToCreate.length; i += BATCH_SIZE) {
-        const batch = investorsToCreate.slice(i, i + BATCH_SIZE);
-        
-        // Process batch in parallel
-        const results = await Promise.allSettled(
-          batch.map(async (investor) => {
-            const res = await fetch(`${API_URL}/api/investor-profiles`, {
-              method: 'POST',
-              headers: {
-                'Authorization': `Bearer ${token}`,
-                'Content-Type': 'application/json'
-              },
-              body: JSON.stringify({
-                ...investor,
-                fund_id: selectedFund.id,
-                office_id: selectedFund.office_id || null
-              })
-            });
-            
-            if (!res.ok) {
-              const data = await res.json();
-              throw new Error(data.detail || 'Failed to create');
-            }
-            return investor.investor_name;
+      for (let i = 0; i < investorsToCreate.length; i += CHUNK_SIZE) {
+        const chunk = investorsToCreate.slice(i, i + CHUNK_SIZE);
+        const res = await fetch(`${API_URL}/api/investor-profiles/bulk`, {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${token}`,
+            'Content-Type': 'application/json'
+          },
+          body: JSON.stringify({
+            items: chunk.map(investor => ({
+              ...investor,
+              fund_id: selectedFund.id,
+              office_id: selectedFund.office_id || null
+            }))
           })
-        );
-        
-        // Count results
-        results.forEach((result, idx) => {
-          if (result.status === 'fulfilled') {
-            successCount++;
-          } else {
-            errorCount++;
-            errors.push(`${batch[idx].investor_name}: ${result.reason?.message || 'Unknown error'}`);
-          }
         });
         
-        // Small delay between batches to prevent overwhelming
-        if (i + BATCH_SIZE < investorsToCreate.length) {
-          await new Promise(resolve => setTimeout(resolve, 100));
+        if (!res.ok) {
+          const data = await res.json().catch(() => ({}));
+          errorCount += chunk.length;
+          errors.push(data.detail || 'Failed to create');
+          continue;
         }
+        
+        const data = await res.json();
+        successCount += data.created;
+        errorCount += data.skipped.length;
+        data.skipped.forEach(s => errors.push(`${s.investor_name}: ${s.detail}`));
       }
       
       if (successCount > 0) {
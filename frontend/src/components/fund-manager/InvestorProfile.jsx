@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useRef, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import {
   User,
@@ -39,18 +39,54 @@ import { EvidenceBlock } from './EvidenceBlock';
 // ─── Persona Match Panel ─────────────────────────────────────────────────────
 function PersonaMatchPanel({ investor, selectedFund, token, API_URL }) {
   const fundId = selectedFund?.id;
-  const { personas, matchInvestor } = usePersonaData(fundId, token, API_URL);
+  const { personas, matchInvestor, getMatchJob } = usePersonaData(fundId, token, API_URL);
   const [matches, setMatches] = useState([]);
   const [loading, setLoading] = useState(false);
   const [method, setMethod] = useState('');
+  const [aiPending, setAiPending] = useState(false);
+  // Id of the job currently being polled; a re-run or unmount clears it so stale polls stop
+  const activeJobRef = useRef(null);
+
+  useEffect(() => () => { activeJobRef.current = null; }, []);
+
+  // Rule-based scores come back immediately; AI scores arrive via a background job
+  const pollMatchJob = async (jobId) => {
+    activeJobRef.current = jobId;
+    setAiPending(true);
+    try {
+      for (let attempt = 0; attempt < 30; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        if (activeJobRef.current !== jobId) return;
+        const job = await getMatchJob(jobId);
+        if (activeJobRef.current !== jobId) return;
+        if (job.status === 'completed') {
+          setMatches(job.matches || []);
+          setMethod(job.method || 'ai');
+          return;
+        }
+        if (job.status === 'failed') return;
+      }
+    } catch (err) {
+      // Rule-based scores are already on screen; a failed poll just leaves them there
+    } finally {
+      if (activeJobRef.current === jobId) {
+        activeJobRef.current = null;
+        setAiPending(false);
+      }
+    }
+  };
 
   const handleRun = async () => {
     if (!investor?.id) return;
     setLoading(true);
+    activeJobRef.current = null;
+    setAiPending(false);
     try {
       const result = await matchInvestor(investor.id);
       setMatches(result.matches || []);
       setMethod(result.method || '');
+      // Don't hold the spinner for the AI job; its scores replace these when ready
+      if (result.job_id) pollMatchJob(result.job_id);
     } catch (err) {
       toast.error('Failed to run persona analysis');
     } finally {
@@ -82,6 +118,7 @@ function PersonaMatchPanel({ investor, selectedFund, token, API_URL }) {
             Score this investor against the fund's {personas.length} defined persona{personas.length !== 1 ? 's' : ''}.
             {method === 'ai' && <span className="text-[#00A3FF] ml-1">· AI scored</span>}
             {method === 'rule_based' && <span className="text-[#94A3B8] ml-1">· Rule-based</span>}
+            {aiPending && <span className="text-[#94A3B8] ml-1">· AI scoring in progress…</span>}
           </p>
         </div>
         <button
@@ -51,6 +51,11 @@ export const usePersonaData = (fundId, token, API_URL) => {
     return res.data;
   };
 
+  const getMatchJob = async (jobId) => {
+    const res = await axios.get(`${API_URL}/api/funds/${fundId}/personas/match/${jobId}`, { headers: authHeader });
+    return res.data;
+  };
+
   const suggestPersonas = async () => {
     const res = await axios.post(`${API_URL}/api/funds/${fundId}/personas/suggest`, {}, { headers: authHeader });
     return res.data;
@@ -106,6 +111,7 @@ export const usePersonaData = (fundId, token, API_URL) => {
     updatePersona,
     deletePersona,
     matchInvestor,
+    getMatchJob,
     suggestPersonas,
     scoreInvestorClientSide,
   };
@@ -133,11 +133,9 @@ const Dashboard = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [statsRes, perfRes, intelRes, healthRes] = await Promise.all([
-          axios.get(`${API_URL}/api/dashboard/stats`, {
-            headers: { Authorization: `Bearer ${token}` }
-          }),
-          axios.get(`${API_URL}/api/dashboard/fund-performance`, {
+        const [overviewRes, intelRes, healthRes] = await Promise.all([
+          // Stats and fund performance come from one overview request
+          axios.get(`${API_URL}/api/dashboard/overview`, {
             headers: { Authorization: `Bearer ${token}` }
           }),
           axios.get(`${API_URL}/api/dashboard/investor-intelligence`, {
@@ -147,8 +145,8 @@ const Dashboard = () => {
             headers: { Authorization: `Bearer ${token}` }
           })
         ]);
-        setStats(statsRes.data);
-        setFundPerformance(perfRes.data.funds || []);
+        setStats(overviewRes.data.stats);
+        setFundPerformance(overviewRes.data.fund_performance.funds || []);
         setInvestorIntelligence(intelRes.data);
         setExecutionHealth(healthRes.data);
       } catch (error) {
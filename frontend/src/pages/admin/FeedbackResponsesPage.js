@@ -11,6 +11,8 @@ import { Input } from '@/components/ui/input';
 
 // ─── Helpers ─────────────────────────────────────────────────────────────────
 
+const PAGE_SIZE = 50;
+
 const formatDate = (iso) => {
   if (!iso) return '—';
   return new Date(iso).toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
@@ -167,27 +169,17 @@ const ResponseDetail = ({ response, onClose }) => (
 
 // ─── Stats bar ────────────────────────────────────────────────────────────────
 
-const StatsBar = ({ responses }) => {
-  const total = responses.length;
-  const withScore = responses.filter(r => r.s2_intuitiveness);
-  const avgScore = withScore.length > 0
-    ? (withScore.reduce((s, r) => s + r.s2_intuitiveness, 0) / withScore.length).toFixed(1)
-    : null;
-
-  const roleCounts = responses.reduce((acc, r) => {
-    if (r.s1_role) acc[r.s1_role] = (acc[r.s1_role] || 0) + 1;
-    return acc;
-  }, {});
-  const topRole = Object.entries(roleCounts).sort((a, b) => b[1] - a[1])[0];
-
-  const wantAI = responses.filter(r => r.s9_ai_features?.length > 0).length;
+const StatsBar = ({ stats }) => {
+  // Computed server-side over every response, not just the pages loaded so far
+  const { total, avg_intuitiveness: avgScore, want_ai: wantAI } = stats;
+  const topRole = stats.roles[0];
 
   return (
     <div className="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-6">
       {[
         { label: 'Total responses', value: total, icon: MessageSquareDiff, color: '#0047AB' },
         { label: 'Avg intuitiveness', value: avgScore ? `${avgScore}/10` : '—', icon: Star, color: '#F59E0B' },
-        { label: 'Most common role', value: topRole ? `${topRole[0].split(' ')[0]} (${topRole[1]})` : '—', icon: User, color: '#10B981' },
+        { label: 'Most common role', value: topRole ? `${topRole.role.split(' ')[0]} (${topRole.count})` : '—', icon: User, color: '#10B981' },
         { label: 'Want AI features', value: wantAI > 0 ? `${wantAI} / ${total}` : '—', icon: BarChart2, color: '#8B5CF6' },
       ].map(stat => (
         <div key={stat.label} className="border border-[#1A2744] rounded-xl p-4 bg-[#0A1628]/60">
@@ -207,29 +199,55 @@ const StatsBar = ({ responses }) => {
 const FeedbackResponsesPage = () => {
   const { token, API_URL } = useAuth();
   const [responses, setResponses] = useState([]);
+  const [stats, setStats] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [exporting, setExporting] = useState(false);
   const [search, setSearch] = useState('');
   const [filterRole, setFilterRole] = useState('All');
   const [selectedResponse, setSelectedResponse] = useState(null);
   const [expandedRows, setExpandedRows] = useState(new Set());
 
+  const fetchPage = useCallback((cursor, limit = PAGE_SIZE) => axios.get(`${API_URL}/api/admin/feedback`, {
+    headers: { Authorization: `Bearer ${token}` },
+    params: { limit, ...(cursor ? { cursor } : {}) },
+  }), [token, API_URL]);
+
+  // First page plus the summary stats; further pages load on demand
   const fetchResponses = useCallback(async () => {
     setLoading(true);
     try {
-      const res = await axios.get(`${API_URL}/api/admin/feedback`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setResponses(res.data.responses || []);
+      const [pageRes, statsRes] = await Promise.all([
+        fetchPage(null),
+        axios.get(`${API_URL}/api/admin/feedback/stats`, { headers: { Authorization: `Bearer ${token}` } }),
+      ]);
+      setResponses(pageRes.data.responses || []);
+      setNextCursor(pageRes.data.next_cursor);
+      setStats(statsRes.data);
     } catch {
       toast.error('Failed to load feedback responses');
     } finally {
       setLoading(false);
     }
-  }, [token, API_URL]);
+  }, [fetchPage, token, API_URL]);
+
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const res = await fetchPage(nextCursor);
+      setResponses(prev => [...prev, ...(res.data.responses || [])]);
+      setNextCursor(res.data.next_cursor);
+    } catch {
+      toast.error('Failed to load more responses');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   useEffect(() => { fetchResponses(); }, [fetchResponses]);
 
-  const roles = ['All', ...Array.from(new Set(responses.map(r => r.s1_role).filter(Boolean)))];
+  const roles = ['All', ...(stats?.roles || []).map(r => r.role)];
 
   const filtered = responses.filter(r => {
     const matchRole = filterRole === 'All' || r.s1_role === filterRole;
@@ -247,9 +265,25 @@ const FeedbackResponsesPage = () => {
     });
   };
 
-  const handleExportCSV = () => {
+  // The export is the one place that needs every response, so it pages through them on click
+  const handleExportCSV = async () => {
+    setExporting(true);
+    const all = [];
+    try {
+      let cursor = null;
+      do {
+        const res = await fetchPage(cursor, 200);
+        all.push(...(res.data.responses || []));
+        cursor = res.data.next_cursor;
+      } while (cursor);
+    } catch {
+      toast.error('Failed to export feedback responses');
+      return;
+    } finally {
+      setExporting(false);
+    }
     const headers = ['Name', 'Email', 'Role', 'Submitted', 'Intuitiveness', 'Would Miss', 'Irreplaceable Feature'];
-    const rows = responses.map(r => [
+    const rows = all.map(r => [
       r.user_name || '',
       r.user_email || '',
       r.s1_role || '',
@@ -278,7 +312,7 @@ const FeedbackResponsesPage = () => {
             User Testing Feedback
           </h1>
           <p className="text-[#94A3B8] text-sm mt-1">
-            {responses.length} response{responses.length !== 1 ? 's' : ''} collected
+            {stats?.total ?? 0} response{stats?.total !== 1 ? 's' : ''} collected
           </p>
         </div>
         <div className="flex items-center gap-2">
@@ -286,11 +320,11 @@ const FeedbackResponsesPage = () => {
             variant="outline"
             size="sm"
             onClick={handleExportCSV}
-            disabled={responses.length === 0}
+            disabled={!stats?.total || exporting}
             className="border-[#1A2744] text-[#94A3B8] hover:bg-[#1A2744] hover:text-white text-xs"
           >
             <Download className="w-3.5 h-3.5 mr-1.5" />
-            Export CSV
+            {exporting ? 'Exporting…' : 'Export CSV'}
           </Button>
           <Button
             variant="outline"
@@ -305,7 +339,7 @@ const FeedbackResponsesPage = () => {
       </div>
 
       {/* Stats */}
-      {responses.length > 0 && <StatsBar responses={responses} />}
+      {stats?.total > 0 && <StatsBar stats={stats} />}
 
       {/* Filters */}
       <div className="flex items-center gap-3 flex-wrap">
@@ -449,6 +483,21 @@ const FeedbackResponsesPage = () => {
         </div>
       )}
 
+      {/* Next page */}
+      {!loading && nextCursor && (
+        <div className="flex justify-center">
+          <Button
+            variant="outline"
+            size="sm"
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="border-[#1A2744] text-[#94A3B8] hover:bg-[#1A2744] hover:text-white text-xs"
+          >
+            {loadingMore ? 'Loading…' : `Load more (${responses.length} of ${stats?.total ?? '?'})`}
+          </Button>
+        </div>
+      )}
+
       {/* Detail drawer */}
       {selectedResponse && (
         <>